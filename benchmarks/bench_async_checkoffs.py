@@ -0,0 +1,101 @@
+"""
+Benchmark request throughput and event loop latency of concurrent check-offs from asyncio.
+
+Each habit is checked off by its own coroutine, all of them started at once. Check-offs either call DataAccess directly
+on the event loop or await AsyncDataAccess. Meanwhile a ticker coroutine measures how late the event loop wakes it up.
+Run from the repository root:
+
+    python -m benchmarks.bench_async_checkoffs --checkoffs 1000
+"""
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta
+
+from habit_tracker.data_access.async_data_access import AsyncDataAccess
+from habit_tracker.data_access.data_access import DataAccess
+
+DB_NAME = "habit_tracker_benchmark"
+
+
+def populate(number_habits: int, profile: str, start: datetime) -> list:
+    """
+    Create a fresh benchmark database with daily habits.
+
+    Returns:
+        list:
+            IDs of the habits created.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"db/{DB_NAME}.db{suffix}"):
+            os.remove(f"db/{DB_NAME}.db{suffix}")
+    with DataAccess(DB_NAME, profile=profile) as data_access:
+        return [
+            data_access.create_new_habit("benchmark", "benchmark habit", "daily", start.strftime("%Y-%m-%d"),
+                                         "2099-12-31")
+            for _ in range(number_habits)
+        ]
+
+
+async def tick(stop: asyncio.Event, lags: list, interval: float = 0.001) -> None:
+    """
+    Sleep for an interval until stopped and collect how late each wake-up is.
+    """
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - expected)
+
+
+async def measure(mode: str, habit_ids: list, profile: str, checkoff_datetime: str) -> tuple:
+    """
+    Check off all habits concurrently and measure throughput and event loop lag.
+
+    Returns:
+        tuple:
+            Check-offs per second and maximum event loop lag in seconds.
+    """
+    stop = asyncio.Event()
+    lags = list()
+    ticker = asyncio.create_task(tick(stop, lags))
+    await asyncio.sleep(0)
+    if mode == "blocking":
+        data_access = DataAccess(DB_NAME, profile=profile)
+
+        async def complete_habit(habit_id: int) -> int:
+            return data_access.complete_habit(habit_id, checkoff_datetime)
+
+        begin = time.perf_counter()
+        await asyncio.gather(*(complete_habit(habit_id) for habit_id in habit_ids))
+        elapsed = time.perf_counter() - begin
+        data_access.close()
+    else:
+        async with AsyncDataAccess(DB_NAME, profile=profile) as data_access:
+            begin = time.perf_counter()
+            await asyncio.gather(*(data_access.complete_habit(habit_id, checkoff_datetime) for habit_id in habit_ids))
+            elapsed = time.perf_counter() - begin
+    stop.set()
+    await ticker
+    return len(habit_ids) / elapsed, max(lags, default=0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checkoffs", type=int, default=1000, help="Number of concurrent check-offs.")
+    parser.add_argument("--profile", default="wal", help="Connection profile of the benchmark database.")
+    arguments = parser.parse_args()
+
+    start = datetime(2022, 1, 1)
+    checkoff_datetime = (start + timedelta(days=1, hours=12)).strftime("%Y-%m-%d %H:%M:%S")
+    for mode in ("blocking", "async"):
+        habit_ids = populate(arguments.checkoffs, arguments.profile, start)
+        throughput, max_lag = asyncio.run(measure(mode, habit_ids, arguments.profile, checkoff_datetime))
+        print(f"{mode:>8}: {throughput:8.1f} check-offs/s, max event loop lag {max_lag * 1000:8.2f} ms")
+    with DataAccess(DB_NAME, profile=arguments.profile) as data_access:
+        data_access.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Benchmark importing histories row by row versus the bulk import of a record file.
+
+A record file with daily habits and a check-off per day is generated in memory. It is either imported by inserting
+every history entry on its own, as the database initialization does, or by a single bulk import. Row by row imports
+are slow, hence only a sample of the histories is imported that way. Run from the repository root:
+
+    python -m benchmarks.bench_bulk_import --habits 100 --days 10000 --format csv
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Union
+
+from habit_tracker.data_access.data_access import DataAccess
+from habit_tracker.data_access.model.history_model import HistoryModel
+from habit_tracker.data_access.period import Period
+from habit_tracker.data_access.records import Records
+
+DB_NAME = "habit_tracker_benchmark"
+
+
+def generate(number_habits: int, number_days: int, file_format: str, start: datetime) -> Union[str, bytes]:
+    """
+    Generate a record file with daily habits checked off every day but every seventh.
+
+    Returns:
+        Union[str, bytes]:
+            Content of the record file, bytes for binary formats.
+    """
+    if file_format in Records.BINARY_FORMATS:
+        return generate_binary(number_habits, number_days, file_format, start)
+    stream = io.StringIO()
+    if file_format == "csv":
+        writer = csv.DictWriter(stream, Records.FIELDS)
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(record: dict) -> None:
+            stream.write(json.dumps(record) + "\n")
+    end = start + timedelta(days=number_days)
+    for habit_id in range(1, number_habits + 1):
+        write({
+            "record_type": Records.HABIT,
+            "habit_id": habit_id,
+            "habit_name": "benchmark",
+            "habit_specification": "benchmark habit",
+            "habit_creation": start.strftime("%Y-%m-%d %H:%M:%S"),
+            "habit_periodicity_granularity": "daily",
+            "habit_periodicity_from": start.strftime("%Y-%m-%d"),
+            "habit_periodicity_to": end.strftime("%Y-%m-%d")
+        })
+    for habit_id in range(1, number_habits + 1):
+        for day in range(number_days):
+            write({
+                "record_type": Records.HISTORY,
+                "habit_id": habit_id,
+                "checkoff_datetime": (start + timedelta(days=day, hours=12)).strftime("%Y-%m-%d %H:%M:%S"),
+                "checked_off": int(day % 7 != 6)
+            })
+    return stream.getvalue()
+
+
+def generate_binary(number_habits: int, number_days: int, file_format: str, start: datetime) -> bytes:
+    """
+    Generate a binary record file with the same records as generate, written block by block per habit.
+
+    Returns:
+        bytes:
+            Content of the record file.
+    """
+    stream = io.BytesIO()
+    Records.write_header(stream, file_format)
+    end = start + timedelta(days=number_days)
+    Records.write(stream, file_format, Records.HABIT, [
+        (habit_id, "benchmark", "benchmark habit", start.strftime("%Y-%m-%d %H:%M:%S"), "daily",
+         start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+        for habit_id in range(1, number_habits + 1)
+    ])
+    checkoff_epochs = [Period.epoch_from_datetime(start + timedelta(days=day, hours=12)) for day in range(number_days)]
+    for habit_id in range(1, number_habits + 1):
+        first_history_id = (habit_id - 1) * number_days + 1
+        Records.write(stream, file_format, Records.HISTORY, [
+            (first_history_id + day, habit_id, Period.string_from_epoch(checkoff_epoch), int(day % 7 != 6),
+             checkoff_epoch)
+            for day, checkoff_epoch in enumerate(checkoff_epochs)
+        ])
+    return stream.getvalue()
+
+
+def open_content(content: Union[str, bytes]) -> Union[io.StringIO, io.BytesIO]:
+    """
+    Open the content of a record file as a stream, a binary stream for binary formats.
+
+    Returns:
+        Union[io.StringIO, io.BytesIO]:
+            Stream of the record file.
+    """
+    return io.BytesIO(content) if isinstance(content, bytes) else io.StringIO(content)
+
+
+def fresh_data_access(profile: str) -> DataAccess:
+    """
+    Create a data access object of a fresh benchmark database.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"db/{DB_NAME}.db{suffix}"):
+            os.remove(f"db/{DB_NAME}.db{suffix}")
+    return DataAccess(DB_NAME, profile=profile)
+
+
+def measure_row_by_row(content: Union[str, bytes], file_format: str, profile: str, sample: int) -> float:
+    """
+    Import habits and a sample of the histories row by row.
+
+    Returns:
+        float:
+            Histories imported per second.
+    """
+    with fresh_data_access(profile) as data_access:
+        records = Records.read(open_content(content), file_format)
+        habits = [record for record in records if record["record_type"] == Records.HABIT]
+        data_access.bulk_import(io.StringIO(
+            "\n".join(json.dumps(habit) for habit in habits)
+        ), "jsonl")
+        histories = (record for record in Records.read(open_content(content), file_format)
+                     if record["record_type"] == Records.HISTORY)
+        number_histories = 0
+        begin = time.perf_counter()
+        for record in histories:
+            if number_histories == sample:
+                break
+            history_model = HistoryModel()
+            history_model.habit_id = record["habit_id"]
+            history_model.checkoff_datetime = record["checkoff_datetime"]
+            history_model.checked_off = record["checked_off"]
+            data_access.insert_history_data_by_model(history_model)
+            number_histories += 1
+        return number_histories / (time.perf_counter() - begin)
+
+
+def measure_bulk(content: Union[str, bytes], file_format: str, profile: str, batch_size: int) -> tuple:
+    """
+    Import all habits and histories by a single bulk import.
+
+    Returns:
+        tuple:
+            Rows imported per second and seconds elapsed.
+    """
+    with fresh_data_access(profile) as data_access:
+        begin = time.perf_counter()
+        number_habits, number_histories = data_access.bulk_import(open_content(content), file_format, batch_size)
+        elapsed = time.perf_counter() - begin
+        return (number_habits + number_histories) / elapsed, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=100, help="Number of habits.")
+    parser.add_argument("--days", type=int, default=10000, help="Number of days in the history of each habit.")
+    parser.add_argument("--format", default="csv", choices=Records.FORMATS, help="Format of the record file.")
+    parser.add_argument("--profile", default="default", help="Connection profile of the benchmark database.")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Number of rows inserted at once.")
+    parser.add_argument("--sample", type=int, default=2000, help="Number of histories imported row by row.")
+    arguments = parser.parse_args()
+
+    content = generate(arguments.habits, arguments.days, arguments.format, datetime(1990, 1, 1))
+    row_by_row = measure_row_by_row(content, arguments.format, arguments.profile, arguments.sample)
+    bulk, elapsed = measure_bulk(content, arguments.format, arguments.profile, arguments.batch_size)
+    number_rows = arguments.habits * (arguments.days + 1)
+    print(f"row by row: {row_by_row:10.0f} rows/s, {number_rows / row_by_row:8.1f} s estimated for {number_rows} rows")
+    print(f"      bulk: {bulk:10.0f} rows/s, {elapsed:8.1f} s for {number_rows} rows")
+    with DataAccess(DB_NAME, profile=arguments.profile) as data_access:
+        data_access.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
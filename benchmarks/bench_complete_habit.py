@@ -0,0 +1,69 @@
+"""
+Benchmark checking off a habit after a gap of missed periods.
+
+Measures wall time, number of statements and number of commits of DataAccess.complete_habit for daily habits that have
+not been checked off for a given number of days. Run from the repository root:
+
+    python -m benchmarks.bench_complete_habit --gaps 1 100 10000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from habit_tracker.data_access.data_access import DataAccess
+
+
+def measure(data_access: DataAccess, gap: int, repetitions: int) -> tuple:
+    """
+    Measure checking off freshly created daily habits after a gap of missed days.
+
+    Args:
+        data_access (DataAccess):
+            Data access object of the benchmark database.
+        gap (int):
+            Number of days since the start date of the habit.
+        repetitions (int):
+            Number of habits to be checked off.
+
+    Returns:
+        tuple:
+            Mean wall time in seconds, statements and commits per check-off.
+    """
+    checkoff_datetime = datetime(2022, 10, 1, 12, 0, 0)
+    habit_from = (checkoff_datetime - timedelta(days=gap)).strftime("%Y-%m-%d")
+    habit_ids = [
+        data_access.create_new_habit("benchmark", "benchmark habit", "daily", habit_from, "2099-12-31")
+        for _ in range(repetitions)
+    ]
+    statements = list()
+    connection = data_access.cursor.connection
+    connection.set_trace_callback(statements.append)
+    start = time.perf_counter()
+    for habit_id in habit_ids:
+        data_access.complete_habit(habit_id, checkoff_datetime.strftime("%Y-%m-%d %H:%M:%S"))
+    elapsed = time.perf_counter() - start
+    connection.set_trace_callback(None)
+    commits = len([statement for statement in statements if statement.startswith("COMMIT")])
+    return elapsed / repetitions, len(statements) / repetitions, commits / repetitions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gaps", type=int, nargs="+", default=[1, 100, 10000], help="Gap lengths in days.")
+    parser.add_argument("--repetitions", type=int, default=10, help="Check-offs per gap length.")
+    arguments = parser.parse_args()
+
+    data_access = DataAccess("habit_tracker_benchmark")
+    data_access.drop_tables()
+    data_access.create_tables()
+    try:
+        for gap in arguments.gaps:
+            mean_elapsed, statements, commits = measure(data_access, gap, arguments.repetitions)
+            print(f"gap {gap:>6} days: {mean_elapsed * 1000:9.3f} ms, "
+                  f"{statements:>8.0f} statements, {commits:.0f} commit(s) per check-off")
+    finally:
+        data_access.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark check-off throughput and concurrent read latency per connection profile.
+
+For each connection profile a writer checks off habits, one commit per check-off, while a reader with its own
+connection repeatedly loads all habits. Run from the repository root:
+
+    python -m benchmarks.bench_connection_profiles --habits 200 --histories 50
+"""
+import argparse
+import os
+import sqlite3
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta
+
+from habit_tracker.data_access import queries
+from habit_tracker.data_access.connection_profile import PROFILES
+from habit_tracker.data_access.data_access import DataAccess
+
+DB_NAME = "habit_tracker_benchmark"
+
+
+def populate(data_access: DataAccess, number_habits: int, number_histories: int, start: datetime) -> None:
+    """
+    Fill the benchmark database with daily habits and their histories.
+
+    Args:
+        data_access (DataAccess):
+            Data access object of the benchmark database.
+        number_habits (int):
+            Number of habits to be created.
+        number_histories (int):
+            Number of histories to be created per habit.
+        start (datetime):
+            Start date of the habits.
+    """
+    for _ in range(number_habits):
+        data_access.create_new_habit("benchmark", "benchmark habit", "daily", start.strftime("%Y-%m-%d"), "2099-12-31")
+    data_access.cursor.executemany(
+        queries.INSERT_HISTORY,
+        (
+            (habit_id, (start + timedelta(days=index)).strftime("%Y-%m-%d %H:%M:%S"), 1)
+            for habit_id in range(1, number_habits + 1)
+            for index in range(number_histories)
+        )
+    )
+    data_access.cursor.connection.commit()
+
+
+def read_continuously(profile: str, stop: threading.Event, latencies: list, errors: list) -> None:
+    """
+    Load all habits until stopped and collect the latency of each load.
+    """
+    data_access = DataAccess(DB_NAME, profile=profile)
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            data_access.get_all_habits()
+        except sqlite3.OperationalError as error:
+            errors.append(error)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def measure(profile: str, number_habits: int, number_histories: int) -> tuple:
+    """
+    Measure check-off throughput and read latency of a connection profile.
+
+    Returns:
+        tuple:
+            Check-offs per second, median and maximum read latency in seconds and number of failed reads.
+    """
+    start = datetime(2020, 1, 1)
+    # The journal mode is persistent, hence every profile starts with a fresh database file.
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"db/{DB_NAME}.db{suffix}"):
+            os.remove(f"db/{DB_NAME}.db{suffix}")
+    data_access = DataAccess(DB_NAME, profile=profile)
+    populate(data_access, number_habits, number_histories, start)
+
+    stop = threading.Event()
+    latencies = list()
+    errors = list()
+    reader = threading.Thread(target=read_continuously, args=(profile, stop, latencies, errors))
+    reader.start()
+    checkoff_datetime = (start + timedelta(days=number_histories)).strftime("%Y-%m-%d %H:%M:%S")
+    begin = time.perf_counter()
+    for habit_id in range(1, number_habits + 1):
+        data_access.complete_habit(habit_id, checkoff_datetime)
+    elapsed = time.perf_counter() - begin
+    stop.set()
+    reader.join()
+    data_access.drop_tables()
+    del data_access
+    if not latencies:
+        latencies.append(float("nan"))
+    return number_habits / elapsed, statistics.median(latencies), max(latencies), len(errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=200, help="Number of habits checked off.")
+    parser.add_argument("--histories", type=int, default=50, help="Number of histories per habit.")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), help="Connection profiles to compare.")
+    arguments = parser.parse_args()
+
+    for profile in arguments.profiles:
+        throughput, median_latency, max_latency, errors = measure(profile, arguments.habits, arguments.histories)
+        print(f"{profile:>8}: {throughput:8.1f} check-offs/s, read latency median {median_latency * 1000:7.2f} ms, "
+              f"max {max_latency * 1000:8.2f} ms, {errors} failed reads")
+
+
+if __name__ == "__main__":
+    main()
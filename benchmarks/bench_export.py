@@ -0,0 +1,88 @@
+"""
+Benchmark wall time, file size and peak memory of exporting habits and histories per record format.
+
+The benchmark database is filled by a bulk import of daily habits with a check-off per day. Every format is exported
+to a temporary file while tracemalloc traces the memory allocated, next to rendering all habits as the show command
+does. Run from the repository root:
+
+    python -m benchmarks.bench_export --habits 100 --days 10000
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.bench_bulk_import import fresh_data_access, generate
+from habit_tracker.data_access.data_access import DataAccess
+from habit_tracker.data_access.records import Records
+
+DB_NAME = "habit_tracker_benchmark"
+
+
+def measure(data_access: DataAccess, file_format: str, batch_size: int) -> tuple:
+    """
+    Export all habits and histories to a temporary file.
+
+    Returns:
+        tuple:
+            Rows exported per second, file size in bytes and peak traced memory in bytes.
+    """
+    mode = "wb" if file_format in Records.BINARY_FORMATS else "w"
+    with tempfile.TemporaryFile(mode) as stream:
+        tracemalloc.start()
+        begin = time.perf_counter()
+        number_habits, number_histories = data_access.export(stream, file_format, batch_size=batch_size)
+        elapsed = time.perf_counter() - begin
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        stream.flush()
+        size = os.fstat(stream.fileno()).st_size
+    return (number_habits + number_histories) / elapsed, size, peak
+
+
+def measure_show(data_access: DataAccess) -> tuple:
+    """
+    Render all habits with their histories as the show command does.
+
+    Returns:
+        tuple:
+            Rows rendered per second, output size in bytes and peak traced memory in bytes.
+    """
+    tracemalloc.start()
+    begin = time.perf_counter()
+    habits = data_access.get_all_habits()
+    output = str(habits)
+    elapsed = time.perf_counter() - begin
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    number_rows = sum(len(habit.habit_history.histories) + 1 for habit in habits.habits.values())
+    return number_rows / elapsed, len(output.encode("utf-8")), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=100, help="Number of habits.")
+    parser.add_argument("--days", type=int, default=10000, help="Number of days in the history of each habit.")
+    parser.add_argument("--profile", default="default", help="Connection profile of the benchmark database.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Number of rows fetched and written at once.")
+    arguments = parser.parse_args()
+
+    content = generate(arguments.habits, arguments.days, "csv", datetime(1990, 1, 1))
+    with fresh_data_access(arguments.profile) as data_access:
+        data_access.bulk_import(io.StringIO(content), "csv")
+        del content
+        for file_format in Records.FORMATS:
+            throughput, size, peak = measure(data_access, file_format, arguments.batch_size)
+            print(f"{file_format:>8}: {throughput:10.0f} rows/s, {size / 2 ** 20:8.1f} MiB file, "
+                  f"{peak / 2 ** 20:8.1f} MiB peak memory")
+        throughput, size, peak = measure_show(data_access)
+        print(f"{'show':>8}: {throughput:10.0f} rows/s, {size / 2 ** 20:8.1f} MiB text, "
+              f"{peak / 2 ** 20:8.1f} MiB peak memory")
+        data_access.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
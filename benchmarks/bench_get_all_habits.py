@@ -0,0 +1,119 @@
+"""
+Benchmark loading all habits with their histories.
+
+Compares the number of queries and the wall time of the former loader, which fetched the histories with one query per
+habit, with the bulk loader of DataAccess.get_all_habits. Run from the repository root:
+
+    python -m benchmarks.bench_get_all_habits --habits 10000 --histories 1000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from habit_tracker.data_access.data_access import DataAccess
+from habit_tracker.data_access.model.habits import Habits
+
+
+def populate(data_access: DataAccess, number_habits: int, number_histories: int) -> None:
+    """
+    Fill the benchmark database with habits and histories.
+
+    Args:
+        data_access (DataAccess):
+            Data access object of the benchmark database.
+        number_habits (int):
+            Number of habits to be created.
+        number_histories (int):
+            Number of histories to be created per habit.
+    """
+    connection = data_access.cursor.connection
+    start = datetime(2020, 1, 1)
+    creation = start.strftime("%Y-%m-%d %H:%M:%S")
+    habit_rows = [
+        (f"habit {index}", "benchmark habit", creation, "daily", start.strftime("%Y-%m-%d"), "2099-12-31")
+        for index in range(number_habits)
+    ]
+    data_access.cursor.executemany(
+        "INSERT INTO habits ([habit_name], [habit_specification], [habit_creation], [habit_periodicity_granularity], "
+        "[habit_periodicity_from], [habit_periodicity_to]) VALUES (?, ?, ?, ?, ?, ?);",
+        habit_rows
+    )
+    checkoff_datetimes = [
+        (start + timedelta(days=index)).strftime("%Y-%m-%d %H:%M:%S") for index in range(number_histories)
+    ]
+    for habit_id in range(1, number_habits + 1):
+        data_access.cursor.executemany(
+            "INSERT INTO histories ([habit_id], [checkoff_datetime], [checked_off]) VALUES (?, ?, ?);",
+            ((habit_id, checkoff_datetime, index % 5 != 0) for index, checkoff_datetime in enumerate(checkoff_datetimes))
+        )
+    connection.commit()
+
+
+def get_all_habits_per_habit_query(data_access: DataAccess) -> Habits:
+    """
+    Load all habits the way it was done before the bulk loader, issuing one history query per habit.
+
+    Args:
+        data_access (DataAccess):
+            Data access object of the benchmark database.
+
+    Returns:
+        Habits:
+            A dictionary of habit models with data from the database.
+    """
+    habits = Habits()
+    habit_ids = [row[0] for row in data_access.cursor.execute("SELECT [habit_id] FROM habits;").fetchall()]
+    for habit_id in habit_ids:
+        habit_model = data_access.get_habit_by_id(habit_id)
+        habits.habits[f"{habit_id}"] = habit_model
+    return habits
+
+
+def measure(data_access: DataAccess, loader) -> tuple:
+    """
+    Measure number of queries and wall time of a loader.
+
+    Args:
+        data_access (DataAccess):
+            Data access object of the benchmark database.
+        loader:
+            Callable loading all habits given the data access object.
+
+    Returns:
+        tuple:
+            Number of queries issued and wall time in seconds.
+    """
+    statements = list()
+    connection = data_access.cursor.connection
+    connection.set_trace_callback(statements.append)
+    start = time.perf_counter()
+    loader(data_access)
+    elapsed = time.perf_counter() - start
+    connection.set_trace_callback(None)
+    return len(statements), elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=10000, help="Number of habits.")
+    parser.add_argument("--histories", type=int, default=1000, help="Number of histories per habit.")
+    arguments = parser.parse_args()
+
+    data_access = DataAccess("habit_tracker_benchmark")
+    data_access.drop_tables()
+    data_access.create_tables()
+    try:
+        populate(data_access, arguments.habits, arguments.histories)
+        print(f"{arguments.habits} habits x {arguments.histories} histories")
+        for name, loader in (
+                ("per habit queries", get_all_habits_per_habit_query),
+                ("bulk loader", DataAccess.get_all_habits)
+        ):
+            number_queries, elapsed = measure(data_access, loader)
+            print(f"{name:>20}: {number_queries:>8} queries, {elapsed:8.3f} s")
+    finally:
+        data_access.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark check-off throughput of per-call commits versus group commits of the check-off writer.
+
+A thread pool checks off a burst of habits, each habit once. Check-offs either call a thread-safe DataAccess, one
+transaction per check-off, or are submitted to a CheckoffWriter committing them in groups. Run from the repository
+root:
+
+    python -m benchmarks.bench_group_commit --checkoffs 2000 --threads 16
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from habit_tracker.data_access.checkoff_writer import CheckoffWriter
+from habit_tracker.data_access.connection_pool import ConnectionPool
+from habit_tracker.data_access.data_access import DataAccess
+
+DB_NAME = "habit_tracker_benchmark"
+
+
+def populate(number_habits: int, profile: str, start: datetime) -> list:
+    """
+    Create a fresh benchmark database with daily habits.
+
+    Returns:
+        list:
+            IDs of the habits created.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"db/{DB_NAME}.db{suffix}"):
+            os.remove(f"db/{DB_NAME}.db{suffix}")
+    with DataAccess(DB_NAME, profile=profile) as data_access:
+        return [
+            data_access.create_new_habit("benchmark", "benchmark habit", "daily", start.strftime("%Y-%m-%d"),
+                                         "2099-12-31")
+            for _ in range(number_habits)
+        ]
+
+
+def measure(mode: str, habit_ids: list, profile: str, threads: int, checkoff_datetime: str, batch_size: int,
+            delay_ms: float) -> tuple:
+    """
+    Check off all habits from a thread pool and measure the throughput.
+
+    Returns:
+        tuple:
+            Check-offs per second and number of commits.
+    """
+    if mode == "per-call":
+        data_access = DataAccess(DB_NAME, profile=profile, thread_safe=True)
+        begin = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda habit_id: data_access.complete_habit(habit_id, checkoff_datetime), habit_ids))
+        elapsed = time.perf_counter() - begin
+        data_access.close()
+        ConnectionPool.close_all()
+        return len(habit_ids) / elapsed, len(habit_ids)
+    with CheckoffWriter(DB_NAME, profile=profile, max_batch_size=batch_size, max_delay_ms=delay_ms) as writer:
+        begin = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda habit_id: writer.complete_habit(habit_id, checkoff_datetime), habit_ids))
+        elapsed = time.perf_counter() - begin
+        return len(habit_ids) / elapsed, writer.number_batches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checkoffs", type=int, default=2000, help="Number of check-offs in the burst.")
+    parser.add_argument("--threads", type=int, default=16, help="Number of threads checking off.")
+    parser.add_argument("--profile", default="default", help="Connection profile of the benchmark database.")
+    parser.add_argument("--batch-size", type=int, default=256, help="Maximum number of check-offs per group commit.")
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="Maximum delay of a check-off in milliseconds.")
+    arguments = parser.parse_args()
+
+    start = datetime(2022, 1, 1)
+    checkoff_datetime = (start + timedelta(days=1, hours=12)).strftime("%Y-%m-%d %H:%M:%S")
+    for mode in ("per-call", "group"):
+        habit_ids = populate(arguments.checkoffs, arguments.profile, start)
+        throughput, commits = measure(mode, habit_ids, arguments.profile, arguments.threads, checkoff_datetime,
+                                      arguments.batch_size, arguments.delay_ms)
+        print(f"{mode:>8}: {throughput:8.1f} check-offs/s with {commits} commits")
+    with DataAccess(DB_NAME, profile=arguments.profile) as data_access:
+        data_access.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
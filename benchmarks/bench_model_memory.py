@@ -0,0 +1,79 @@
+"""
+Benchmark the memory held by history models loaded from rows of the histories table.
+
+Compares history models with an instance dictionary, as they were before, to the slotted history models created with
+HistoryModel.from_row and to columnar histories. Memory is traced with tracemalloc. Run from the repository root:
+
+    python -m benchmarks.bench_model_memory --histories 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from habit_tracker.data_access.model.columnar_histories import ColumnarHistories
+from habit_tracker.data_access.model.histories import Histories
+from habit_tracker.data_access.model.history_model import HistoryModel
+
+
+class DictHistoryModel:
+    """
+    History model keeping its attributes in an instance dictionary, the layout before slots.
+    """
+
+    def __init__(self):
+        self.__history_id = None
+        self.__habit_id = None
+        self.__checkoff_datetime = None
+        self.__checked_off = None
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "DictHistoryModel":
+        history_model = cls()
+        history_model.__history_id = row[0]
+        history_model.__habit_id = row[1]
+        history_model.__checkoff_datetime = row[2]
+        history_model.__checked_off = row[3]
+        return history_model
+
+
+def measure(model_class, rows: list) -> tuple:
+    """
+    Measure the memory allocated and the wall time of loading histories from rows.
+
+    Returns:
+        tuple:
+            Allocated bytes and wall time in seconds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    if model_class is ColumnarHistories:
+        histories = ColumnarHistories.from_rows(1, "daily", rows)
+    else:
+        histories = Histories()
+        histories.histories = {f"{row[0]}": model_class.from_row(row) for row in rows}
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del histories
+    return allocated, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--histories", type=int, default=1_000_000, help="Number of histories loaded.")
+    arguments = parser.parse_args()
+
+    rows = [
+        (history_id, 1, "2022-01-01 12:00:00", 1, 1640995200 + history_id, 18993 + history_id // 86400)
+        for history_id in range(1, arguments.histories + 1)
+    ]
+    for name, model_class in (("dict", DictHistoryModel), ("slots", HistoryModel), ("columnar", ColumnarHistories)):
+        allocated, elapsed = measure(model_class, rows)
+        print(f"{name:>8}: {allocated / 2 ** 20:8.1f} MiB, {allocated / len(rows):6.1f} bytes per history, "
+              f"{elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark rendering the output of the show command for many habits with long histories.
+
+Habits with histories are created in memory and rendered to the null device either by repeated string concatenation as
+the models did before, as a single string or streamed line by line, the latter also with truncated and summarized
+histories. Run from the repository root:
+
+    python -m benchmarks.bench_show --habits 1000 --histories 2000
+"""
+import argparse
+import contextlib
+import os
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from habit_tracker.cli.cli import echo_lines
+from habit_tracker.data_access.model.habit_model import HabitModel
+from habit_tracker.data_access.model.habits import Habits
+from habit_tracker.data_access.model.history_model import HistoryModel
+
+
+def create_habits(number_habits: int, number_histories: int) -> Habits:
+    """
+    Create daily habits with a history entry per day.
+
+    Returns:
+        Habits:
+            Habits created.
+    """
+    start = datetime(2022, 1, 1)
+    checkoff_datetimes = [
+        (start + timedelta(days=day, hours=12)).strftime("%Y-%m-%d %H:%M:%S") for day in range(number_histories)
+    ]
+    habits = Habits()
+    history_id = 0
+    for habit_id in range(1, number_habits + 1):
+        habit_model = HabitModel.from_row((habit_id, "benchmark", "benchmark habit", "2022-01-01 00:00:00", "daily",
+                                           "2022-01-01", "2099-12-31"))
+        histories = habit_model.habit_history.histories
+        for day, checkoff_datetime in enumerate(checkoff_datetimes):
+            history_id += 1
+            histories[f"{history_id}"] = HistoryModel.from_row((history_id, habit_id, checkoff_datetime,
+                                                                int(day % 7 != 6)))
+        habits.habits[f"{habit_id}"] = habit_model
+    return habits
+
+
+def render_concatenated(habits: Habits) -> str:
+    """
+    Render habits by repeated string concatenation as the string representations of the models did before.
+    """
+    output = ""
+    for habit in habits.habits.values():
+        histories = ""
+        for history in habit.habit_history.histories.values():
+            histories += str(history) + "\n"
+        lines = habit.lines(history_summary=True)
+        header = next(lines).rsplit(" ", 4)[0]
+        output += header + "\n" + histories + "\n"
+    return output
+
+
+def measure(render) -> tuple:
+    """
+    Render to the null device and measure wall time and, in a second run, peak traced memory.
+
+    Returns:
+        tuple:
+            Seconds elapsed and peak traced memory in bytes.
+    """
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        begin = time.perf_counter()
+        render()
+        elapsed = time.perf_counter() - begin
+        tracemalloc.start()
+        render()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=1000, help="Number of habits.")
+    parser.add_argument("--histories", type=int, default=2000, help="Number of history entries per habit.")
+    parser.add_argument("--last", type=int, default=10, help="Number of latest history entries of truncated output.")
+    arguments = parser.parse_args()
+
+    habits = create_habits(arguments.habits, arguments.histories)
+    renderers = {
+        "concatenated": lambda: print(render_concatenated(habits)),
+        "joined": lambda: print(str(habits)),
+        "streamed": lambda: echo_lines(habits.lines()),
+        f"last {arguments.last}": lambda: echo_lines(habits.lines(arguments.last)),
+        "summary": lambda: echo_lines(habits.lines(history_summary=True))
+    }
+    for name, render in renderers.items():
+        elapsed, peak = measure(render)
+        print(f"{name:>12}: {elapsed:8.3f} s, {peak / 2 ** 20:8.1f} MiB peak memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark the startup of the CLI by import times and wall time of repeated invocations with and without the daemon.
+
+Import times are taken from python -X importtime: the cumulative import time of the entry point, of the CLI and of the
+modules a command needs in addition. Wall times are measured for invocations of the longest-run-streak command run as
+separate processes, as scripts do, either each opening the database itself or answered by a running daemon. The
+benchmark runs in a temporary directory with a database of its own. Run from the repository root:
+
+    python -m benchmarks.bench_startup --runs 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+MODULES = ("habit_tracker.cli.main", "habit_tracker.cli.cli", "habit_tracker.habit_tracker.habit_tracker")
+
+
+def import_time(module: str, environment: dict) -> float:
+    """
+    Import a module in a fresh interpreter and parse its cumulative import time.
+
+    Returns:
+        float:
+            Cumulative import time of the module in milliseconds.
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], env=environment,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise ValueError(f"Import time of {module} not found.")
+
+
+def wall_times(command: list, runs: int, directory: str, environment: dict) -> list:
+    """
+    Run a command repeatedly as separate processes.
+
+    Returns:
+        list:
+            Wall time of each run in milliseconds.
+    """
+    times = list()
+    for _ in range(runs):
+        begin = time.perf_counter()
+        subprocess.run(command, cwd=directory, env=environment, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - begin) * 1000)
+    return times
+
+
+def report(name: str, times: list) -> None:
+    print(f"{name:>16}: {statistics.median(times):8.1f} ms median, {min(times):8.1f} ms min")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="Number of invocations measured per mode.")
+    parser.add_argument("--profile", default="default", help="Connection profile of the benchmark database.")
+    arguments = parser.parse_args()
+
+    environment = {name: value for name, value in os.environ.items() if not name.startswith("HABIT_TRACKER_")}
+    environment["PYTHONPATH"] = os.pathsep.join([os.getcwd()] + sys.path[1:])
+    environment["HABIT_TRACKER_DB_PROFILE"] = arguments.profile
+    for module in MODULES:
+        print(f"{module:>41}: {import_time(module, environment):8.1f} ms cumulative import time")
+
+    cli = [sys.executable, "-m", "habit_tracker.cli.main"]
+    command = cli + ["longest-run-streak"]
+    with tempfile.TemporaryDirectory() as directory:
+        os.mkdir(os.path.join(directory, "db"))
+        socket_path = os.path.join(directory, "db", "habit_tracker.sock")
+        environment["HABIT_TRACKER_SOCKET"] = socket_path
+        wall_times(cli + ["init-db"], 1, directory, environment)
+        report("interpreter only", wall_times([sys.executable, "-c", "pass"], arguments.runs, directory, environment))
+        report("without daemon", wall_times(command, arguments.runs, directory, environment))
+        daemon = subprocess.Popen(cli + ["daemon"], cwd=directory, env=environment, stderr=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(socket_path):
+                if daemon.poll() is not None:
+                    raise RuntimeError("Daemon has not started.")
+                time.sleep(0.01)
+            # The first command warms the daemon up, it imports the habit tracker and connects to the database.
+            wall_times(command, 1, directory, environment)
+            report("with daemon", wall_times(command, arguments.runs, directory, environment))
+        finally:
+            subprocess.run(cli + ["daemon", "--stop"], cwd=directory, env=environment, stdout=subprocess.DEVNULL)
+            daemon.wait()
+
+
+if __name__ == "__main__":
+    main()
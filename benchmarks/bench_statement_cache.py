@@ -0,0 +1,98 @@
+"""
+Benchmark the per-call latency of hot statements.
+
+Compares looking up the latest check-off of a habit with the SQL text built per call, as it was done before the query
+layer, with the bound parameter statement of the query layer for different sizes of the prepared statement cache. Run
+from the repository root:
+
+    python -m benchmarks.bench_statement_cache --calls 100000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from habit_tracker.data_access import queries
+from habit_tracker.data_access.data_access import DataAccess
+
+
+def populate(data_access: DataAccess, number_habits: int, number_histories: int) -> None:
+    """
+    Fill the benchmark database with daily habits and their histories.
+
+    Args:
+        data_access (DataAccess):
+            Data access object of the benchmark database.
+        number_habits (int):
+            Number of habits to be created.
+        number_histories (int):
+            Number of histories to be created per habit.
+    """
+    start = datetime(2020, 1, 1)
+    for _ in range(number_habits):
+        data_access.create_new_habit("benchmark", "benchmark habit", "daily", start.strftime("%Y-%m-%d"), "2099-12-31")
+    data_access.cursor.executemany(
+        queries.INSERT_HISTORY,
+        (
+            (habit_id, (start + timedelta(days=index)).strftime("%Y-%m-%d %H:%M:%S"), 1)
+            for habit_id in range(1, number_habits + 1)
+            for index in range(number_histories)
+        )
+    )
+    data_access.cursor.connection.commit()
+
+
+def latest_checkoff_with_sql_text(data_access: DataAccess, habit_id: int) -> None:
+    """
+    Look up the latest check-off with SQL text containing the habit ID.
+    """
+    data_access.cursor.execute(f"""
+        SELECT [checkoff_datetime] FROM histories
+        WHERE [habit_id] = {habit_id} AND [checked_off] = 1
+        ORDER BY [checkoff_datetime] DESC LIMIT 1;
+    """).fetchone()
+
+
+def latest_checkoff_with_bound_parameter(data_access: DataAccess, habit_id: int) -> None:
+    """
+    Look up the latest check-off with the bound parameter statement of the query layer.
+    """
+    data_access.cursor.execute(queries.SELECT_LATEST_CHECKOFF_OF_HABIT, (habit_id,)).fetchone()
+
+
+def measure(data_access: DataAccess, lookup, number_habits: int, calls: int) -> float:
+    """
+    Measure the mean latency of a lookup in microseconds.
+    """
+    start = time.perf_counter()
+    for call in range(calls):
+        lookup(data_access, call % number_habits + 1)
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=100, help="Number of habits.")
+    parser.add_argument("--histories", type=int, default=10, help="Number of histories per habit.")
+    parser.add_argument("--calls", type=int, default=100000, help="Number of lookups per variant.")
+    arguments = parser.parse_args()
+
+    data_access = DataAccess("habit_tracker_benchmark")
+    data_access.drop_tables()
+    data_access.create_tables()
+    populate(data_access, arguments.habits, arguments.histories)
+    del data_access
+    try:
+        for name, cached_statements, lookup in (
+                ("SQL text per call", 128, latest_checkoff_with_sql_text),
+                ("bound parameter, no cache", 0, latest_checkoff_with_bound_parameter),
+                ("bound parameter, cache 128", 128, latest_checkoff_with_bound_parameter)
+        ):
+            data_access = DataAccess("habit_tracker_benchmark", cached_statements=cached_statements)
+            latency = measure(data_access, lookup, arguments.habits, arguments.calls)
+            print(f"{name:>27}: {latency:8.2f} us per call")
+    finally:
+        data_access.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
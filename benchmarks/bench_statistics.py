@@ -0,0 +1,86 @@
+"""
+Benchmark the statistics of habits determined in a single pass versus a separate scan per metric.
+
+The benchmark database is filled by a bulk import of daily habits with a check-off per day. The habits are read once
+with columnar histories, then the statistics of all habits are determined either by the single-pass kernel of Analytics
+or by scanning the columnar arrays of each history once for the longest streak, the current streak, the completions and
+the months. Run from the repository root:
+
+    python -m benchmarks.bench_statistics --habits 100 --days 10000
+"""
+import argparse
+import io
+import statistics
+import time
+from datetime import datetime
+
+from benchmarks.bench_bulk_import import fresh_data_access, generate
+from habit_tracker.analytics.analytics import Analytics
+from habit_tracker.data_access.model.habits import Habits
+from habit_tracker.data_access.period import Period
+
+
+def separate_scans(habits: Habits) -> list:
+    """
+    Determine the statistics of all habits by a scan of each history per metric.
+
+    Returns:
+        list:
+            Longest streak, current streak, completions, breaks and best and worst month of each habit.
+    """
+    rows = list()
+    for habit_model in habits.habits.values():
+        histories = habit_model.habit_history
+        history = histories.transform_to_list()
+        months = dict()
+        month, start, end = None, 0, 0
+        for checked_off, checkoff_epoch in zip(histories.checked_off, histories.checkoff_epochs):
+            if not start <= checkoff_epoch < end:
+                month, start, end = Period.month_range(checkoff_epoch)
+            completions, total = months.get(month, (0, 0))
+            months[month] = (completions + checked_off, total + 1)
+        rates = {month: completions / total for month, (completions, total) in months.items()}
+        rows.append((Analytics.length_longest_run_streak(history), Analytics.length_current_run_streak(history),
+                     history.count(1), len(history) - history.count(1),
+                     max(rates, key=rates.get, default=None), min(rates, key=rates.get, default=None)))
+    return rows
+
+
+def measure(calc, runs: int) -> float:
+    """
+    Determine the statistics repeatedly.
+
+    Returns:
+        float:
+            Median milliseconds elapsed.
+    """
+    times = list()
+    for _ in range(runs):
+        begin = time.perf_counter()
+        calc()
+        times.append((time.perf_counter() - begin) * 1000)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=100, help="Number of habits.")
+    parser.add_argument("--days", type=int, default=10000, help="Number of days in the history of each habit.")
+    parser.add_argument("--profile", default="default", help="Connection profile of the benchmark database.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs measured per approach.")
+    arguments = parser.parse_args()
+
+    content = generate(arguments.habits, arguments.days, "csv", datetime(1990, 1, 1))
+    with fresh_data_access(arguments.profile) as data_access:
+        data_access.bulk_import(io.StringIO(content), "csv")
+        del content
+        habits = data_access.get_all_habits(columnar=True)
+        data_access.drop_tables()
+    single_pass = measure(lambda: Analytics.calc_statistics(habits), arguments.runs)
+    print(f"{'single pass':>14}: {single_pass:10.2f} ms")
+    separate = measure(lambda: separate_scans(habits), arguments.runs)
+    print(f"{'separate scans':>14}: {separate:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
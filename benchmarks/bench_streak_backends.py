@@ -0,0 +1,91 @@
+"""
+Benchmark latency and data transferred of the streak backends of the habit tracker.
+
+The benchmark database is filled by a bulk import of daily habits with a check-off per day. The longest run streak over
+all habits and of a single habit is determined by each backend: looked up in the habit summaries, computed by Analytics
+from the histories read into Python or computed by window functions within SQLite. Rows transferred are the rows the
+backend reads from SQLite, peak memory is traced with tracemalloc in a separate run. Run from the repository root:
+
+    python -m benchmarks.bench_streak_backends --habits 100 --days 10000
+"""
+import argparse
+import io
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.bench_bulk_import import fresh_data_access, generate
+from habit_tracker.data_access.data_access import DataAccess
+from habit_tracker.habit_tracker.habit_tracker import HabitTracker
+
+
+def rows_transferred(data_access: DataAccess, streak_backend: str, habit_id: int = None) -> int:
+    """
+    Count the rows a streak backend reads from SQLite.
+
+    Returns:
+        int:
+            Number of rows read.
+    """
+    if streak_backend == "python":
+        if habit_id is not None:
+            return len(data_access.get_habit_by_id(habit_id, columnar=True).habit_history) + 1
+        habits = data_access.get_all_habits(columnar=True)
+        return sum(len(habit_model.habit_history) + 1 for habit_model in habits.habits.values())
+    if streak_backend == "sql":
+        return len(data_access.get_run_streaks(habit_id=habit_id))
+    return 1
+
+
+def measure(calc, runs: int) -> tuple:
+    """
+    Determine a longest run streak repeatedly and once more while tracing memory.
+
+    Returns:
+        tuple:
+            Longest run streak, median milliseconds elapsed and peak traced memory in bytes.
+    """
+    times = list()
+    for _ in range(runs):
+        begin = time.perf_counter()
+        longest_streak = calc()
+        times.append((time.perf_counter() - begin) * 1000)
+    tracemalloc.start()
+    calc()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return longest_streak, statistics.median(times), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=100, help="Number of habits.")
+    parser.add_argument("--days", type=int, default=10000, help="Number of days in the history of each habit.")
+    parser.add_argument("--profile", default="default", help="Connection profile of the benchmark database.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs measured per backend.")
+    arguments = parser.parse_args()
+
+    content = generate(arguments.habits, arguments.days, "csv", datetime(1990, 1, 1))
+    with fresh_data_access(arguments.profile) as data_access:
+        data_access.bulk_import(io.StringIO(content), "csv")
+        del content
+        habit_tracker = HabitTracker()
+        habit_tracker.data_access = data_access
+        for name, habit_id in (("all habits", None), ("one habit", 1)):
+            for streak_backend in HabitTracker.STREAK_BACKENDS:
+                habit_tracker.streak_backend = streak_backend
+                if habit_id is None:
+                    calc = habit_tracker.calc_longest_run_streak
+                else:
+                    def calc():
+                        return habit_tracker.calc_longest_run_streak_of_habit(habit_id)
+                longest_streak, elapsed, peak = measure(calc, arguments.runs)
+                rows = rows_transferred(data_access, streak_backend, habit_id)
+                print(f"{name:>10}, {streak_backend:>7}: {elapsed:10.2f} ms, {rows:9d} rows transferred, "
+                      f"{peak / 2 ** 20:8.1f} MiB peak memory, longest streak {longest_streak}")
+        data_access.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
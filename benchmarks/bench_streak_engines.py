@@ -0,0 +1,53 @@
+"""
+Benchmark the streak engines of Analytics on one long history and on a batch of many short histories.
+
+The history entries are random check-offs, three out of four checked-off. Run from the repository root:
+
+    python -m benchmarks.bench_streak_engines --entries 10000000 --habits 10000
+"""
+import argparse
+import random
+import time
+from array import array
+
+from habit_tracker.analytics import analytics
+from habit_tracker.analytics.analytics import Analytics
+
+
+def measure(function, *args) -> tuple:
+    """
+    Measure the wall time of a function call.
+
+    Returns:
+        tuple:
+            Result of the call and wall time in seconds.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=10_000_000, help="Number of history entries in total.")
+    parser.add_argument("--habits", type=int, default=10_000, help="Number of habits of the batch.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random history.")
+    arguments = parser.parse_args()
+
+    random.seed(arguments.seed)
+    history = array("b", (random.random() < 0.75 for _ in range(arguments.entries)))
+    size = arguments.entries // arguments.habits
+    histories = [history[offset:offset + size] for offset in range(0, size * arguments.habits, size)]
+    engines = [engine for engine in Analytics.ENGINES if engine != "numpy" or analytics.numpy is not None]
+
+    for engine in engines:
+        Analytics.set_engine(engine)
+        longest, longest_time = measure(Analytics.length_longest_run_streak, history)
+        current, current_time = measure(Analytics.length_current_run_streak, history)
+        batch, batch_time = measure(Analytics.length_longest_run_streaks, histories)
+        print(f"{engine:>6}: longest {longest} in {longest_time:7.3f} s, current {current} in {current_time:7.3f} s, "
+              f"batch of {len(histories)} habits (max {max(batch)}) in {batch_time:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark longest run streaks within a window of check-off time and within rolling windows.
+
+The benchmark database is filled by a bulk import of daily habits with a check-off per day. The longest run streak of
+the last days of all habits is determined by the python and the sql streak backend, once with the window pushed down
+into the queries and once by reading all histories and slicing the window in Python. The longest run streaks of rolling
+windows over the history of one habit are determined incrementally in a single pass and by rescanning each window. Run
+from the repository root:
+
+    python -m benchmarks.bench_windows --habits 100 --days 10000 --window 90
+"""
+import argparse
+import io
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.bench_bulk_import import fresh_data_access, generate
+from habit_tracker.analytics.analytics import Analytics
+from habit_tracker.data_access.data_access import DataAccess
+from habit_tracker.habit_tracker.habit_tracker import HabitTracker
+
+
+def sliced_in_python(data_access: DataAccess, since: datetime) -> int:
+    """
+    Determine the longest run streak within a window by reading all histories and slicing them.
+
+    Returns:
+        int:
+            Longest run streak over all habits within the window.
+    """
+    habits = data_access.get_all_habits(columnar=True)
+    return max((Analytics.length_longest_run_streak(habit_model.habit_history.between(since).checked_off)
+                for habit_model in habits.habits.values()), default=0)
+
+
+def rescanned(history: list, window: int) -> list:
+    """
+    Determine the longest run streaks of rolling windows by scanning each window.
+
+    Returns:
+        list:
+            Longest run streak within the window ending at each entry.
+    """
+    return [Analytics.length_longest_run_streak(history[max(index - window + 1, 0):index + 1])
+            for index in range(len(history))]
+
+
+def measure(calc, runs: int) -> tuple:
+    """
+    Run a calculation repeatedly.
+
+    Returns:
+        tuple:
+            Result of the calculation and median milliseconds elapsed.
+    """
+    times = list()
+    for _ in range(runs):
+        begin = time.perf_counter()
+        result = calc()
+        times.append((time.perf_counter() - begin) * 1000)
+    return result, statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--habits", type=int, default=100, help="Number of habits.")
+    parser.add_argument("--days", type=int, default=10000, help="Number of days in the history of each habit.")
+    parser.add_argument("--window", type=int, default=90, help="Number of days of the window.")
+    parser.add_argument("--profile", default="default", help="Connection profile of the benchmark database.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs measured per approach.")
+    arguments = parser.parse_args()
+
+    start = datetime(1990, 1, 1)
+    since = start + timedelta(days=arguments.days - arguments.window)
+    content = generate(arguments.habits, arguments.days, "csv", start)
+    with fresh_data_access(arguments.profile) as data_access:
+        data_access.bulk_import(io.StringIO(content), "csv")
+        del content
+        habit_tracker = HabitTracker()
+        habit_tracker.data_access = data_access
+        for streak_backend in ("python", "sql"):
+            habit_tracker.streak_backend = streak_backend
+            longest_streak, elapsed = measure(lambda: habit_tracker.calc_longest_run_streak(since=since),
+                                              arguments.runs)
+            print(f"last {arguments.window} days, {streak_backend:>6} pushed down: {elapsed:10.2f} ms, "
+                  f"longest streak {longest_streak}")
+        longest_streak, elapsed = measure(lambda: sliced_in_python(data_access, since), arguments.runs)
+        print(f"last {arguments.window} days, sliced in Python: {elapsed:10.2f} ms, longest streak {longest_streak}")
+        history = data_access.get_habit_by_id(1, columnar=True).habit_history.transform_to_list()
+        data_access.drop_tables()
+    incremental, elapsed = measure(lambda: Analytics.rolling_longest_run_streaks(history, arguments.window),
+                                   arguments.runs)
+    print(f"rolling {arguments.window} days, incremental: {elapsed:10.2f} ms")
+    rescan, elapsed = measure(lambda: rescanned(history, arguments.window), arguments.runs)
+    print(f"rolling {arguments.window} days, rescanned:   {elapsed:10.2f} ms, equal {incremental == rescan}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,83 @@
+import os
+from array import array
+from collections import deque
+from itertools import groupby, takewhile
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
-from itertools import groupby
-from typing import List
-
+from habit_tracker.data_access.model.columnar_histories import ColumnarHistories
+from habit_tracker.data_access.model.habit_statistics_model import HabitStatisticsModel
 from habit_tracker.data_access.model.habits import Habits
 from habit_tracker.data_access.model.habit_model import HabitModel
+from habit_tracker.data_access.model.histories import Histories
+from habit_tracker.data_access.model.history_model import HistoryModel
+from habit_tracker.data_access.period import Period
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Analytics:
     """
     Analytics contains the logic to determine the longest streak given a list of zeros and ones.
 
-    The longest streak given a list of zeros and ones is determined with the functional programming paradigm.
+    The longest streak given a list of zeros and ones is determined by one of the streak engines: the functional
+    programming paradigm in pure Python, run-length encoding of a byte buffer or run-length encoding with NumPy.
     """
 
+    ENGINE_ENVIRONMENT_VARIABLE = "HABIT_TRACKER_ANALYTICS_ENGINE"
+
+    ENGINES = ("python", "array", "numpy")
+
+    # Maps a checked-off value of one to one and all other values to zero.
+    __ONLY_ONES = bytes(1 if value == 1 else 0 for value in range(256))
+
+    __engine = None
+
     def __init__(self):
         """
         Empty constructor.
         """
         pass
 
+    @classmethod
+    def get_engine(cls) -> str:
+        """
+        Get the name of the streak engine in use.
+
+        Unless set explicitly, the engine is taken from the environment variable HABIT_TRACKER_ANALYTICS_ENGINE or is
+        numpy if NumPy is installed and array otherwise.
+
+        Returns:
+            str:
+                Name of the streak engine in use.
+        """
+        if cls.__engine is None:
+            cls.set_engine(os.environ.get(cls.ENGINE_ENVIRONMENT_VARIABLE, "numpy" if numpy is not None else "array"))
+        return cls.__engine
+
+    @classmethod
+    def set_engine(cls, engine: str) -> None:
+        """
+        Set the streak engine used to determine run streaks.
+
+        Args:
+            engine (str):
+                Name of the streak engine, eg python, array, numpy.
+        """
+        if engine not in cls.ENGINES:
+            raise ValueError(f"Streak engine '{engine}' does not exist, choose one of: {', '.join(cls.ENGINES)}.")
+        if engine == "numpy" and numpy is None:
+            raise ValueError("Streak engine 'numpy' requires NumPy to be installed.")
+        cls.__engine = engine
+
     @classmethod
     def calc_longest_run_streak(cls, habits: Habits) -> int:
         """
         Determine the longest streak over all habits given.
 
-        Calculate the longest run streak of all habits given.
+        Calculate the longest run streak of all habits given as one batch.
 
         Args:
             habits (Habits):
@@ -34,13 +87,8 @@ class Analytics:
             int:
                 Longest run streak over all given habits.
         """
-        length_longest_run_streak = list()
-        for habit_model in habits.habits.values():
-            length_longest_run_streak.append(Analytics.calc_longest_run_streak_of_habit(habit_model))
-        if len(length_longest_run_streak) > 0:
-            return max(length_longest_run_streak)
-        else:
-            return 0
+        histories = [cls.__checked_off_of(habit_model.habit_history) for habit_model in habits.habits.values()]
+        return max(Analytics.length_longest_run_streaks(histories), default=0)
 
     @classmethod
     def calc_longest_run_streak_of_habit(cls, habit_model: HabitModel) -> int:
@@ -57,21 +105,408 @@ class Analytics:
             int:
                 Longest run streak of a habit.
         """
-        return Analytics.length_longest_run_streak(habit_model.habit_history.transform_to_list())
+        return Analytics.length_longest_run_streak(cls.__checked_off_of(habit_model.habit_history))
 
     @classmethod
-    def length_longest_run_streak(cls, history: List[int]) -> int:
+    def length_longest_run_streak(cls, history: Sequence[int]) -> int:
         """
         Determine the longest streak of a list of zeros and ones.
 
-        Calculate the longest run streak of a list of zeros and ones.
+        Calculate the longest run streak of a list of zeros and ones with the streak engine in use.
 
         Args:
-            history (List[int]):
+            history (Sequence[int]):
                 History of a habit as a list of zeros and ones for which to determine the longest run streak.
 
         Returns:
             int:
                 Longest run streak of a list of zeros and ones.
         """
+        engine = cls.get_engine()
+        if engine == "numpy":
+            lengths = cls.__run_lengths(cls.__as_ones(history))
+            return int(lengths.max()) if len(lengths) > 0 else 0
+        if engine == "array":
+            return max(map(len, cls.__as_bytes(history).split(b"\x00")))
         return max([len(list(group)) for value, group in groupby(history) if value == 1], default=0)
+
+    @classmethod
+    def length_current_run_streak(cls, history: Sequence[int]) -> int:
+        """
+        Determine the streak a list of zeros and ones ends with.
+
+        Calculate the length of the run of ones at the end of a list of zeros and ones with the streak engine in use.
+
+        Args:
+            history (Sequence[int]):
+                History of a habit as a list of zeros and ones for which to determine the current run streak.
+
+        Returns:
+            int:
+                Current run streak of a list of zeros and ones.
+        """
+        engine = cls.get_engine()
+        if engine == "numpy":
+            zeros = numpy.flatnonzero(~cls.__as_ones(history))
+            return len(history) - int(zeros[-1]) - 1 if len(zeros) > 0 else len(history)
+        if engine == "array":
+            data = cls.__as_bytes(history)
+            return len(data) - len(data.rstrip(b"\x01"))
+        return sum(1 for _ in takewhile(lambda value: value == 1, reversed(history)))
+
+    @classmethod
+    def length_longest_run_streaks(cls, histories: List[Sequence[int]]) -> List[int]:
+        """
+        Determine the longest streaks of many lists of zeros and ones.
+
+        With the numpy engine all lists are concatenated into one ragged batch, separated by a zero each, and the runs
+        of all lists are determined at once. Other engines determine the runs list by list.
+
+        Args:
+            histories (List[Sequence[int]]):
+                Histories of habits as lists of zeros and ones for which to determine the longest run streaks.
+
+        Returns:
+            List[int]:
+                Longest run streak of each list of zeros and ones.
+        """
+        if cls.get_engine() != "numpy" or len(histories) == 0:
+            return [cls.length_longest_run_streak(history) for history in histories]
+        sizes = numpy.fromiter((len(history) + 1 for history in histories), dtype=numpy.int64, count=len(histories))
+        offsets = numpy.concatenate(([0], numpy.cumsum(sizes)[:-1]))
+        batch = numpy.zeros(int(sizes.sum()), dtype=bool)
+        for offset, history in zip(offsets, histories):
+            batch[offset:offset + len(history)] = cls.__as_ones(history)
+        starts, lengths = cls.__runs(batch)
+        longest = numpy.zeros(len(histories), dtype=numpy.int64)
+        numpy.maximum.at(longest, numpy.searchsorted(offsets, starts, side="right") - 1, lengths)
+        return longest.tolist()
+
+    @classmethod
+    def stream_longest_run_streak(cls, histories: Iterable[HistoryModel]) -> int:
+        """
+        Determine the longest streak of a stream of history models.
+
+        The history models are consumed one by one, hence the history does not need to be held in memory.
+
+        Args:
+            histories (Iterable[HistoryModel]):
+                History models of a habit in order of check-off time, eg from DataAccess.iter_histories.
+
+        Returns:
+            int:
+                Longest run streak of the history models.
+        """
+        return cls.stream_run_streaks(histories)[0]
+
+    @classmethod
+    def stream_current_run_streak(cls, histories: Iterable[HistoryModel]) -> int:
+        """
+        Determine the streak a stream of history models ends with.
+
+        The history models are consumed one by one, hence the history does not need to be held in memory.
+
+        Args:
+            histories (Iterable[HistoryModel]):
+                History models of a habit in order of check-off time, eg from DataAccess.iter_histories.
+
+        Returns:
+            int:
+                Current run streak of the history models.
+        """
+        return cls.stream_run_streaks(histories)[1]
+
+    @classmethod
+    def stream_run_streaks(cls, histories: Iterable[HistoryModel]) -> Tuple[int, int]:
+        """
+        Determine the longest and the current streak of a stream of history models in a single pass.
+
+        Args:
+            histories (Iterable[HistoryModel]):
+                History models of a habit in order of check-off time, eg from DataAccess.iter_histories.
+
+        Returns:
+            Tuple[int, int]:
+                Longest and current run streak of the history models.
+        """
+        longest_streak = 0
+        current_streak = 0
+        for history_model in histories:
+            if history_model.checked_off == 1:
+                current_streak += 1
+                if current_streak > longest_streak:
+                    longest_streak = current_streak
+            else:
+                current_streak = 0
+        return longest_streak, current_streak
+
+    @classmethod
+    def rolling_longest_run_streaks(cls, history: Iterable[int], window: int) -> List[int]:
+        """
+        Determine the longest streak within a rolling window ending at each entry of a list of zeros and ones.
+
+        The windows are determined incrementally in a single pass instead of scanning each window: runs completed within
+        the window are kept in a deque in order of their start with decreasing lengths, hence the longest of them is at
+        its front, and runs expire from its front as the window moves on. A run crossing the start of the window counts
+        from the start. Windows at the beginning of the list cover fewer entries.
+
+        Args:
+            history (Iterable[int]):
+                History of a habit as zeros and ones in order of check-off time.
+            window (int):
+                Number of entries, that is periods, of each window.
+
+        Returns:
+            List[int]:
+                Longest run streak within the window ending at each entry.
+        """
+        if window < 1:
+            raise ValueError("Window must contain at least one period.")
+        longest_streaks = list()
+        # Runs are (start, end) pairs of entry indexes, the end being exclusive.
+        runs = deque()
+        run_start = None
+        expired_end = 0
+        for index, checked_off in enumerate(history):
+            if checked_off == 1:
+                if run_start is None:
+                    run_start = index
+            elif run_start is not None:
+                while len(runs) > 0 and runs[-1][1] - runs[-1][0] <= index - run_start:
+                    runs.pop()
+                runs.append((run_start, index))
+                run_start = None
+            first = max(index - window + 1, 0)
+            while len(runs) > 0 and runs[0][0] < first:
+                expired_end = runs.popleft()[1]
+            longest_streak = max(runs[0][1] - runs[0][0] if len(runs) > 0 else 0, expired_end - first)
+            if run_start is not None:
+                longest_streak = max(longest_streak, index + 1 - max(run_start, first))
+            longest_streaks.append(longest_streak)
+        return longest_streaks
+
+    @classmethod
+    def calc_statistics(cls, habits: Habits) -> List[HabitStatisticsModel]:
+        """
+        Determine the statistics of all habits given.
+
+        The history of each habit is scanned once for all of its statistics.
+
+        Args:
+            habits (Habits):
+                Dictionary of habit models to be analysed.
+
+        Returns:
+            List[HabitStatisticsModel]:
+                Statistics of the habits in order of the habits given.
+        """
+        return [cls.calc_statistics_of_habit(habit_model) for habit_model in habits.habits.values()]
+
+    @classmethod
+    def calc_statistics_of_habit(cls, habit_model: HabitModel) -> HabitStatisticsModel:
+        """
+        Determine the statistics of a habit given in a single pass over its history.
+
+        Args:
+            habit_model (HabitModel):
+                Habit model to be analysed.
+
+        Returns:
+            HabitStatisticsModel:
+                Statistics of the habit.
+        """
+        habit_statistics_model = cls.stream_statistics(cls.__checkoffs_by_month(habit_model.habit_history))
+        habit_statistics_model.habit_id = habit_model.habit_id
+        return habit_statistics_model
+
+    @classmethod
+    def stream_statistics(cls, checkoffs: Iterable[Tuple[int, str]]) -> HabitStatisticsModel:
+        """
+        Determine streaks, completions, breaks and the best and worst month of a stream of check-offs in a single pass.
+
+        Args:
+            checkoffs (Iterable[Tuple[int, str]]):
+                Checked-off value and month formatted as YYYY-MM of each history entry in order of check-off time.
+
+        Returns:
+            HabitStatisticsModel:
+                Statistics of the check-offs without habit ID.
+        """
+        habit_statistics_model = HabitStatisticsModel()
+        total_histories = 0
+        total_completions = 0
+        current_streak = 0
+        longest_streak = 0
+        # Months are (month, rate) pairs, the month of the entries just scanned is rated when the next month begins.
+        best_month = None
+        worst_month = None
+        month = None
+        month_histories = 0
+        month_completions = 0
+        for checked_off, checkoff_month in checkoffs:
+            if checkoff_month != month:
+                if month is not None:
+                    best_month, worst_month = cls.__rate_month(best_month, worst_month, month,
+                                                               month_completions / month_histories)
+                month = checkoff_month
+                month_histories = 0
+                month_completions = 0
+            total_histories += 1
+            month_histories += 1
+            if checked_off == 1:
+                total_completions += 1
+                month_completions += 1
+                current_streak += 1
+                if current_streak > longest_streak:
+                    longest_streak = current_streak
+            else:
+                current_streak = 0
+        if month is not None:
+            best_month, worst_month = cls.__rate_month(best_month, worst_month, month,
+                                                       month_completions / month_histories)
+            habit_statistics_model.best_period, habit_statistics_model.best_period_rate = best_month
+            habit_statistics_model.worst_period, habit_statistics_model.worst_period_rate = worst_month
+        habit_statistics_model.total_completions = total_completions
+        habit_statistics_model.total_breaks = total_histories - total_completions
+        habit_statistics_model.current_streak = current_streak
+        habit_statistics_model.longest_streak = longest_streak
+        return habit_statistics_model
+
+    @classmethod
+    def __rate_month(cls, best_month: Tuple[str, float], worst_month: Tuple[str, float], month: str, rate: float) \
+            -> Tuple[Tuple[str, float], Tuple[str, float]]:
+        """
+        Compare the completion rate of a month with the best and the worst month so far, earlier months win ties.
+
+        Args:
+            best_month (Tuple[str, float]):
+                Best month so far and its completion rate, None before the first month.
+            worst_month (Tuple[str, float]):
+                Worst month so far and its completion rate, None before the first month.
+            month (str):
+                Month formatted as YYYY-MM.
+            rate (float):
+                Completion rate of the month.
+
+        Returns:
+            Tuple[Tuple[str, float], Tuple[str, float]]:
+                Best and worst month including the month given.
+        """
+        if best_month is None or rate > best_month[1]:
+            best_month = (month, rate)
+        if worst_month is None or rate < worst_month[1]:
+            worst_month = (month, rate)
+        return best_month, worst_month
+
+    @classmethod
+    def __checkoffs_by_month(cls, histories: Histories) -> Iterator[Tuple[int, str]]:
+        """
+        Get the checked-off value and the month of each history entry.
+
+        Months of columnar histories are only determined when a check-off epoch leaves the month of the entry before.
+
+        Args:
+            histories (Histories):
+                Histories of a habit.
+
+        Returns:
+            Iterator[Tuple[int, str]]:
+                Checked-off value and month formatted as YYYY-MM in order of check-off time.
+        """
+        if not isinstance(histories, ColumnarHistories):
+            for history_model in histories.histories.values():
+                yield history_model.checked_off, history_model.checkoff_datetime[:7]
+            return
+        month, start, end = None, 0, 0
+        for checked_off, checkoff_epoch in zip(histories.checked_off, histories.checkoff_epochs):
+            if not start <= checkoff_epoch < end:
+                month, start, end = Period.month_range(checkoff_epoch)
+            yield checked_off, month
+
+    @classmethod
+    def __checked_off_of(cls, histories: Histories) -> Sequence[int]:
+        """
+        Get the checked-off values of histories, columnar histories are consumed without copying.
+
+        Args:
+            histories (Histories):
+                Histories of a habit.
+
+        Returns:
+            Sequence[int]:
+                Checked-off values in order of check-off time.
+        """
+        if isinstance(histories, ColumnarHistories):
+            return histories.checked_off
+        return histories.transform_to_list()
+
+    @classmethod
+    def __as_bytes(cls, history: Sequence[int]) -> bytes:
+        """
+        Convert a history into a byte buffer with one byte per entry, one for checked-off and zero otherwise.
+
+        Args:
+            history (Sequence[int]):
+                History as a list, array('b') or buffer of checked-off values.
+
+        Returns:
+            bytes:
+                Byte buffer of the history.
+        """
+        if isinstance(history, array):
+            data = history.tobytes()
+        elif isinstance(history, (bytes, bytearray, memoryview)):
+            data = bytes(history)
+        else:
+            data = bytes(array("b", history))
+        return data.translate(cls.__ONLY_ONES)
+
+    @classmethod
+    def __as_ones(cls, history: Sequence[int]):
+        """
+        Convert a history into a NumPy array of booleans, true for checked-off entries.
+
+        Args:
+            history (Sequence[int]):
+                History as a list, array('b') or buffer of checked-off values.
+
+        Returns:
+            numpy.ndarray:
+                Boolean array of the history.
+        """
+        if isinstance(history, (array, bytes, bytearray, memoryview)):
+            return numpy.frombuffer(history, dtype=numpy.int8) == 1
+        return numpy.asarray(history, dtype=numpy.int8) == 1
+
+    @classmethod
+    def __runs(cls, ones):
+        """
+        Run-length encode the runs of true values of a boolean array.
+
+        Args:
+            ones (numpy.ndarray):
+                Boolean array.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]:
+                Start indexes and lengths of all runs of true values.
+        """
+        padded = numpy.concatenate(([0], ones.view(numpy.int8), [0]))
+        edges = numpy.flatnonzero(numpy.diff(padded))
+        starts = edges[0::2]
+        return starts, edges[1::2] - starts
+
+    @classmethod
+    def __run_lengths(cls, ones):
+        """
+        Get the lengths of all runs of true values of a boolean array.
+
+        Args:
+            ones (numpy.ndarray):
+                Boolean array.
+
+        Returns:
+            numpy.ndarray:
+                Lengths of all runs of true values in order.
+        """
+        return cls.__runs(ones)[1]
@@ -1,19 +1,372 @@
-import sqlite3
+import sys
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Iterable, List, Tuple
 
 import click
 
-from habit_tracker.data_access.data_access import DataAccess
-from habit_tracker.habit_tracker.habit_tracker import HabitTracker
+from habit_tracker.data_access.connection_profile import PROFILES, PROFILE_ENVIRONMENT_VARIABLE
+
+# Modules needed by commands only are imported by the commands, which keeps the startup of the CLI fast.
+if TYPE_CHECKING:
+    from habit_tracker.data_access.data_access import DataAccess
+    from habit_tracker.data_access.model.habit_statistics_model import HabitStatisticsModel
+    from habit_tracker.data_access.model.habits import Habits
+    from habit_tracker.habit_tracker.habit_tracker import HabitTracker
+
+# Output formats of the show commands, all but text are machine-readable.
+SHOW_FORMATS = ("text", "json", "jsonl", "csv")
+
+# Formats of record files, equal to Records.FORMATS.
+RECORD_FORMATS = ("csv", "jsonl", "columnar")
+
+# Output formats of the statistics commands.
+STATISTICS_FORMATS = ("text", "json")
+
+# Streak backends of the habit tracker, equal to HabitTracker.STREAK_BACKENDS.
+STREAK_BACKENDS = ("summary", "python", "sql")
+
+# Datetime of check-offs given on the CLI, dates are checked off at midnight.
+CHECKOFF_DATETIME = click.DateTime(formats=["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"])
 
 
 @click.group()
-def cli() -> None:
+@click.option("--db-profile", type=click.Choice(list(PROFILES)), default="default", envvar=PROFILE_ENVIRONMENT_VARIABLE,
+              show_default=True, help="Connection profile of the database, eg wal.")
+@click.option("--streak-backend", type=click.Choice(STREAK_BACKENDS), default="summary",
+              envvar="HABIT_TRACKER_STREAK_BACKEND", show_default=True,
+              help="Backend determining longest run streaks, eg sql to compute them within SQLite.")
+def cli(db_profile: str, streak_backend: str) -> None:
     """
     Habit Tracker is a CLI application to keep track of personal goals and how well they were achieved.
     """
     pass
 
 
+def create_data_access(**kwargs) -> "DataAccess":
+    """
+    Create a data access object using the connection profile given on the CLI.
+
+    The data access object is closed when the command has finished. Commands run by the daemon use the pooled
+    connection of the daemon, which stays open between commands.
+
+    Args:
+        **kwargs:
+            Further arguments passed to the DataAccess constructor.
+
+    Returns:
+        DataAccess:
+            Data access object connected with the selected connection profile.
+    """
+    from habit_tracker.data_access.data_access import DataAccess
+
+    context = click.get_current_context()
+    root = context.find_root()
+    pooled = isinstance(root.obj, dict) and root.obj.get("pooled_connections", False)
+    data_access = DataAccess(profile=root.params["db_profile"], pooled=pooled, **kwargs)
+    context.call_on_close(data_access.close)
+    return data_access
+
+
+def create_habit_tracker(**kwargs) -> "HabitTracker":
+    """
+    Create a habit tracker with a data access object using the connection profile and the streak backend given on the
+    CLI.
+
+    Args:
+        **kwargs:
+            Further arguments passed to the DataAccess constructor.
+
+    Returns:
+        HabitTracker:
+            Habit tracker with its data access object set.
+    """
+    from habit_tracker.habit_tracker.habit_tracker import HabitTracker
+
+    habit_tracker = HabitTracker()
+    habit_tracker.data_access = create_data_access(**kwargs)
+    habit_tracker.streak_backend = click.get_current_context().find_root().params["streak_backend"]
+    return habit_tracker
+
+
+def open_records_file(file_name: str, file_format: str, mode: str):
+    """
+    Open a record file for reading or writing, - for standard input or output.
+
+    Args:
+        file_name (str):
+            Name of the record file or -.
+        file_format (str):
+            Format of the record file, binary formats are opened in binary mode.
+        mode (str):
+            Mode to open the file with, r or w.
+
+    Returns:
+        Opened record file, closing it leaves standard input and output open.
+    """
+    from habit_tracker.data_access.records import Records
+
+    if file_format in Records.BINARY_FORMATS:
+        return click.open_file(file_name, mode + "b")
+    return click.open_file(file_name, mode, encoding="utf-8")
+
+
+def read_checkoffs(file_name: str, default_datetime: str) -> List[Tuple[int, str]]:
+    """
+    Read check-offs from a file with a habit ID and optionally a datetime per line, eg 42,2022-10-01 18:30:00.
+
+    Empty lines are skipped. The whole file is read before any check-off takes place, hence an invalid line aborts the
+    command without checking off any habit.
+
+    Args:
+        file_name (str):
+            Name of the file or - for standard input.
+        default_datetime (str):
+            Datetime of check-offs given without one, None for now.
+
+    Returns:
+        List[Tuple[int, str]]:
+            Pairs of habit ID and datetime of the check-off.
+    """
+    checkoffs = list()
+    with click.open_file(file_name, "r", encoding="utf-8") as stream:
+        for number, line in enumerate(stream, start=1):
+            fields = [field.strip() for field in line.split(",", 1)]
+            if fields == [""]:
+                continue
+            try:
+                habit_id = int(fields[0])
+                checkoff_datetime = default_datetime
+                if len(fields) == 2 and fields[1] != "":
+                    checkoff_datetime = CHECKOFF_DATETIME.convert(fields[1], None, None).strftime("%Y-%m-%d %H:%M:%S")
+            except (ValueError, click.BadParameter) as error:
+                message = error.format_message() if isinstance(error, click.BadParameter) else str(error)
+                raise click.ClickException(f"Line {number} of {file_name} is invalid, {message}")
+            checkoffs.append((habit_id, checkoff_datetime))
+    return checkoffs
+
+
+def echo_lines(lines: Iterable[str], chunk_size: int = 1000) -> None:
+    """
+    Write lines to standard output chunk by chunk without building the whole output at once.
+
+    Args:
+        lines (Iterable[str]):
+            Lines to be written without line breaks.
+        chunk_size (int):
+            Number of lines written at once.
+    """
+    chunk = list()
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            click.echo("\n".join(chunk))
+            chunk.clear()
+    if len(chunk) > 0:
+        click.echo("\n".join(chunk))
+
+
+def echo_habits(habits: "Habits", title: str, last: int, summary: bool) -> None:
+    """
+    Write habits with their histories to standard output line by line.
+
+    Args:
+        habits (Habits):
+            Habits to be written.
+        title (str):
+            Line written before the habits.
+        last (int):
+            Number of latest history entries written per habit, None for all.
+        summary (bool):
+            Whether to write the numbers of history entries and check-offs instead of the history entries.
+    """
+    click.echo(title)
+    if len(habits.habits) > 0:
+        echo_lines(habits.lines(last, summary))
+    else:
+        click.echo("No habits exist.")
+
+
+def write_habits(habits: "Habits", output_format: str, with_histories: bool) -> None:
+    """
+    Write habits with their histories machine-readable to standard output.
+
+    JSON output is an array of habit objects with their histories nested, JSON Lines and CSV output use the layout of
+    record files, see Records.
+
+    Args:
+        habits (Habits):
+            Habits to be written.
+        output_format (str):
+            Output format, json, jsonl or csv.
+        with_histories (bool):
+            Whether to write the histories of the habits.
+    """
+    import json
+
+    from habit_tracker.data_access.records import Records
+
+    stream = sys.stdout
+    if output_format == "json":
+        documents = list()
+        for habit in habits.habits.values():
+            document = dict(zip(Records.HABIT_FIELDS, habit.to_row()))
+            if with_histories:
+                document["histories"] = [
+                    dict(zip(Records.HISTORY_FIELDS, history.to_row()))
+                    for history in habit.habit_history.histories.values()
+                ]
+            documents.append(document)
+        json.dump(documents, stream)
+        stream.write("\n")
+        stream.flush()
+        return
+    Records.write_header(stream, output_format)
+    Records.write(stream, output_format, Records.HABIT, [habit.to_row() for habit in habits.habits.values()])
+    if with_histories:
+        for habit in habits.habits.values():
+            Records.write(stream, output_format, Records.HISTORY,
+                          [history.to_row() for history in habit.habit_history.histories.values()])
+    stream.flush()
+
+
+def echo_statistics(statistics: List["HabitStatisticsModel"], title: str, output_format: str) -> None:
+    """
+    Write the statistics of habits to standard output.
+
+    Args:
+        statistics (List[HabitStatisticsModel]):
+            Statistics of the habits to be written.
+        title (str):
+            Line written before the statistics in text output.
+        output_format (str):
+            Output format, text or json.
+    """
+    if output_format == "json":
+        import json
+
+        from habit_tracker.data_access.model.habit_statistics_model import HabitStatisticsModel
+
+        click.echo(json.dumps([dict(zip(HabitStatisticsModel.FIELDS, model.to_row())) for model in statistics]))
+        return
+    click.echo(title)
+    if len(statistics) > 0:
+        echo_lines(str(habit_statistics_model) for habit_statistics_model in statistics)
+    else:
+        click.echo("No habits exist.")
+
+
+def window_options(command):
+    """
+    Decorate a run streak command with the options selecting the window of check-off time.
+
+    Args:
+        command:
+            Function of the run streak command.
+
+    Returns:
+        Function of the run streak command with the options added.
+    """
+    options = [
+        click.option("--since", type=CHECKOFF_DATETIME, default=None,
+                     help="Consider check-offs from this date on, eg 2022-09-01."),
+        click.option("--until", type=CHECKOFF_DATETIME, default=None,
+                     help="Consider check-offs before this date, eg 2022-10-01."),
+        click.option("--days", type=click.IntRange(min=1), default=None,
+                     help="Consider check-offs of the last N days only, eg 90.")
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def window_of(since: datetime, until: datetime, days: int) -> Tuple[datetime, datetime]:
+    """
+    Get the window of check-off time given by the window options.
+
+    Args:
+        since (datetime):
+            Start of the window, inclusive, or None for no start.
+        until (datetime):
+            End of the window, exclusive, or None for no end.
+        days (int):
+            Number of days before now the window starts at, or None.
+
+    Returns:
+        Tuple[datetime, datetime]:
+            Start and end of the window.
+    """
+    if days is not None:
+        if since is not None:
+            raise click.UsageError("Options --since and --days cannot be combined.")
+        since = datetime.now() - timedelta(days=days)
+    return since, until
+
+
+def show_options(command):
+    """
+    Decorate a show command with the options selecting and formatting the habits shown.
+
+    Args:
+        command:
+            Function of the show command.
+
+    Returns:
+        Function of the show command with the options added.
+    """
+    options = [
+        click.option("--format", "output_format", type=click.Choice(SHOW_FORMATS), default="text", show_default=True,
+                     help="Output format, json, jsonl and csv are machine-readable."),
+        click.option("--limit", type=click.IntRange(min=1), default=None, help="Show at most N habits."),
+        click.option("--offset", type=int, default=None,
+                     help="Show habits with IDs greater than this ID, the last ID of the previous page."),
+        click.option("--no-history", is_flag=True, help="Show habits without reading their histories."),
+        click.option("--last", type=click.IntRange(min=0), default=None,
+                     help="Show only the latest N history entries per habit in text output."),
+        click.option("--summary", is_flag=True,
+                     help="Show only the numbers of history entries and check-offs per habit in text output.")
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def show_habits(periodicity: str, title: str, output_format: str, limit: int, offset: int, no_history: bool,
+                last: int, summary: bool) -> None:
+    """
+    Show a page of habits, optionally only habits with a specific periodicity.
+
+    Only the habits of the page and their histories are read from the database. If the page is full, the offset of the
+    next page is written to standard error.
+
+    Args:
+        periodicity (str):
+            Periodicity of the habits shown, None for all habits.
+        title (str):
+            Line written before the habits in text output.
+        output_format (str):
+            Output format, text, json, jsonl or csv.
+        limit (int):
+            Maximum number of habits shown, None for all.
+        offset (int):
+            ID of the last habit of the previous page, None for the first page.
+        no_history (bool):
+            Determines whether the habits are shown without their histories.
+        last (int):
+            Number of latest history entries shown per habit in text output, None for all.
+        summary (bool):
+            Determines whether only the numbers of history entries and check-offs are shown in text output.
+    """
+    habit_tracker = create_habit_tracker()
+    habits = habit_tracker.show_habits_page(offset, limit, periodicity, not no_history)
+    if output_format == "text":
+        echo_habits(habits, title, last, summary)
+    else:
+        write_habits(habits, output_format, not no_history)
+    if limit is not None and len(habits.habits) == limit:
+        last_habit_id = max(habit.habit_id for habit in habits.habits.values())
+        click.echo(f"Next page: --offset {last_habit_id}", err=True)
+
+
 @cli.command(help="Initializes the database for first usage with dummy dataa.")
 def init_db() -> None:
     """
@@ -22,11 +375,114 @@ def init_db() -> None:
     It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to initialize the database with dummy
     data.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
+    habit_tracker = create_habit_tracker()
     habit_tracker.initialize_db()
 
-    
+
+@cli.command(help="Migrate the database schema to the latest version.")
+def migrate() -> None:
+    """
+    Click command migrates the database schema to the latest version.
+
+    It sets the DataAccess attribute in HabitTracker without migrating on connecting and calls the HabitTracker to
+    migrate the database schema.
+    """
+    habit_tracker = create_habit_tracker(migrate_schema=False)
+    from_version = habit_tracker.data_access.schema_version
+    to_version = habit_tracker.migrate_db()
+    if from_version == to_version:
+        click.echo(f"Database schema is up to date with version {to_version}.")
+    else:
+        click.echo(f"Database schema migrated from version {from_version} to version {to_version}.")
+
+
+@cli.command(name="import", help="Import habits and histories from a record file, - for standard input.")
+@click.argument("file", type=click.Path(dir_okay=False, allow_dash=True))
+@click.option("--format", "file_format", type=click.Choice(RECORD_FORMATS), default=None,
+              help="Format of the file, defaults to the format of its file extension or csv.")
+@click.option("--batch-size", type=int, default=10000, show_default=True, help="Number of rows inserted at once.")
+def import_habits(file: str, file_format: str, batch_size: int) -> None:
+    """
+    Click command imports habits and histories from a record file into the database.
+
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTracker to import the records and reports the
+    number of rows imported per second.
+
+    Args:
+        file (str):
+            Name of the record file, - for standard input.
+        file_format (str):
+            Format of the record file, eg csv, jsonl, columnar.
+        batch_size (int):
+            Number of rows inserted at once.
+    """
+    import sqlite3
+    import time
+
+    from habit_tracker.data_access.records import Records
+
+    habit_tracker = create_habit_tracker()
+    if file_format is None:
+        file_format = Records.format_of(file)
+    begin = time.perf_counter()
+    try:
+        with open_records_file(file, file_format, "r") as stream:
+            number_habits, number_histories = habit_tracker.import_habits(stream, file_format, batch_size)
+    except (NameError, ValueError, KeyError, OSError, sqlite3.Error) as error:
+        raise click.ClickException(f"Nothing imported, {error}")
+    elapsed = time.perf_counter() - begin
+    rows_per_second = (number_habits + number_histories) / elapsed if elapsed > 0 else 0.0
+    click.echo(f"Imported {number_habits} habits and {number_histories} histories in {elapsed:.2f} s "
+               f"({rows_per_second:.0f} rows/s).")
+
+
+@cli.command(help="Export habits and histories to a record file, - for standard output.")
+@click.argument("file", type=click.Path(dir_okay=False, allow_dash=True))
+@click.option("--format", "file_format", type=click.Choice(RECORD_FORMATS), default=None,
+              help="Format of the file, defaults to the format of its file extension or csv.")
+@click.option("--since", type=click.DateTime(), default=None,
+              help="Export check-offs from this date on, eg 2022-09-01.")
+@click.option("--until", type=click.DateTime(), default=None, help="Export check-offs before this date, eg 2022-10-01.")
+@click.option("--period", default=None, help="Export only habits of this periodicity, eg daily, weekly.")
+@click.option("--batch-size", type=int, default=1000, show_default=True, help="Number of rows written at once.")
+def export(file: str, file_format: str, since: datetime, until: datetime, period: str, batch_size: int) -> None:
+    """
+    Click command exports habits and histories from the database to a record file.
+
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTracker to export the records and reports the
+    number of rows exported per second. Reports are written to standard error when exporting to standard output.
+
+    Args:
+        file (str):
+            Name of the record file, - for standard output.
+        file_format (str):
+            Format of the record file, eg csv, jsonl, columnar.
+        since (datetime):
+            Start of the range of check-off time, inclusive.
+        until (datetime):
+            End of the range of check-off time, exclusive.
+        period (str):
+            Periodicity of the habits to export.
+        batch_size (int):
+            Number of rows fetched and written at once.
+    """
+    import time
+
+    from habit_tracker.data_access.records import Records
+
+    habit_tracker = create_habit_tracker()
+    if file_format is None:
+        file_format = Records.format_of(file)
+    begin = time.perf_counter()
+    with open_records_file(file, file_format, "w") as stream:
+        number_habits, number_histories = habit_tracker.export_habits(stream, file_format, since, until, period,
+                                                                      batch_size)
+    elapsed = time.perf_counter() - begin
+    rows_per_second = (number_habits + number_histories) / elapsed if elapsed > 0 else 0.0
+    click.echo(f"Exported {number_habits} habits and {number_histories} histories in {elapsed:.2f} s "
+               f"({rows_per_second:.0f} rows/s).", err=file == "-")
+
+
 @cli.command(help="Create a new habit.")
 @click.option("--name", help="Name of the habit.")
 @click.option("--description", help="Description of the habit.")
@@ -70,8 +526,7 @@ def create(name: str, description: str, period: str, habit_from: str, habit_to:
     if is_incomplete:
         return
 
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
+    habit_tracker = create_habit_tracker()
     habit_id = habit_tracker.create_new_habit(name, description, period, habit_from, habit_to)
     if habit_id > 0:
         click.echo(f"Habit '{name}' created.")
@@ -89,8 +544,7 @@ def delete(id: int) -> None:
         id (int):
             Determines the id of the habit to be deleted.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
+    habit_tracker = create_habit_tracker()
     habit_tracker.delete_habit(id)
     click.echo(f"Habit with ID '{id}' deleted.")
 
@@ -122,8 +576,7 @@ def modify(id: int, name: str, description: str, period: str, habit_from: str, h
         habit_to (str):
             Determines the end date of the habit.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
+    habit_tracker = create_habit_tracker()
     habit_id = 0
     try:
         habit_id = habit_tracker.modify_habit(id, name, description, period, habit_from, habit_to)
@@ -133,133 +586,355 @@ def modify(id: int, name: str, description: str, period: str, habit_from: str, h
         click.echo(f"Habit with ID '{habit_id}' modified.")
 
 
-@cli.command(help="Complete, that means, check-off a habit.")
-@click.option("--id", help="ID of the habit to complete / check-off.")
-def complete(id: int) -> None:
+@cli.command(help="Complete, that means, check-off habits.")
+@click.option("--id", "ids", type=int, multiple=True, help="ID of a habit to complete / check-off, may be repeated.")
+@click.option("--file", type=click.Path(dir_okay=False, allow_dash=True), default=None,
+              help="File of check-offs to complete, one id[,datetime] per line, - for standard input.")
+@click.option("--datetime", "checkoff_datetime", type=CHECKOFF_DATETIME, default=None,
+              help="Datetime of check-offs given without one, eg 2022-10-01 18:30:00, defaults to now.")
+def complete(ids: Tuple[int, ...], file: str, checkoff_datetime: datetime) -> None:
     """
-    Click command checks-off a habit in the database based on habit id given on the CLI.
+    Click command checks-off habits in the database based on habit ids given on the CLI or in a file.
 
-    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to check-off a habit.
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to check-off all habits within a single
+    transaction. The result of each check-off is written in order, check-offs failing do not affect the others.
 
     Args:
-        id (int):
-            Determines the id of the habit to be checked-off.
+        ids (Tuple[int, ...]):
+            Determines the ids of the habits to be checked-off.
+        file (str):
+            Name of a file of check-offs, - for standard input.
+        checkoff_datetime (datetime):
+            Determines the datetime of check-offs without a datetime of their own, None for now.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
-    history_id = 0
-    try:
-        history_id = habit_tracker.complete_habit(id)
-    except NameError as name_error:
-        click.echo(f"Habit with ID '{id}' does not exist.")
-    except ValueError as value_error:
-        click.echo(f"Habit with ID '{id}' has already been checked-off in given period.")
-    if history_id > 0:
-        click.echo(f"Habit with ID '{id}' completed / checked-off.")
+    default_datetime = None if checkoff_datetime is None else checkoff_datetime.strftime("%Y-%m-%d %H:%M:%S")
+    checkoffs = [(habit_id, default_datetime) for habit_id in ids]
+    if file is not None:
+        checkoffs.extend(read_checkoffs(file, default_datetime))
+    if len(checkoffs) == 0:
+        click.echo("Habit ID is not given.")
+        return
+
+    habit_tracker = create_habit_tracker()
+    results = habit_tracker.complete_habits(checkoffs)
+    lines = list()
+    for (habit_id, _), result in zip(checkoffs, results):
+        if isinstance(result, NameError):
+            lines.append(f"Habit with ID '{habit_id}' does not exist.")
+        elif isinstance(result, Exception):
+            lines.append(str(result))
+        else:
+            lines.append(f"Habit with ID '{habit_id}' completed / checked-off.")
+    echo_lines(lines)
+    if len(checkoffs) > 1:
+        number_completed = len([result for result in results if not isinstance(result, Exception)])
+        click.echo(f"Completed {number_completed} of {len(checkoffs)} check-offs.")
 
 
 @cli.command(help="Show all habits.")
-def show() -> None:
+@show_options
+def show(**options) -> None:
     """
     Click command shows all habits in the database.
 
-    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list all habits.
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list all habits. The habits are
+    written line by line.
+
+    Args:
+        **options:
+            Options selecting and formatting the habits shown, see show_habits.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
-    habits = habit_tracker.show_all_habits()
-    click.echo("Showing list of all defined habits:")
-    if len(habits.habits) > 0:
-        click.echo(str(habits))
-    else:
-        click.echo("No habits exist.")
+    show_habits(None, "Showing list of all defined habits:", **options)
 
 
 @cli.command(help="Show all daily habits.")
-def show_daily() -> None:
+@show_options
+def show_daily(**options) -> None:
     """
     Click command shows all daily habits in the database.
 
-    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list all daily habits.
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list all daily habits. The habits are
+    written line by line.
+
+    Args:
+        **options:
+            Options selecting and formatting the habits shown, see show_habits.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
-    habits = habit_tracker.show_all_habits_by_periodicity("daily")
-    click.echo("Showing list of all defined daily habits:")
-    if len(habits.habits) > 0:
-        click.echo(str(habits))
-    else:
-        click.echo("No habits exist.")
+    show_habits("daily", "Showing list of all defined daily habits:", **options)
 
 
 @cli.command(help="Show all weekly habits.")
-def show_weekly() -> None:
+@show_options
+def show_weekly(**options) -> None:
     """
     Click command shows all weekly habits in the database.
 
-    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list all weekly habits.
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list all weekly habits. The habits are
+    written line by line.
+
+    Args:
+        **options:
+            Options selecting and formatting the habits shown, see show_habits.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
-    habits = habit_tracker.show_all_habits_by_periodicity("weekly")
-    click.echo("Showing list of all defined weekly habits:")
-    if len(habits.habits) > 0:
-        click.echo(str(habits))
-    else:
-        click.echo("No habits exist.")
+    show_habits("weekly", "Showing list of all defined weekly habits:", **options)
 
 
 @cli.command(help="Show longest run streak.")
-def longest_run_streak() -> None:
+@window_options
+def longest_run_streak(since: datetime, until: datetime, days: int) -> None:
     """
     Click command shows the longest streak of all habits in the database.
 
     It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list the longest streak of all habits.
+
+    Args:
+        since (datetime):
+            Start of the window of check-off time, inclusive.
+        until (datetime):
+            End of the window of check-off time, exclusive.
+        days (int):
+            Number of days before now the window starts at.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
-    longest_streak = habit_tracker.calc_longest_run_streak()
+    habit_tracker = create_habit_tracker()
+    longest_streak = habit_tracker.calc_longest_run_streak(*window_of(since, until, days))
     click.echo("Showing longest run streak with a length of: " + str(longest_streak))
 
 
 @cli.command(help="Show all daily longest run streak.")
-def longest_run_streak_daily() -> None:
+@window_options
+def longest_run_streak_daily(since: datetime, until: datetime, days: int) -> None:
     """
     Click command shows the longest streak of all daily habits in the database.
 
     It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list the longest streak of all daily
     habits.
+
+    Args:
+        since (datetime):
+            Start of the window of check-off time, inclusive.
+        until (datetime):
+            End of the window of check-off time, exclusive.
+        days (int):
+            Number of days before now the window starts at.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
-    longest_streak = habit_tracker.calc_longest_run_streak_by_periodicity('daily')
+    habit_tracker = create_habit_tracker()
+    longest_streak = habit_tracker.calc_longest_run_streak_by_periodicity('daily', *window_of(since, until, days))
     click.echo("Showing longest daily run streak with a length of: " + str(longest_streak))
 
 
 @cli.command(help="Show all weekly longest run streak.")
-def longest_run_streak_weekly():
+@window_options
+def longest_run_streak_weekly(since: datetime, until: datetime, days: int):
     """
     Click command shows the longest streak of all weekly habits in the database.
 
     It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list the longest streak of all weekly
     habits.
+
+    Args:
+        since (datetime):
+            Start of the window of check-off time, inclusive.
+        until (datetime):
+            End of the window of check-off time, exclusive.
+        days (int):
+            Number of days before now the window starts at.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
-    longest_streak = habit_tracker.calc_longest_run_streak_by_periodicity('weekly')
+    habit_tracker = create_habit_tracker()
+    longest_streak = habit_tracker.calc_longest_run_streak_by_periodicity('weekly', *window_of(since, until, days))
     click.echo("Showing longest weekly run streak with a length of: " + str(longest_streak))
 
 
 @cli.command(help="Show  longest run streak for a given habit.")
 @click.option("--id", help="ID of the habit to show it's longest run streak.")
-def longest_run_streak_for_given_habit(id):
+@window_options
+def longest_run_streak_for_given_habit(id, since: datetime, until: datetime, days: int):
     """
     Click command shows the longest streak of a specific habit in the database.
 
     It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to list the longest streak of a specific
     habit.
+
+    Args:
+        id (int):
+            Determines the id of the habit.
+        since (datetime):
+            Start of the window of check-off time, inclusive.
+        until (datetime):
+            End of the window of check-off time, exclusive.
+        days (int):
+            Number of days before now the window starts at.
     """
-    habit_tracker = HabitTracker()
-    habit_tracker.data_access = DataAccess()
-    longest_streak = habit_tracker.calc_longest_run_streak_of_habit(id)
+    habit_tracker = create_habit_tracker()
+    longest_streak = habit_tracker.calc_longest_run_streak_of_habit(id, *window_of(since, until, days))
     click.echo(f"Showing longest run streak for given habit with ID {id} with length of: " + str(longest_streak))
+
+
+@cli.command(help="Show the longest run streak of a habit within a rolling window ending at each period.")
+@click.option("--id", help="ID of the habit to show its rolling longest run streaks.")
+@click.option("--window", type=click.IntRange(min=1), required=True,
+              help="Number of periods of the rolling window, eg 30 for 30 days of a daily habit.")
+@window_options
+def rolling_longest_run_streak(id: int, window: int, since: datetime, until: datetime, days: int) -> None:
+    """
+    Click command shows the longest streak of a specific habit within a rolling window ending at each period.
+
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to determine the longest streaks of all
+    rolling windows over the history of the habit in a single pass.
+
+    Args:
+        id (int):
+            Determines the id of the habit.
+        window (int):
+            Number of periods of the rolling window.
+        since (datetime):
+            Start of the window of check-off time, inclusive.
+        until (datetime):
+            End of the window of check-off time, exclusive.
+        days (int):
+            Number of days before now the window starts at.
+    """
+    habit_tracker = create_habit_tracker()
+    try:
+        longest_streaks = habit_tracker.calc_rolling_longest_run_streaks(id, window, *window_of(since, until, days))
+    except NameError:
+        click.echo(f"Habit with ID '{id}' does not exist.")
+        return
+    click.echo(f"Showing longest run streak within {window} periods for given habit with ID {id}:")
+    echo_lines(f"{checkoff_datetime}: {longest_streak}" for checkoff_datetime, longest_streak in longest_streaks)
+
+
+@cli.command(help="Show statistics of all habits.")
+@click.option("--format", "output_format", type=click.Choice(STATISTICS_FORMATS), default="text", show_default=True,
+              help="Output format, json is machine-readable.")
+def statistics(output_format: str) -> None:
+    """
+    Click command shows streaks, completion rate, breaks and best and worst month of all habits in the database.
+
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to determine the statistics of all
+    habits, each history being scanned once.
+
+    Args:
+        output_format (str):
+            Output format, text or json.
+    """
+    habit_tracker = create_habit_tracker()
+    echo_statistics(habit_tracker.calc_statistics(), "Showing statistics of all habits:", output_format)
+
+
+@cli.command(help="Show statistics of all daily habits.")
+@click.option("--format", "output_format", type=click.Choice(STATISTICS_FORMATS), default="text", show_default=True,
+              help="Output format, json is machine-readable.")
+def statistics_daily(output_format: str) -> None:
+    """
+    Click command shows streaks, completion rate, breaks and best and worst month of all daily habits in the database.
+
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to determine the statistics of all daily
+    habits.
+
+    Args:
+        output_format (str):
+            Output format, text or json.
+    """
+    habit_tracker = create_habit_tracker()
+    echo_statistics(habit_tracker.calc_statistics_by_periodicity("daily"), "Showing statistics of all daily habits:",
+                    output_format)
+
+
+@cli.command(help="Show statistics of all weekly habits.")
+@click.option("--format", "output_format", type=click.Choice(STATISTICS_FORMATS), default="text", show_default=True,
+              help="Output format, json is machine-readable.")
+def statistics_weekly(output_format: str) -> None:
+    """
+    Click command shows streaks, completion rate, breaks and best and worst month of all weekly habits in the database.
+
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to determine the statistics of all
+    weekly habits.
+
+    Args:
+        output_format (str):
+            Output format, text or json.
+    """
+    habit_tracker = create_habit_tracker()
+    echo_statistics(habit_tracker.calc_statistics_by_periodicity("weekly"), "Showing statistics of all weekly habits:",
+                    output_format)
+
+
+@cli.command(help="Show statistics of a given habit.")
+@click.option("--id", help="ID of the habit to show its statistics.")
+@click.option("--format", "output_format", type=click.Choice(STATISTICS_FORMATS), default="text", show_default=True,
+              help="Output format, json is machine-readable.")
+def statistics_for_given_habit(id: int, output_format: str) -> None:
+    """
+    Click command shows streaks, completion rate, breaks and best and worst month of a specific habit in the database.
+
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to determine the statistics of a
+    specific habit.
+
+    Args:
+        id (int):
+            Determines the id of the habit.
+        output_format (str):
+            Output format, text or json.
+    """
+    habit_tracker = create_habit_tracker()
+    try:
+        habit_statistics_model = habit_tracker.calc_statistics_of_habit(id)
+    except NameError:
+        click.echo(f"Habit with ID '{id}' does not exist.")
+        return
+    echo_statistics([habit_statistics_model], f"Showing statistics for given habit with ID {id}:", output_format)
+
+
+@cli.command(help="Check the habit summaries against the habit histories.")
+@click.option("--repair", is_flag=True, help="Rebuild the habit summaries from the histories if inconsistent.")
+def check_summaries(repair: bool) -> None:
+    """
+    Click command checks the habit summaries used for the longest run streaks against the habit histories.
+
+    It sets the DataAccess attribute in HabitTracker and calls the HabitTrackr to check and optionally rebuild the habit
+    summaries.
+
+    Args:
+        repair (bool):
+            Determines whether the habit summaries are rebuilt if inconsistent.
+    """
+    habit_tracker = create_habit_tracker()
+    inconsistent_habit_ids = habit_tracker.check_habit_summaries(repair)
+    if len(inconsistent_habit_ids) == 0:
+        click.echo("Habit summaries are consistent with the habit histories.")
+        return
+    click.echo("Habit summaries of habits with IDs " + ", ".join(map(str, inconsistent_habit_ids)) + " are inconsistent.")
+    if repair:
+        click.echo("Habit summaries rebuilt from the habit histories.")
+
+
+@cli.command(help="Run CLI commands of other invocations in this process over a Unix socket until stopped.")
+@click.option("--socket", "socket_path", default=None, envvar="HABIT_TRACKER_SOCKET",
+              help="Path of the Unix socket, defaults to db/habit_tracker.sock.")
+@click.option("--stop", is_flag=True, help="Stop the running daemon.")
+def daemon(socket_path: str, stop: bool) -> None:
+    """
+    Click command runs the daemon which keeps a habit tracker warm for repeated CLI calls.
+
+    The daemon runs in the foreground until it is stopped by an invocation with the stop flag.
+
+    Args:
+        socket_path (str):
+            Path of the Unix socket of the daemon.
+        stop (bool):
+            Determines whether the running daemon is stopped instead of running a new one.
+    """
+    from habit_tracker.cli.daemon import Daemon
+
+    habit_tracker_daemon = Daemon(socket_path)
+    if stop:
+        if habit_tracker_daemon.stop():
+            click.echo("Daemon stopped.")
+        else:
+            click.echo("No daemon is running.")
+        return
+    click.echo(f"Daemon listening on {habit_tracker_daemon.socket_path}.", err=True)
+    try:
+        habit_tracker_daemon.serve()
+    except OSError as error:
+        raise click.ClickException(str(error))
@@ -0,0 +1,266 @@
+import marshal
+import os
+
+# The client imports as little as possible, typing is not imported and sockets only if a daemon socket exists.
+
+
+class Daemon:
+    """
+    Daemon keeps a habit tracker process warm and runs CLI commands sent by clients over a Unix socket.
+
+    Clients send the arguments of a command together with their working directory and their environment variables
+    starting with HABIT_TRACKER_. The daemon runs the command as the CLI would, reusing its imported modules, its pooled
+    database connection and its migrated database schema, and sends back exit code, standard output and standard error.
+    Commands are run one after another.
+
+    Messages are serialized with marshal, which unlike json needs no import on the client side. The socket is only
+    accessible to the user running the daemon, hence only messages of that user are unmarshalled.
+    """
+
+    SOCKET_ENVIRONMENT_VARIABLE = "HABIT_TRACKER_SOCKET"
+
+    DEFAULT_SOCKET_PATH = "db/habit_tracker.sock"
+
+    # Commands always run by the calling process as they stream files of the caller or control the daemon.
+    LOCAL_COMMANDS = ("daemon", "import", "export")
+
+    ENVIRONMENT_PREFIX = "HABIT_TRACKER_"
+
+    # Options of the CLI group followed by their value as separate argument, all other options take no value.
+    GROUP_OPTIONS_WITH_VALUE = ("--db-profile", "--streak-backend")
+
+    def __init__(self, socket_path: str = None):
+        """
+        Sets all attributes of a daemon.
+
+        Args:
+            socket_path (str):
+                Path of the Unix socket, defaults to the environment variable HABIT_TRACKER_SOCKET or
+                db/habit_tracker.sock.
+        """
+        if socket_path is None:
+            socket_path = os.environ.get(self.SOCKET_ENVIRONMENT_VARIABLE, self.DEFAULT_SOCKET_PATH)
+        self.__socket_path = os.path.abspath(socket_path)
+
+    @property
+    def socket_path(self) -> str:
+        """
+        Gets the absolute path of the Unix socket.
+
+        Returns:
+            str:
+                Path of the Unix socket.
+        """
+        return self.__socket_path
+
+    @classmethod
+    def forwards(cls, arguments: list) -> bool:
+        """
+        Determine whether a command may be sent to the daemon.
+
+        Commands without a subcommand, local commands and commands reading from or writing to standard streams, given
+        as - or as an option value like --file=-, run in the calling process.
+
+        Args:
+            arguments (List[str]):
+                Arguments of the CLI without the program name.
+
+        Returns:
+            bool:
+                True if the command may be sent to the daemon.
+        """
+        if any(argument == "-" or argument.endswith("=-") for argument in arguments):
+            return False
+        index = 0
+        while index < len(arguments) and arguments[index].startswith("-"):
+            index += 2 if arguments[index] in cls.GROUP_OPTIONS_WITH_VALUE else 1
+        return index < len(arguments) and arguments[index] not in cls.LOCAL_COMMANDS
+
+    def request(self, arguments: list) -> tuple:
+        """
+        Send a command to the daemon and wait for its result.
+
+        Args:
+            arguments (List[str]):
+                Arguments of the CLI without the program name.
+
+        Returns:
+            Optional[Tuple[int, str, str]]:
+                Exit code, standard output and standard error of the command, None if no daemon is running.
+        """
+        environment = {name: value for name, value in os.environ.items() if name.startswith(self.ENVIRONMENT_PREFIX)}
+        return self.__send({"arguments": arguments, "directory": os.getcwd(), "environment": environment})
+
+    def stop(self) -> bool:
+        """
+        Stop the running daemon.
+
+        Returns:
+            bool:
+                True if a daemon was running and has stopped.
+        """
+        return self.__send({"stop": True}) is not None
+
+    def serve(self) -> None:
+        """
+        Listen on the Unix socket and run the commands received until stopped.
+
+        The socket is only accessible to the user running the daemon and is removed when the daemon stops. A stale
+        socket left by a daemon not running anymore is replaced.
+
+        Raises:
+            OSError:
+                If a daemon is already listening on the socket.
+        """
+        import importlib
+        import socket
+
+        from click.testing import CliRunner
+
+        # The CLI and the habit tracker are imported once, before the first command arrives.
+        from habit_tracker.cli.cli import cli
+        importlib.import_module("habit_tracker.habit_tracker.habit_tracker")
+
+        try:
+            runner = CliRunner(mix_stderr=False)
+        except TypeError:
+            # Standard error is captured separately by default and mix_stderr is not accepted by Click 8.2 and later.
+            runner = CliRunner()
+        if os.path.exists(self.__socket_path):
+            if self.__send(None) is not None:
+                raise OSError(f"A daemon is already listening on {self.__socket_path}.")
+            os.unlink(self.__socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            server.bind(self.__socket_path)
+        finally:
+            os.umask(umask)
+        try:
+            server.listen()
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    try:
+                        request = self.__receive(connection)
+                    except (EOFError, ValueError, TypeError):
+                        continue
+                    if request is None:
+                        continue
+                    if request.get("stop", False):
+                        self.__reply(connection, (0, "", ""))
+                        return
+                    self.__reply(connection, self.__run(runner, cli, request))
+        finally:
+            server.close()
+            os.unlink(self.__socket_path)
+
+    def __run(self, runner, cli, request: dict) -> tuple:
+        """
+        Run a command in the working directory and with the environment variables of the client.
+
+        Args:
+            runner (CliRunner):
+                Runner invoking the CLI with standard streams captured.
+            cli (click.Group):
+                CLI group of the habit tracker.
+            request (dict):
+                Arguments, working directory and environment variables of the client.
+
+        Returns:
+            Tuple[int, str, str]:
+                Exit code, standard output and standard error of the command.
+        """
+        # Variables of the daemon not set by the client are unset while the command runs.
+        environment = {name: None for name in os.environ if name.startswith(self.ENVIRONMENT_PREFIX)}
+        environment.update(request["environment"])
+        directory = os.getcwd()
+        try:
+            os.chdir(request["directory"])
+            result = runner.invoke(cli, request["arguments"], env=environment,
+                                   obj={"pooled_connections": True}, prog_name="habit-tracker")
+        except OSError as error:
+            return 1, "", f"Error: {error}\n"
+        finally:
+            os.chdir(directory)
+        error = result.stderr
+        if result.exception is not None and not isinstance(result.exception, SystemExit):
+            import traceback
+
+            error += "".join(traceback.format_exception(*result.exc_info))
+        return result.exit_code, result.stdout, error
+
+    def __send(self, request: dict) -> tuple:
+        """
+        Send a request to the daemon and wait for its reply.
+
+        Args:
+            request (Optional[dict]):
+                Request sent, None to only check whether a daemon is listening.
+
+        Returns:
+            Optional[Tuple[int, str, str]]:
+                Reply of the daemon, None if no daemon is listening.
+        """
+        if not os.path.exists(self.__socket_path):
+            return None
+        # The socket module imports selectors and enum, its C implementation suffices for a blocking client.
+        import _socket
+
+        if getattr(_socket, "AF_UNIX", None) is None:
+            return None
+        client = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+        try:
+            try:
+                client.connect(self.__socket_path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                return None
+            if request is None:
+                client.shutdown(_socket.SHUT_WR)
+                return 0, "", ""
+            client.sendall(marshal.dumps(request))
+            client.shutdown(_socket.SHUT_WR)
+            reply = self.__receive(client)
+        finally:
+            client.close()
+        if reply is None:
+            raise ConnectionError(f"Daemon on {self.__socket_path} closed the connection without reply.")
+        return reply["exit_code"], reply["stdout"], reply["stderr"]
+
+    @classmethod
+    def __receive(cls, connection) -> dict:
+        """
+        Read a message until the other side has shut down writing.
+
+        Args:
+            connection (socket.socket):
+                Connected socket.
+
+        Returns:
+            Optional[dict]:
+                Message received, None if the other side has sent nothing.
+        """
+        chunks = list()
+        while True:
+            chunk = connection.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        if len(chunks) == 0:
+            return None
+        return marshal.loads(b"".join(chunks))
+
+    @classmethod
+    def __reply(cls, connection, result: tuple) -> None:
+        """
+        Send the result of a command to the client.
+
+        Args:
+            connection (socket.socket):
+                Connection of the client.
+            result (Tuple[int, str, str]):
+                Exit code, standard output and standard error of the command.
+        """
+        exit_code, output, error = result
+        message = {"exit_code": exit_code, "stdout": output, "stderr": error}
+        connection.sendall(marshal.dumps(message))
@@ -0,0 +1,28 @@
+import sys
+
+from habit_tracker.cli.daemon import Daemon
+
+
+def main() -> None:
+    """
+    Entry point of the habit-tracker command.
+
+    Commands are sent to the daemon if one is running, which answers without importing the habit tracker and opening
+    the database again. Otherwise, or for commands run locally, the CLI is imported and runs the command itself.
+    """
+    arguments = sys.argv[1:]
+    if Daemon.forwards(arguments):
+        result = Daemon().request(arguments)
+        if result is not None:
+            exit_code, output, error = result
+            sys.stdout.write(output)
+            sys.stderr.write(error)
+            sys.exit(exit_code)
+
+    from habit_tracker.cli.cli import cli
+
+    cli(prog_name="habit-tracker")
+
+
+if __name__ == "__main__":
+    main()
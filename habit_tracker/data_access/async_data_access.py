@@ -0,0 +1,304 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from habit_tracker.data_access.data_access import DataAccess
+from habit_tracker.data_access.migrations import LATEST_VERSION
+from habit_tracker.data_access.model.habits import Habits
+from habit_tracker.data_access.model.habit_model import HabitModel
+from habit_tracker.data_access.model.habit_summary_model import HabitSummaryModel
+from habit_tracker.data_access.model.histories import Histories
+
+
+class AsyncDataAccess:
+    """
+    Manage all data in a SQlite database without blocking the event loop.
+
+    AsyncDataAccess offers the methods of DataAccess as coroutines. All SQlite work is done by a data access object
+    living in a dedicated executor thread, hence calls are executed one after another in the order they were made.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Start the executor thread and create the data access object within it.
+
+        The data access object is created in the background, errors on creating it are raised on the first call.
+
+        Args:
+            *args:
+                Arguments passed to the DataAccess constructor.
+            **kwargs:
+                Keyword arguments passed to the DataAccess constructor.
+        """
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="habit-tracker-db")
+        self.__data_access = self.__executor.submit(DataAccess, *args, **kwargs)
+
+    async def __aenter__(self) -> "AsyncDataAccess":
+        """
+        Enters the runtime context of the asynchronous data access object.
+
+        Returns:
+            AsyncDataAccess:
+                The asynchronous data access object itself.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits the runtime context of the asynchronous data access object and closes it.
+        """
+        await self.close()
+
+    async def __run(self, method, *args, **kwargs):
+        """
+        Run a method of the data access object in the executor thread.
+
+        Args:
+            method:
+                Method of DataAccess, called with the data access object as first argument.
+            *args:
+                Arguments passed to the method.
+            **kwargs:
+                Keyword arguments passed to the method.
+
+        Returns:
+            Return value of the method.
+        """
+        call = functools.partial(self.__call, method, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, call)
+
+    async def run(self, function, *args, **kwargs):
+        """
+        Run a function given the data access object in the executor thread, eg to run business logic built on it.
+
+        Args:
+            function:
+                Function called with the data access object as first argument.
+            *args:
+                Arguments passed to the function.
+            **kwargs:
+                Keyword arguments passed to the function.
+
+        Returns:
+            Return value of the function.
+        """
+        return await self.__run(function, *args, **kwargs)
+
+    def __call(self, method, *args, **kwargs):
+        """
+        Call a method of the data access object, only to be run in the executor thread.
+        """
+        return method(self.__data_access.result(), *args, **kwargs)
+
+    async def close(self) -> None:
+        """
+        Close the data access object and stop the executor thread once all pending calls are done.
+        """
+        try:
+            await self.__run(DataAccess.close)
+        finally:
+            self.__executor.shutdown(wait=False)
+
+    async def migrate(self, target_version: int = LATEST_VERSION) -> int:
+        """
+        Migrate the database schema, see DataAccess.migrate.
+
+        Args:
+            target_version (int):
+                Version the database schema is to be migrated to, defaults to the latest version.
+
+        Returns:
+            int:
+                Version of the database schema after migrating.
+        """
+        return await self.__run(DataAccess.migrate, target_version)
+
+    async def schema_version(self) -> int:
+        """
+        Get the version of the database schema.
+
+        Returns:
+            int:
+                Version of the database schema.
+        """
+        return await self.__run(DataAccess.schema_version.fget)
+
+    async def drop_tables(self) -> None:
+        """
+        Delete the database tables, see DataAccess.drop_tables.
+        """
+        await self.__run(DataAccess.drop_tables)
+
+    async def initialize_db(self, habits: Habits) -> None:
+        """
+        Initialize an empty database with habits, see DataAccess.initialize_db.
+
+        Args:
+            habits (Habits):
+                Dictionary of habit models.
+        """
+        await self.__run(DataAccess.initialize_db, habits)
+
+    async def get_habit_by_id(self, habit_id: int, columnar: bool = False) -> HabitModel:
+        """
+        Get a habit given its ID, see DataAccess.get_habit_by_id.
+
+        Args:
+            habit_id (int):
+                ID of a habit.
+            columnar (bool):
+                Whether the history of the habit is stored in columnar histories.
+
+        Returns:
+            HabitModel:
+                Habit model with its history.
+        """
+        return await self.__run(DataAccess.get_habit_by_id, habit_id, columnar)
+
+    async def get_histories_by_habit_id(self, habit_id: int, columnar: bool = False) -> Histories:
+        """
+        Get the histories of a habit, see DataAccess.get_histories_by_habit_id.
+
+        Args:
+            habit_id (int):
+                ID of a habit.
+            columnar (bool):
+                Whether the histories are stored in columnar histories.
+
+        Returns:
+            Histories:
+                Histories of the habit.
+        """
+        return await self.__run(DataAccess.get_histories_by_habit_id, habit_id, columnar)
+
+    async def get_all_habits(self, columnar: bool = False) -> Habits:
+        """
+        Get all habits with their histories, see DataAccess.get_all_habits.
+
+        Args:
+            columnar (bool):
+                Whether the histories of the habits are stored in columnar histories.
+
+        Returns:
+            Habits:
+                Dictionary of habit models.
+        """
+        return await self.__run(DataAccess.get_all_habits, columnar)
+
+    async def get_all_habits_by_periodicity(self, periodicity: str, columnar: bool = False) -> Habits:
+        """
+        Get all habits with a specific periodicity, see DataAccess.get_all_habits_by_periodicity.
+
+        Args:
+            periodicity (str):
+                Periodicity of the habits.
+            columnar (bool):
+                Whether the histories of the habits are stored in columnar histories.
+
+        Returns:
+            Habits:
+                Dictionary of habit models.
+        """
+        return await self.__run(DataAccess.get_all_habits_by_periodicity, periodicity, columnar)
+
+    async def create_new_habit(self, name: str, description: str, period: str, habit_from: str, habit_to: str) -> int:
+        """
+        Create a new habit, see DataAccess.create_new_habit.
+
+        Returns:
+            int:
+                ID of the new habit.
+        """
+        return await self.__run(DataAccess.create_new_habit, name, description, period, habit_from, habit_to)
+
+    async def delete_habit(self, habit_id: int) -> None:
+        """
+        Delete a habit and its histories, see DataAccess.delete_habit.
+
+        Args:
+            habit_id (int):
+                ID of a habit.
+        """
+        await self.__run(DataAccess.delete_habit, habit_id)
+
+    async def modify_habit(self, habit_id: int, name: str, description: str, period: str, habit_from: str,
+                           habit_to: str) -> int:
+        """
+        Modify a habit, see DataAccess.modify_habit.
+
+        Returns:
+            int:
+                ID of the modified habit.
+        """
+        return await self.__run(DataAccess.modify_habit, habit_id, name, description, period, habit_from, habit_to)
+
+    async def complete_habit(self, habit_id: int, complete_datetime: str) -> int:
+        """
+        Check off a habit, see DataAccess.complete_habit.
+
+        Args:
+            habit_id (int):
+                ID of a habit.
+            complete_datetime (str):
+                Datetime when the check-off took place.
+
+        Returns:
+            int:
+                ID of histories entry inserted last.
+        """
+        return await self.__run(DataAccess.complete_habit, habit_id, complete_datetime)
+
+    async def get_habit_summary(self, habit_id: int) -> HabitSummaryModel:
+        """
+        Get the summary of a habit, see DataAccess.get_habit_summary.
+
+        Args:
+            habit_id (int):
+                ID of a habit.
+
+        Returns:
+            HabitSummaryModel:
+                Summary of the habit.
+        """
+        return await self.__run(DataAccess.get_habit_summary, habit_id)
+
+    async def get_longest_run_streak(self) -> int:
+        """
+        Get the longest run streak over all habits, see DataAccess.get_longest_run_streak.
+
+        Returns:
+            int:
+                Longest run streak over all habits.
+        """
+        return await self.__run(DataAccess.get_longest_run_streak)
+
+    async def get_longest_run_streak_by_periodicity(self, periodicity: str) -> int:
+        """
+        Get the longest run streak over all habits with a specific periodicity.
+
+        Args:
+            periodicity (str):
+                Periodicity of the habits.
+
+        Returns:
+            int:
+                Longest run streak over all habits with the given periodicity.
+        """
+        return await self.__run(DataAccess.get_longest_run_streak_by_periodicity, periodicity)
+
+    async def check_habit_summaries(self) -> List[int]:
+        """
+        Check the habit summaries against the histories, see DataAccess.check_habit_summaries.
+
+        Returns:
+            List[int]:
+                IDs of habits whose summary does not match their history.
+        """
+        return await self.__run(DataAccess.check_habit_summaries)
+
+    async def rebuild_habit_summaries(self) -> None:
+        """
+        Rebuild the habit summaries from the histories, see DataAccess.rebuild_habit_summaries.
+        """
+        await self.__run(DataAccess.rebuild_habit_summaries)
@@ -0,0 +1,186 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from habit_tracker.data_access.data_access import DataAccess
+
+
+class CheckoffWriter:
+    """
+    CheckoffWriter coalesces check-offs of many callers into group transactions.
+
+    Check-offs are queued and written by a writer thread with a data access object of its own. The writer collects
+    check-offs until a batch is full or the oldest check-off has waited for the maximum delay and commits the whole batch
+    at once. Without delay, all check-offs queued while the previous batch was written are committed together. Each
+    caller gets a future resolving to the ID of the histories entry inserted last or the error of its check-off.
+    """
+
+    # Queued by close to stop the writer thread.
+    __STOP = object()
+
+    def __init__(self, *args, max_batch_size: int = 256, max_delay_ms: float = 0.0, **kwargs):
+        """
+        Start the writer thread and create its data access object.
+
+        Args:
+            *args:
+                Arguments passed to the DataAccess constructor.
+            max_batch_size (int):
+                Maximum number of check-offs committed in a single transaction.
+            max_delay_ms (float):
+                Maximum time in milliseconds a check-off waits for further check-offs before being committed, 0 to only
+                take check-offs already queued.
+            **kwargs:
+                Keyword arguments passed to the DataAccess constructor.
+        """
+        if max_batch_size < 1:
+            raise ValueError("Maximum batch size must be at least 1.")
+        self.__max_batch_size = max_batch_size
+        self.__max_delay = max_delay_ms / 1000.0
+        self.__queue = queue.Queue()
+        self.__closed = False
+        self.__lock = threading.Lock()
+        self.__number_batches = 0
+        started = Future()
+        self.__thread = threading.Thread(
+            target=self.__write, args=(args, kwargs, started), name="habit-tracker-checkoff-writer", daemon=True
+        )
+        self.__thread.start()
+        # Errors on creating the data access object are raised to the creator of the writer.
+        started.result()
+
+    def __enter__(self) -> "CheckoffWriter":
+        """
+        Enters the runtime context of the check-off writer.
+
+        Returns:
+            CheckoffWriter:
+                The check-off writer itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits the runtime context of the check-off writer and closes it.
+        """
+        self.close()
+
+    @property
+    def number_batches(self) -> int:
+        """
+        Gets the number of group transactions committed so far.
+
+        Returns:
+            int:
+                Number of batches written.
+        """
+        return self.__number_batches
+
+    def submit(self, habit_id: int, complete_datetime: str) -> Future:
+        """
+        Queue the check-off of a habit.
+
+        Args:
+            habit_id (int):
+                ID of a habit to add a marker in the habit history.
+            complete_datetime (str):
+                Datetime when the check-off took place.
+
+        Returns:
+            Future:
+                Future resolving to the ID of histories entry inserted last once the batch is committed.
+        """
+        future = Future()
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError("Check-off writer is closed.")
+            self.__queue.put((habit_id, complete_datetime, future))
+        return future
+
+    def complete_habit(self, habit_id: int, complete_datetime: str) -> int:
+        """
+        Check off a habit and wait until its batch is committed.
+
+        Args:
+            habit_id (int):
+                ID of a habit to add a marker in the habit history.
+            complete_datetime (str):
+                Datetime when the check-off took place.
+
+        Returns:
+            int:
+                ID of histories entry inserted last.
+        """
+        return self.submit(habit_id, complete_datetime).result()
+
+    def close(self) -> None:
+        """
+        Write all queued check-offs, stop the writer thread and close its data access object.
+
+        Closing more than once has no effect.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__queue.put(self.__STOP)
+        self.__thread.join()
+
+    def __write(self, args: tuple, kwargs: dict, started: Future) -> None:
+        """
+        Collect queued check-offs into batches and write them, only to be run in the writer thread.
+
+        Args:
+            args (tuple):
+                Arguments passed to the DataAccess constructor.
+            kwargs (dict):
+                Keyword arguments passed to the DataAccess constructor.
+            started (Future):
+                Future resolved once the data access object is created.
+        """
+        try:
+            data_access = DataAccess(*args, **kwargs)
+        except Exception as error:
+            started.set_exception(error)
+            return
+        started.set_result(True)
+        with data_access:
+            stopped = False
+            while not stopped:
+                batch = [self.__queue.get()]
+                if batch[0] is self.__STOP:
+                    break
+                deadline = time.monotonic() + self.__max_delay
+                while len(batch) < self.__max_batch_size:
+                    try:
+                        item = self.__queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if item is self.__STOP:
+                        stopped = True
+                        break
+                    batch.append(item)
+                self.__write_batch(data_access, batch)
+
+    def __write_batch(self, data_access: DataAccess, batch: list) -> None:
+        """
+        Write a batch of check-offs in a single transaction and resolve their futures.
+
+        Args:
+            data_access (DataAccess):
+                Data access object of the writer thread.
+            batch (list):
+                Queued tuples of habit ID, datetime and future.
+        """
+        try:
+            results = data_access.complete_habits([(item[0], item[1]) for item in batch])
+        except Exception as error:
+            results = [error] * len(batch)
+        else:
+            self.__number_batches += 1
+        for (_, _, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,184 @@
+import sqlite3
+import threading
+import weakref
+from typing import List
+
+from habit_tracker.data_access.connection_profile import ConnectionProfile
+
+
+class _ThreadConnection:
+    """
+    _ThreadConnection holds the pooled connection of a thread, it lives only as long as the thread.
+    """
+
+    __slots__ = ("connection", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+
+class ConnectionPool:
+    """
+    ConnectionPool keeps one SQlite connection per thread and database, shared by all pooled data access objects.
+
+    Pools are registered per process by database file, connection profile and statement cache size. A connection is
+    opened and its connection profile applied the first time a thread asks for it and is reused afterwards, hence
+    long-running processes do not open a connection per operation. The connection of a thread is closed and removed
+    from the pool when the thread exits, hence threads coming and going do not leave connections open.
+    """
+
+    __pools = dict()
+    __pools_lock = threading.Lock()
+
+    def __init__(self, path: str, profile: ConnectionProfile, cached_statements: int = 128):
+        """
+        Sets all attributes of a connection pool.
+
+        Args:
+            path (str):
+                Path of the database file.
+            profile (ConnectionProfile):
+                Connection profile applied to each connection.
+            cached_statements (int):
+                Number of prepared statements each connection keeps in its statement cache.
+        """
+        self.__path = path
+        self.__profile = profile
+        self.__cached_statements = cached_statements
+        self.__local = threading.local()
+        self.__connections = list()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def get(cls, path: str, profile: ConnectionProfile, cached_statements: int = 128) -> "ConnectionPool":
+        """
+        Get the connection pool of a database file, connection profile and statement cache size.
+
+        The pool is created on first use and shared within the process afterwards.
+
+        Args:
+            path (str):
+                Path of the database file.
+            profile (ConnectionProfile):
+                Connection profile applied to each connection.
+            cached_statements (int):
+                Number of prepared statements each connection keeps in its statement cache.
+
+        Returns:
+            ConnectionPool:
+                Connection pool shared within the process.
+        """
+        key = (path, tuple(profile.pragmas()), cached_statements)
+        with cls.__pools_lock:
+            pool = cls.__pools.get(key)
+            if pool is None:
+                pool = cls(path, profile, cached_statements)
+                cls.__pools[key] = pool
+        return pool
+
+    @classmethod
+    def connect(cls, path: str, profile: ConnectionProfile, cached_statements: int = 128,
+                check_same_thread: bool = True) -> sqlite3.Connection:
+        """
+        Open a connection to a database file and apply a connection profile.
+
+        Args:
+            path (str):
+                Path of the database file.
+            profile (ConnectionProfile):
+                Connection profile applied to the connection.
+            cached_statements (int):
+                Number of prepared statements the connection keeps in its statement cache.
+            check_same_thread (bool):
+                Whether only the creating thread may use the connection.
+
+        Returns:
+            sqlite3.Connection:
+                Connection with the connection profile applied.
+        """
+        connection = sqlite3.connect(path, cached_statements=cached_statements, check_same_thread=check_same_thread)
+        for pragma in profile.pragmas():
+            connection.execute(pragma)
+        return connection
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Close all connections of all connection pools of the process and forget the pools.
+        """
+        with cls.__pools_lock:
+            pools = list(cls.__pools.values())
+            cls.__pools.clear()
+        for pool in pools:
+            pool.close()
+
+    @property
+    def path(self) -> str:
+        """
+        Gets the path of the database file.
+
+        Returns:
+            str:
+                Path of the database file.
+        """
+        return self.__path
+
+    @property
+    def connections(self) -> List[sqlite3.Connection]:
+        """
+        Gets the connections opened by the pool, one per thread.
+
+        Returns:
+            List[sqlite3.Connection]:
+                Open connections of the pool.
+        """
+        with self.__lock:
+            return list(self.__connections)
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get the connection of the calling thread, it is opened on first use.
+
+        Returns:
+            sqlite3.Connection:
+                Connection of the calling thread.
+        """
+        thread_connection = getattr(self.__local, "thread_connection", None)
+        if thread_connection is None:
+            # Each connection is only used by its thread, it may however be closed by any thread.
+            connection = self.connect(self.__path, self.__profile, self.__cached_statements, check_same_thread=False)
+            thread_connection = _ThreadConnection(connection)
+            # The thread-local holder is released when the thread exits, the connection is closed along with it.
+            weakref.finalize(thread_connection, self.__release, connection)
+            self.__local.thread_connection = thread_connection
+            with self.__lock:
+                self.__connections.append(connection)
+        return thread_connection.connection
+
+    def __release(self, connection: sqlite3.Connection) -> None:
+        """
+        Close the connection of a thread that exited and remove it from the pool.
+
+        Args:
+            connection (sqlite3.Connection):
+                Connection of the thread that exited.
+        """
+        with self.__lock:
+            if connection in self.__connections:
+                self.__connections.remove(connection)
+        connection.close()
+
+    def close(self) -> None:
+        """
+        Close all connections of the pool.
+
+        Threads asking for a connection afterwards get a new one.
+        """
+        with self.__lock:
+            connections = self.__connections
+            self.__connections = list()
+            local, self.__local = self.__local, threading.local()
+        # Releasing the holders of the calling thread closes their connections, hence not while holding the lock.
+        del local
+        for connection in connections:
+            connection.close()
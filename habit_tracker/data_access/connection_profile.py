@@ -0,0 +1,150 @@
+from typing import List
+
+
+class ConnectionProfile:
+    """
+    ConnectionProfile is a set of PRAGMA settings applied to a SQlite connection.
+
+    A connection profile determines journaling, durability and caching of a connection. Settings that are not given keep
+    the SQlite default.
+    """
+
+    def __init__(self, name: str, journal_mode: str = None, synchronous: str = None, cache_size: int = None,
+                 mmap_size: int = None, temp_store: str = None):
+        """
+        Sets all PRAGMA settings of the connection profile.
+
+        Args:
+            name (str):
+                Name of the connection profile.
+            journal_mode (str):
+                Journal mode, eg DELETE, WAL.
+            synchronous (str):
+                Synchronous level, eg OFF, NORMAL, FULL.
+            cache_size (int):
+                Page cache size, in pages if positive and in KiB if negative.
+            mmap_size (int):
+                Maximum number of bytes of the database file accessed by memory-mapped I/O.
+            temp_store (str):
+                Storage of temporary tables and indexes, eg DEFAULT, FILE, MEMORY.
+        """
+        self.__name = name
+        self.__journal_mode = journal_mode
+        self.__synchronous = synchronous
+        self.__cache_size = cache_size
+        self.__mmap_size = mmap_size
+        self.__temp_store = temp_store
+
+    @property
+    def name(self) -> str:
+        """
+        Gets the name of the connection profile.
+
+        Returns:
+            str:
+                Name of the connection profile.
+        """
+        return self.__name
+
+    @property
+    def journal_mode(self) -> str:
+        """
+        Gets the journal mode of the connection profile.
+
+        Returns:
+            str:
+                Journal mode or None for the SQlite default.
+        """
+        return self.__journal_mode
+
+    @property
+    def synchronous(self) -> str:
+        """
+        Gets the synchronous level of the connection profile.
+
+        Returns:
+            str:
+                Synchronous level or None for the SQlite default.
+        """
+        return self.__synchronous
+
+    @property
+    def cache_size(self) -> int:
+        """
+        Gets the page cache size of the connection profile.
+
+        Returns:
+            int:
+                Page cache size or None for the SQlite default.
+        """
+        return self.__cache_size
+
+    @property
+    def mmap_size(self) -> int:
+        """
+        Gets the memory-mapped I/O size of the connection profile.
+
+        Returns:
+            int:
+                Memory-mapped I/O size in bytes or None for the SQlite default.
+        """
+        return self.__mmap_size
+
+    @property
+    def temp_store(self) -> str:
+        """
+        Gets the storage of temporary tables and indexes of the connection profile.
+
+        Returns:
+            str:
+                Storage of temporary tables and indexes or None for the SQlite default.
+        """
+        return self.__temp_store
+
+    def pragmas(self) -> List[str]:
+        """
+        Get the PRAGMA statements applying the connection profile to a connection.
+
+        Returns:
+            List[str]:
+                PRAGMA statements for all settings that are given.
+        """
+        settings = [
+            ("journal_mode", self.__journal_mode),
+            ("synchronous", self.__synchronous),
+            ("cache_size", self.__cache_size),
+            ("mmap_size", self.__mmap_size),
+            ("temp_store", self.__temp_store)
+        ]
+        return [f"PRAGMA {pragma} = {value};" for pragma, value in settings if value is not None]
+
+    @classmethod
+    def by_name(cls, name: str) -> "ConnectionProfile":
+        """
+        Get one of the predefined connection profiles given its name.
+
+        Args:
+            name (str):
+                Name of the predefined connection profile.
+
+        Returns:
+            ConnectionProfile:
+                Predefined connection profile with the given name.
+        """
+        if name not in PROFILES:
+            raise ValueError(f"Connection profile '{name}' does not exist, choose one of: {', '.join(PROFILES)}.")
+        return PROFILES[name]
+
+
+PROFILE_ENVIRONMENT_VARIABLE = "HABIT_TRACKER_DB_PROFILE"
+
+PROFILES = {
+    # SQlite defaults: rollback journal and a sync on every commit.
+    "default": ConnectionProfile("default"),
+    # Readers do not block the writer and commits only sync the write-ahead log on checkpoints.
+    "wal": ConnectionProfile("wal", journal_mode="WAL", synchronous="NORMAL", cache_size=-65536, mmap_size=268435456,
+                             temp_store="MEMORY"),
+    # No syncs at all, committed transactions can be lost on power failure but not on application crashes.
+    "fast": ConnectionProfile("fast", journal_mode="WAL", synchronous="OFF", cache_size=-262144, mmap_size=1073741824,
+                              temp_store="MEMORY"),
+}
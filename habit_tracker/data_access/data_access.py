@@ -1,29 +1,123 @@
+import functools
+import os
 import sqlite3
-from datetime import datetime, timedelta
-
+import threading
+from contextlib import nullcontext
+from datetime import datetime
+from types import SimpleNamespace
+from typing import BinaryIO, Dict, Iterator, List, TextIO, Tuple, Union
+
+from habit_tracker.data_access import queries
+from habit_tracker.data_access.connection_pool import ConnectionPool
+from habit_tracker.data_access.connection_profile import ConnectionProfile, PROFILE_ENVIRONMENT_VARIABLE
+from habit_tracker.data_access.migrations import MIGRATIONS, LATEST_VERSION
+from habit_tracker.data_access.period import Period
+from habit_tracker.data_access.records import Records
 from habit_tracker.data_access.model.habits import Habits
 from habit_tracker.data_access.model.habit_model import HabitModel
+from habit_tracker.data_access.model.columnar_histories import ColumnarHistories
+from habit_tracker.data_access.model.habit_summary_model import HabitSummaryModel
 from habit_tracker.data_access.model.histories import Histories
 from habit_tracker.data_access.model.history_model import HistoryModel
 
 
+def serialized(method):
+    """
+    Decorate a method of DataAccess writing to the database to hold the write lock of the data access object.
+
+    Args:
+        method:
+            Method writing to the database.
+
+    Returns:
+        Method holding the write lock while writing.
+    """
+    @functools.wraps(method)
+    def serialized_method(data_access, *args, **kwargs):
+        with data_access.write_lock:
+            return method(data_access, *args, **kwargs)
+    return serialized_method
+
+
 class DataAccess:
     """
     Manage all data in a SQlite database.
 
     All data is stored in a SQlite database and this class takes care about reading from, inserting into, modifying and
-    deleting data in the database.
+    deleting data in the database. Data access objects are context managers closing their connection on exit.
+
+    In thread-safe mode a data access object can be shared by threads, each thread uses a connection and cursor of its
+    own and writes are serialized per database file.
     """
 
-    def __init__(self, db_name: str = "habit_tracker"):
+    # Bounds of check-off epochs used for ranges of time without start or end.
+    __MIN_EPOCH = -2 ** 63
+    __MAX_EPOCH = 2 ** 63 - 1
+
+    # Habit IDs are assigned from one on, hence pages after this habit ID start at the first habit.
+    __BEFORE_FIRST_HABIT_ID = 0
+
+    # Paths of database files whose schema has been migrated to the latest version within this process.
+    __migrated_paths = set()
+    __migrated_paths_lock = threading.Lock()
+
+    # Locks serializing writes of thread-safe data access objects per database file.
+    __write_locks = dict()
+    __write_locks_lock = threading.Lock()
+
+    def __init__(self, db_name: str = "habit_tracker", cached_statements: int = 128, migrate_schema: bool = True,
+                 profile=None, pooled: bool = False, thread_safe: bool = False):
         """
         Create SQlite database and get connection and cursor.
 
-        Constructor creates a SQlite database, connects to it and gets cursor.
+        Constructor creates a SQlite database, connects to it, applies the connection profile and gets cursor. Unless
+        disabled, the database schema is migrated to the latest version once per database file and process.
+
+        Args:
+            db_name (str):
+                Name of the database file in the db directory without file extension.
+            cached_statements (int):
+                Number of prepared statements the connection keeps in its statement cache.
+            migrate_schema (bool):
+                Whether to migrate the database schema to the latest version on connecting.
+            profile (Union[str, ConnectionProfile]):
+                Connection profile or name of a predefined connection profile, defaults to the profile named in the
+                environment variable HABIT_TRACKER_DB_PROFILE or the default profile.
+            pooled (bool):
+                Whether to use the connection of the calling thread from the connection pool of the process instead of
+                opening a connection of its own.
+            thread_safe (bool):
+                Whether the data access object may be shared by threads, implies pooled connections.
         """
-        self.__connection = sqlite3.connect(f"db/{db_name}.db")
-        self.__cursor = self.__connection.cursor()
-        self.create_tables()
+        self.__local = threading.local() if thread_safe else SimpleNamespace()
+        self.__local.connection = None
+        self.__local.cursor = None
+        self.__pooled = pooled or thread_safe
+        self.__thread_safe = thread_safe
+        self.__closed = False
+        if profile is None:
+            profile = os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, "default")
+        if not isinstance(profile, ConnectionProfile):
+            profile = ConnectionProfile.by_name(profile)
+        self.__profile = profile
+        self.__path = os.path.abspath(f"db/{db_name}.db")
+        # A database file deleted since its schema was migrated is created anew on connecting.
+        if not os.path.exists(self.__path):
+            self.__set_migrated(False)
+        if thread_safe:
+            with DataAccess.__write_locks_lock:
+                self.__write_lock = DataAccess.__write_locks.setdefault(self.__path, threading.RLock())
+        else:
+            self.__write_lock = nullcontext()
+        if self.__pooled:
+            self.__pool = ConnectionPool.get(self.__path, profile, cached_statements)
+            self.__local.connection = self.__pool.connection()
+        else:
+            self.__pool = None
+            self.__local.connection = ConnectionPool.connect(self.__path, profile, cached_statements)
+        self.__local.cursor = self.__local.connection.cursor()
+        if migrate_schema and self.__path not in DataAccess.__migrated_paths:
+            self.create_tables()
 
     def __del__(self):
         """
@@ -31,150 +125,445 @@ class DataAccess:
 
         Destructor closes the database connection when object is destroyed.
         """
-        self.__connection.close()
+        try:
+            self.close()
+        except sqlite3.ProgrammingError:
+            # Destroyed in another thread than the one it was created in, the connection is released with it.
+            pass
+
+    def __enter__(self) -> "DataAccess":
+        """
+        Enters the runtime context of the data access object.
+
+        Returns:
+            DataAccess:
+                The data access object itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits the runtime context of the data access object and closes it.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the cursor and, unless it belongs to the connection pool, the connection.
+
+        Closing more than once has no effect. In thread-safe mode the cursor of the calling thread is closed and other
+        threads cannot use the data access object anymore.
+        """
+        self.__closed = True
+        local = self.__local
+        if local.cursor is not None:
+            local.cursor.close()
+            local.cursor = None
+        if local.connection is not None:
+            if not self.__pooled:
+                local.connection.close()
+            local.connection = None
+
+    @property
+    def __connection(self) -> sqlite3.Connection:
+        """
+        Gets the connection of the calling thread, in thread-safe mode it is taken from the pool on first use.
+
+        Returns:
+            sqlite3.Connection:
+                Connection of the calling thread.
+        """
+        if self.__thread_safe and not self.__closed and getattr(self.__local, "connection", None) is None:
+            self.__local.connection = self.__pool.connection()
+            self.__local.cursor = self.__local.connection.cursor()
+        return getattr(self.__local, "connection", None)
+
+    @property
+    def __cursor(self) -> sqlite3.Cursor:
+        """
+        Gets the cursor of the calling thread, in thread-safe mode it is created on first use.
+
+        Returns:
+            sqlite3.Cursor:
+                Cursor of the calling thread.
+        """
+        if self.__thread_safe and not self.__closed and getattr(self.__local, "cursor", None) is None:
+            self.__local.connection = self.__pool.connection()
+            self.__local.cursor = self.__local.connection.cursor()
+        return getattr(self.__local, "cursor", None)
 
     @property
     def cursor(self) -> sqlite3.Cursor:
         return self.__cursor
 
+    @property
+    def write_lock(self):
+        """
+        Gets the lock serializing writes, shared by all thread-safe data access objects of a database file.
+
+        Returns:
+            Context manager holding the lock, without effect unless in thread-safe mode.
+        """
+        return self.__write_lock
+
+    @property
+    def thread_safe(self) -> bool:
+        """
+        Gets whether the data access object may be shared by threads.
+
+        Returns:
+            bool:
+                Whether the data access object is thread-safe.
+        """
+        return self.__thread_safe
+
+    @property
+    def pooled(self) -> bool:
+        """
+        Gets whether the connection belongs to the connection pool of the process.
+
+        Returns:
+            bool:
+                Whether the connection is pooled.
+        """
+        return self.__pooled
+
+    @property
+    def profile(self) -> ConnectionProfile:
+        """
+        Gets the connection profile applied to the connection.
+
+        Returns:
+            ConnectionProfile:
+                Connection profile of the connection.
+        """
+        return self.__profile
+
+    @property
+    def schema_version(self) -> int:
+        """
+        Gets the version of the database schema.
+
+        Returns:
+            int:
+                Version of the database schema, 0 for databases that have never been migrated.
+        """
+        return self.__cursor.execute(queries.SELECT_SCHEMA_VERSION).fetchone()[0]
+
+    @serialized
     def drop_tables(self) -> None:
         """
         Deletes database tables.
 
-        Both database tables habits and histories get deleted.
+        The database tables habits, histories and habit summaries get deleted and the schema version is reset.
         """
-        self.__cursor.execute("DROP TABLE histories;")
+        self.__cursor.execute(queries.DROP_HABIT_SUMMARY_TABLE)
         self.__connection.commit()
-        self.__cursor.execute("DROP TABLE habits;")
+        self.__cursor.execute(queries.DROP_HISTORY_TABLE)
         self.__connection.commit()
+        self.__cursor.execute(queries.DROP_HABIT_TABLE)
+        self.__connection.commit()
+        self.__cursor.execute(queries.UPDATE_SCHEMA_VERSION.format(version=0))
+        self.__connection.commit()
+        self.__set_migrated(False)
 
     def create_tables(self) -> None:
         """
-        Creates habits and histories tables in Database.
+        Creates habits and histories tables and their indexes in Database.
 
-        If not already existing, the database tables habits and histories get deleted.
+        If not already existing, the database tables habits and histories get created by migrating the database schema
+        to the latest version.
         """
-        create_habit_table = """
-            CREATE TABLE IF NOT EXISTS habits (
-                [habit_id] INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, 
-                [habit_name] VARCHAR(255) NOT NULL,
-                [habit_specification] VARCHAR(255),
-                [habit_creation] DATETIME NOT NULL,
-                [habit_periodicity_granularity] VARCHAR(255) NOT NULL,
-                [habit_periodicity_from] DATE NOT NULL,
-                [habit_periodicity_to] DATE NOT NULL
-            );
+        self.migrate()
+
+    @serialized
+    def migrate(self, target_version: int = LATEST_VERSION) -> int:
         """
-        self.__cursor.execute(create_habit_table)
-        self.__connection.commit()
-        create_history_table = """
-            CREATE TABLE IF NOT EXISTS histories (
-                [history_id] INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                [habit_id] INTEGER NOT NULL,
-                [checkoff_datetime] DATETIME NOT NULL,
-                [checked_off] INTEGER NOT NULL,
-                FOREIGN KEY ([habit_id]) REFERENCES "habits" ([habit_id])
-            );
-        """
-        self.__cursor.execute(create_history_table)
-        self.__connection.commit()
+        Migrate the database schema to a given version.
+
+        All migrations between the current and the target version are applied in order, each of them in its own
+        transaction together with updating the schema version.
+
+        Args:
+            target_version (int):
+                Version the database schema is to be migrated to, defaults to the latest version.
 
+        Returns:
+            int:
+                Version of the database schema after migrating.
+        """
+        current_version = self.schema_version
+        if target_version < current_version:
+            raise ValueError(f"Database schema version {current_version} cannot be downgraded to {target_version}.")
+        if target_version > LATEST_VERSION:
+            raise ValueError(f"Database schema version {target_version} does not exist.")
+        for migration in MIGRATIONS:
+            if current_version < migration.version <= target_version:
+                try:
+                    self.__cursor.execute(queries.BEGIN_TRANSACTION)
+                    for statement in migration.statements:
+                        self.__cursor.execute(statement)
+                    self.__cursor.execute(queries.UPDATE_SCHEMA_VERSION.format(version=migration.version))
+                    self.__connection.commit()
+                except sqlite3.Error:
+                    self.__connection.rollback()
+                    raise
+                current_version = migration.version
+        self.__set_migrated(current_version == LATEST_VERSION)
+        return current_version
+
+    def __set_migrated(self, migrated: bool) -> None:
+        """
+        Remember whether the schema of the database file is migrated to the latest version within this process.
+
+        Args:
+            migrated (bool):
+                Whether the schema is at the latest version.
+        """
+        with DataAccess.__migrated_paths_lock:
+            if migrated:
+                DataAccess.__migrated_paths.add(self.__path)
+            else:
+                DataAccess.__migrated_paths.discard(self.__path)
+
+    @serialized
     def insert_history_data_by_model(self, history_model: HistoryModel) -> None:
         """
         A history entry is created.
 
-        Inserts a history entry in histories database table.
+        Inserts a history entry in histories database table and updates the summary of its habit.
 
         Args:
             history_model (HistoryModel):
                 History model with data to be inserted into database table histories.
         """
-        insert_history_into_histories = f"""
-            INSERT INTO histories (
-                [habit_id],
-                [checkoff_datetime],
-                [checked_off]
-            ) VALUES (
-                {history_model.habit_id},
-                '{history_model.checkoff_datetime}',
-                {history_model.checked_off}
-            );
-        """
-        self.__cursor.execute(insert_history_into_histories)
+        self.__cursor.execute(
+            queries.INSERT_HISTORY,
+            (history_model.habit_id, history_model.checkoff_datetime, history_model.checked_off)
+        )
+        self.__cursor.execute(
+            queries.INSERT_HABIT_SUMMARY_OF_HABIT_FROM_HISTORIES, {"habit_id": history_model.habit_id}
+        )
         self.__connection.commit()
 
+    @serialized
     def insert_habit_data_by_model(self, habit_model: HabitModel) -> None:
         """
         A habit entry is created.
 
-        Inserts a habit entry in habits database table.
+        Inserts a habit entry in habits database table and its history entries in histories database table and
+        updates the summary of the habit.
 
         Args:
             habit_model (HabitModel):
                 Habit model with data to be inserted into database table habits.
         """
-        insert_habit_into_habits = f"""
-            INSERT INTO habits (
-                [habit_name],
-                [habit_specification],
-                [habit_creation],
-                [habit_periodicity_granularity],
-                [habit_periodicity_from],
-                [habit_periodicity_to]
-            ) VALUES (
-                '{habit_model.habit_name}',
-                '{habit_model.habit_specification}',
-                '{habit_model.habit_creation}',
-                '{habit_model.habit_periodicity_granularity}',
-                '{habit_model.habit_periodicity_from}',
-                '{habit_model.habit_periodicity_to}'
-            );
-        """
-        self.__cursor.execute(insert_habit_into_habits)
+        self.__cursor.execute(
+            queries.INSERT_HABIT,
+            (
+                habit_model.habit_name,
+                habit_model.habit_specification,
+                habit_model.habit_creation,
+                habit_model.habit_periodicity_granularity,
+                habit_model.habit_periodicity_from,
+                habit_model.habit_periodicity_to
+            )
+        )
+        # Histories refer to the habit ID of the model, which is the inserted habit ID for a database filled in order.
+        habit_ids = {self.__cursor.lastrowid}
+        habit_ids.update(history_model.habit_id for history_model in habit_model.habit_history.histories.values())
+        self.__cursor.executemany(
+            queries.INSERT_HISTORY,
+            (
+                (history_model.habit_id, history_model.checkoff_datetime, history_model.checked_off)
+                for history_model in habit_model.habit_history.histories.values()
+            )
+        )
+        for habit_id in habit_ids:
+            self.__cursor.execute(queries.INSERT_HABIT_SUMMARY_OF_HABIT_FROM_HISTORIES, {"habit_id": habit_id})
         self.__connection.commit()
-        for history_id in habit_model.habit_history.histories:
-            self.insert_history_data_by_model(habit_model.habit_history.histories[history_id])
 
+    @serialized
     def initialize_db(self, habits: Habits) -> None:
         """
         Initialize database by creating a database table and inserting dummy data into it.
 
         A database table is created and filled with dummy data for pre-defined habits on first usage of CLI application.
         """
-        result_habits = self.__cursor.execute("SELECT * FROM habits;")
-        result_histories = self.__cursor.execute("SELECT * FROM histories;")
-        if len(result_habits.fetchall()) == 0 and len(result_histories.fetchall()) == 0:
+        has_habits = self.__cursor.execute(queries.SELECT_ANY_HABIT).fetchone() is not None
+        has_histories = self.__cursor.execute(queries.SELECT_ANY_HISTORY).fetchone() is not None
+        if not has_habits and not has_histories:
             for habit_id in habits.habits:
                 self.insert_habit_data_by_model(habits.habits[habit_id])
 
-    def get_habit_by_id(self, habit_id: int) -> HabitModel:
+    @serialized
+    def bulk_import(self, stream: Union[TextIO, BinaryIO], file_format: str = "csv", batch_size: int = 10000) \
+            -> Tuple[int, int]:
+        """
+        Import habits and histories from a record file within a single transaction.
+
+        Records are parsed one at a time and inserted in batches. The indexes are dropped before and built once after
+        loading instead of being updated per row, and the habit summaries are rebuilt from the histories. If any record
+        fails, nothing is imported.
+
+        Args:
+            stream (Union[TextIO, BinaryIO]):
+                Text stream of a record file, binary stream for binary formats, see Records for its layout.
+            file_format (str):
+                Format of the record file, one of Records.FORMATS.
+            batch_size (int):
+                Number of rows inserted at once.
+
+        Returns:
+            Tuple[int, int]:
+                Numbers of habits and histories imported.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+        habit_rows = list()
+        history_rows = list()
+        number_habits = 0
+        number_histories = 0
+        # Lengths of a period in seconds of the habits histories refer to, by habit ID.
+        seconds_per_period = dict()
+        self.__cursor.execute(queries.BEGIN_IMMEDIATE_TRANSACTION)
+        try:
+            self.__cursor.execute(queries.DROP_HISTORY_CHECKOFF_EPOCH_INDEX)
+            self.__cursor.execute(queries.DROP_HABIT_PERIODICITY_INDEX)
+            for record in Records.read(stream, file_format):
+                record_type = record.get("record_type")
+                if record_type == Records.HABIT:
+                    if record.get("habit_creation") is None:
+                        record["habit_creation"] = datetime.now().strftime(Period.DATETIME_FORMAT)
+                    habit_rows.append(tuple(record.get(field) for field in Records.HABIT_FIELDS))
+                    seconds_per_period[record["habit_id"]] = Period.seconds_per_period(
+                        record.get("habit_periodicity_granularity")
+                    )
+                    if len(habit_rows) == batch_size:
+                        self.__cursor.executemany(queries.INSERT_HABIT_RECORD, habit_rows)
+                        number_habits += len(habit_rows)
+                        habit_rows.clear()
+                elif record_type == Records.HISTORY:
+                    habit_id = record.get("habit_id")
+                    if habit_id not in seconds_per_period:
+                        habit = self.__cursor.execute(queries.SELECT_PERIODICITY_OF_HABIT, (habit_id,)).fetchone()
+                        if habit is None:
+                            raise NameError(f"Habit with ID {habit_id} does not exist.")
+                        seconds_per_period[habit_id] = Period.seconds_per_period(habit[0])
+                    history_rows.append((
+                        record.get("history_id"),
+                        habit_id,
+                        record.get("checkoff_datetime"),
+                        record.get("checked_off"),
+                        seconds_per_period[habit_id]
+                    ))
+                    if len(history_rows) == batch_size:
+                        self.__cursor.executemany(queries.INSERT_HISTORY_RECORD, history_rows)
+                        number_histories += len(history_rows)
+                        history_rows.clear()
+                else:
+                    raise ValueError(f"Unknown record type {record_type}.")
+            self.__cursor.executemany(queries.INSERT_HABIT_RECORD, habit_rows)
+            self.__cursor.executemany(queries.INSERT_HISTORY_RECORD, history_rows)
+            number_habits += len(habit_rows)
+            number_histories += len(history_rows)
+            invalid_history = self.__cursor.execute(queries.SELECT_HISTORY_WITHOUT_EPOCH).fetchone()
+            if invalid_history is not None:
+                raise ValueError(f"Check-off datetime {invalid_history[0]} is invalid.")
+            self.__cursor.execute(queries.CREATE_HISTORY_CHECKOFF_EPOCH_INDEX)
+            self.__cursor.execute(queries.CREATE_HABIT_PERIODICITY_INDEX)
+            self.__cursor.execute(queries.DELETE_HABIT_SUMMARIES)
+            self.__cursor.execute(queries.INSERT_HABIT_SUMMARIES_FROM_HISTORIES)
+            self.__connection.commit()
+        except Exception:
+            self.__connection.rollback()
+            raise
+        return number_habits, number_histories
+
+    def export(self, stream: Union[TextIO, BinaryIO], file_format: str = "csv", since: datetime = None,
+               until: datetime = None, periodicity: str = None, batch_size: int = 1000) -> Tuple[int, int]:
+        """
+        Export habits and histories to a record file without fetching all of them at once.
+
+        Rows are fetched in batches with a cursor of its own and written batch by batch, hence only one batch is held
+        in memory. Habits and histories are read within one read transaction and are hence consistent with each other.
+
+        Args:
+            stream (Union[TextIO, BinaryIO]):
+                Text stream of a record file, binary stream for binary formats, see Records for its layout.
+            file_format (str):
+                Format of the record file, one of Records.FORMATS.
+            since (datetime):
+                Start of the range of check-off time of the histories, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time of the histories, exclusive, or None for no end.
+            periodicity (str):
+                Periodicity of the habits, eg daily, weekly, or None for all habits.
+            batch_size (int):
+                Number of rows fetched and written at once.
+
+        Returns:
+            Tuple[int, int]:
+                Numbers of habits and histories exported.
+        """
+        if file_format not in Records.FORMATS:
+            raise ValueError(f"Unknown record format {file_format}, expected one of {', '.join(Records.FORMATS)}.")
+        parameters = self.__window(since, until)
+        parameters["periodicity"] = periodicity
+        numbers = {Records.HABIT: 0, Records.HISTORY: 0}
+        own_transaction = not self.__connection.in_transaction
+        cursor = self.__connection.cursor()
+        cursor.arraysize = batch_size
+        try:
+            if own_transaction:
+                cursor.execute(queries.BEGIN_TRANSACTION)
+            Records.write_header(stream, file_format)
+            for record_type, query in ((Records.HABIT, queries.SELECT_HABIT_RECORDS),
+                                       (Records.HISTORY, queries.SELECT_HISTORY_RECORDS)):
+                cursor.execute(query, parameters)
+                rows = cursor.fetchmany()
+                while rows:
+                    Records.write(stream, file_format, record_type, rows)
+                    numbers[record_type] += len(rows)
+                    rows = cursor.fetchmany()
+        finally:
+            cursor.close()
+            if own_transaction:
+                self.__connection.rollback()
+        return numbers[Records.HABIT], numbers[Records.HISTORY]
+
+    def get_habit_by_id(self, habit_id: int, columnar: bool = False, since: datetime = None,
+                        until: datetime = None) -> HabitModel:
         """
         Get a specific habit given its ID from the database and return a habit model.
 
         Fetches habit data of a habit with the given ID from database and create and fill a habit model with the data.
+        A window of check-off time restricts the history to the entries within the window.
 
         Args:
             habit_id (int):
                 ID of a habit that need to be fetched from database.
+            columnar (bool):
+                Whether the history of the habit is stored in columnar histories instead of a dictionary.
+            since (datetime):
+                Start of the range of check-off time of the history, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time of the history, exclusive, or None for no end.
 
         Returns:
             HabitModel:
                 A habit model containing the data of a habit fetched from the database.
         """
-        self.__cursor.execute(f"SELECT * FROM habits WHERE [habit_id] = {habit_id};")
+        self.__cursor.execute(queries.SELECT_HABIT_BY_ID, (habit_id,))
         row = self.__cursor.fetchone()
-        habit_model = HabitModel()
-        if row is not None:
-            habit_model.habit_id = row[0]
-            habit_model.habit_name = row[1]
-            habit_model.habit_specification = row[2]
-            habit_model.habit_creation = row[3]
-            habit_model.habit_periodicity_granularity = row[4]
-            habit_model.habit_periodicity_from = row[5]
-            habit_model.habit_periodicity_to = row[6]
-            habit_model.habit_history = self.get_histories_by_habit_id(habit_id)
-        else:
+        if row is None:
             raise NameError("Habit ID does not exist.")
+        habit_model = HabitModel.from_row(row)
+        if columnar:
+            self.__execute_histories_of_habit(habit_id, since, until)
+            habit_model.habit_history = ColumnarHistories.from_rows(habit_id, row[4], self.__cursor)
+        else:
+            habit_model.habit_history = self.get_histories_by_habit_id(habit_id, since=since, until=until)
         return habit_model
 
     def get_history_by_id(self, history_id: int) -> HistoryModel:
@@ -191,19 +580,14 @@ class DataAccess:
             HistoryModel:
                 A history model containing the data of a history entry fetched from the database.
         """
-        self.__cursor.execute(f"SELECT * FROM histories WHERE [history_id] = {history_id};")
+        self.__cursor.execute(queries.SELECT_HISTORY_BY_ID, (history_id,))
         row = self.__cursor.fetchone()
-        history_model = HistoryModel()
-        if row is not None:
-            history_model.history_id = row[0]
-            history_model.habit_id = row[1]
-            history_model.checkoff_datetime = row[2]
-            history_model.checked_off = row[3]
-        else:
+        if row is None:
             raise NameError("Habit ID does not exist.")
-        return history_model
+        return HistoryModel.from_row(row)
 
-    def get_histories_by_habit_id(self, habit_id: int) -> Histories:
+    def get_histories_by_habit_id(self, habit_id: int, columnar: bool = False, since: datetime = None,
+                                  until: datetime = None) -> Histories:
         """
         Get histories given the habit ID from the database and return a history model.
 
@@ -212,79 +596,254 @@ class DataAccess:
         Args:
             habit_id (int):
                 ID of a habit for which history entries need to be fetched from database.
+            columnar (bool):
+                Whether the histories are stored in columnar histories instead of a dictionary.
+            since (datetime):
+                Start of the range of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time, exclusive, or None for no end.
 
         Returns:
             Histories:
                 A history dictionary containing the data of history entries fetched from the database.
         """
-        self.__cursor.execute(f"SELECT * FROM histories WHERE [habit_id] = {habit_id};")
-        result_rows = self.__cursor.fetchall()
+        if columnar:
+            row = self.__cursor.execute(queries.SELECT_PERIODICITY_OF_HABIT, (habit_id,)).fetchone()
+            periodicity = row[0] if row is not None else "daily"
+            self.__execute_histories_of_habit(habit_id, since, until)
+            return ColumnarHistories.from_rows(habit_id, periodicity, self.__cursor)
+        self.__execute_histories_of_habit(habit_id, since, until)
         histories = Histories()
-        for row in result_rows:
-            history_model = HistoryModel()
-            history_model.history_id = row[0]
-            history_model.habit_id = row[1]
-            history_model.checkoff_datetime = row[2]
-            history_model.checked_off = row[3]
-            histories.histories[f"{history_model.history_id}"] = history_model
+        histories.histories = {f"{row[0]}": HistoryModel.from_row(row) for row in self.__cursor.fetchall()}
         return histories
 
-    def get_all_habits(self) -> Habits:
+    def __execute_histories_of_habit(self, habit_id: int, since: datetime = None, until: datetime = None) -> None:
+        """
+        Execute the query of the histories of a habit in order of check-off time, optionally within a window.
+
+        Args:
+            habit_id (int):
+                ID of a habit for which history entries need to be fetched from database.
+            since (datetime):
+                Start of the range of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time, exclusive, or None for no end.
+        """
+        if since is None and until is None:
+            self.__cursor.execute(queries.SELECT_HISTORIES_BY_HABIT_ID, (habit_id,))
+            return
+        parameters = self.__window(since, until)
+        parameters["habit_id"] = habit_id
+        self.__cursor.execute(queries.SELECT_HISTORIES_BY_HABIT_ID_BETWEEN, parameters)
+
+    def iter_histories(self, habit_id: int, since: datetime = None, until: datetime = None,
+                       batch_size: int = 1000) -> Iterator[HistoryModel]:
+        """
+        Iterate over the histories of a habit in order of check-off time without fetching all of them at once.
+
+        Rows are fetched in batches with a cursor of its own, hence only one batch of history models is held in memory
+        and other queries can be issued while iterating.
+
+        Args:
+            habit_id (int):
+                ID of a habit for which history entries need to be fetched from database.
+            since (datetime):
+                Start of the range of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time, exclusive, or None for no end.
+            batch_size (int):
+                Number of rows fetched at once.
+
+        Returns:
+            Iterator[HistoryModel]:
+                History models of the habit in order of check-off time.
+        """
+        parameters = self.__window(since, until)
+        parameters["habit_id"] = habit_id
+        cursor = self.__cursor.connection.cursor()
+        cursor.arraysize = batch_size
+        try:
+            cursor.execute(queries.SELECT_HISTORIES_BY_HABIT_ID_BETWEEN, parameters)
+            rows = cursor.fetchmany()
+            while rows:
+                for row in rows:
+                    yield HistoryModel.from_row(row)
+                rows = cursor.fetchmany()
+        finally:
+            cursor.close()
+
+    def get_all_habits(self, columnar: bool = False, since: datetime = None, until: datetime = None) -> Habits:
         """
         Get a dictionary of habit models with all habits in the database.
 
-        Retrieves all habits from the database and puts them into a Habits.
+        Retrieves all habits and all their histories from the database with two set-based queries and puts them into a
+        Habits. A window of check-off time is searched in the index per habit, hence only the histories within the
+        window are read.
+
+        Args:
+            columnar (bool):
+                Whether the histories of the habits are stored in columnar histories instead of dictionaries.
+            since (datetime):
+                Start of the range of check-off time of the histories, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time of the histories, exclusive, or None for no end.
 
         Returns:
             Habits:
                 A dictionary of habit models with data from the database.
         """
-        self.__cursor.execute("SELECT * FROM habits;")
-        result_rows = self.__cursor.fetchall()
-        habits = Habits()
-        for row in result_rows:
-            habit_model = HabitModel()
-            habit_model.habit_id = row[0]
-            habit_model.habit_name = row[1]
-            habit_model.habit_specification = row[2]
-            habit_model.habit_creation = row[3]
-            habit_model.habit_periodicity_granularity = row[4]
-            habit_model.habit_periodicity_from = row[5]
-            habit_model.habit_periodicity_to = row[6]
-            habit_model.habit_history = self.get_histories_by_habit_id(habit_model.habit_id)
-            habits.habits[f"{habit_model.habit_id}"] = habit_model
+        self.__cursor.execute(queries.SELECT_ALL_HABITS)
+        habits = self.__habits_from_rows(self.__cursor, columnar)
+        if since is None and until is None:
+            self.__cursor.execute(queries.SELECT_ALL_HISTORIES)
+        else:
+            self.__cursor.execute(queries.SELECT_ALL_HISTORIES_BETWEEN, self.__window(since, until))
+        self.__assign_histories_from_rows(habits, self.__cursor, columnar)
         return habits
 
-    def get_all_habits_by_periodicity(self, periodicity: str) -> Habits:
+    def get_all_habits_by_periodicity(self, periodicity: str, columnar: bool = False, since: datetime = None,
+                                      until: datetime = None) -> Habits:
         """
         Get a dictionary of habit models with all habits in the database that have a specific periodicity.
 
-        Retrieves all habits with a specific periodicity from the database and puts them into a Habits.
+        Retrieves all habits with a specific periodicity and all their histories from the database with two set-based
+        queries and puts them into a Habits. Only the histories within a window of check-off time are read.
 
         Args:
             periodicity (str):
                 Periodicity of the habits to be retrieved.
+            columnar (bool):
+                Whether the histories of the habits are stored in columnar histories instead of dictionaries.
+            since (datetime):
+                Start of the range of check-off time of the histories, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time of the histories, exclusive, or None for no end.
 
         Returns:
             Habits:
                 A dictionary of habit models with data from the database.
         """
-        self.__cursor.execute(f"SELECT * FROM habits WHERE habit_periodicity_granularity = '{periodicity}';")
-        result_rows = self.__cursor.fetchall()
+        self.__cursor.execute(queries.SELECT_HABITS_BY_PERIODICITY, (periodicity,))
+        habits = self.__habits_from_rows(self.__cursor, columnar)
+        if since is None and until is None:
+            self.__cursor.execute(queries.SELECT_HISTORIES_BY_PERIODICITY, (periodicity,))
+        else:
+            parameters = self.__window(since, until)
+            parameters["periodicity"] = periodicity
+            self.__cursor.execute(queries.SELECT_HISTORIES_BY_PERIODICITY_BETWEEN, parameters)
+        self.__assign_histories_from_rows(habits, self.__cursor, columnar)
+        return habits
+
+    def get_habits_page(self, after_habit_id: int = None, limit: int = None, periodicity: str = None,
+                        with_histories: bool = True, columnar: bool = False) -> Habits:
+        """
+        Get a page of habit models in order of their IDs.
+
+        Pages are selected by the ID of the last habit of the previous page instead of an offset, hence each page is
+        read by a range scan of the primary key no matter how many pages precede it. Histories are read for the habits
+        of the page only.
+
+        Args:
+            after_habit_id (int):
+                ID of the last habit of the previous page, None for the first page.
+            limit (int):
+                Maximum number of habits of the page, None for all remaining habits.
+            periodicity (str):
+                Periodicity of the habits, eg daily, weekly, or None for all habits.
+            with_histories (bool):
+                Whether to read the histories of the habits.
+            columnar (bool):
+                Whether the histories of the habits are stored in columnar histories instead of dictionaries.
+
+        Returns:
+            Habits:
+                A dictionary of habit models of the page.
+        """
+        parameters = {
+            "after_habit_id": self.__BEFORE_FIRST_HABIT_ID if after_habit_id is None else after_habit_id,
+            "limit": -1 if limit is None else limit,
+            "periodicity": periodicity
+        }
+        self.__cursor.execute(queries.SELECT_HABITS_PAGE, parameters)
+        habits = self.__habits_from_rows(self.__cursor, columnar)
+        if with_histories and len(habits.habits) > 0:
+            parameters["last_habit_id"] = max(habit_model.habit_id for habit_model in habits.habits.values())
+            self.__cursor.execute(queries.SELECT_HISTORIES_OF_HABITS_PAGE, parameters)
+            self.__assign_histories_from_rows(habits, self.__cursor, columnar)
+        return habits
+
+    @classmethod
+    def __window(cls, since: datetime = None, until: datetime = None) -> Dict[str, int]:
+        """
+        Get the query parameters of a window of check-off time.
+
+        Args:
+            since (datetime):
+                Start of the window, inclusive, or None for no start.
+            until (datetime):
+                End of the window, exclusive, or None for no end.
+
+        Returns:
+            Dict[str, int]:
+                Check-off epochs of the start and the end of the window by parameter name.
+        """
+        return {
+            "since": cls.__MIN_EPOCH if since is None else Period.epoch_from_datetime(since),
+            "until": cls.__MAX_EPOCH if until is None else Period.epoch_from_datetime(until)
+        }
+
+    @classmethod
+    def __habits_from_rows(cls, rows, columnar: bool = False) -> Habits:
+        """
+        Create a dictionary of habit models from rows of the habits table.
+
+        Each row is turned into a habit model with an empty history.
+
+        Args:
+            rows:
+                Iterable of rows of the habits database table.
+            columnar (bool):
+                Whether the empty histories are columnar histories instead of dictionaries.
+
+        Returns:
+            Habits:
+                A dictionary of habit models without histories.
+        """
         habits = Habits()
-        for row in result_rows:
-            habit_model = HabitModel()
-            habit_model.habit_id = row[0]
-            habit_model.habit_name = row[1]
-            habit_model.habit_specification = row[2]
-            habit_model.habit_creation = row[3]
-            habit_model.habit_periodicity_granularity = row[4]
-            habit_model.habit_periodicity_from = row[5]
-            habit_model.habit_periodicity_to = row[6]
-            habit_model.habit_history = self.get_histories_by_habit_id(habit_model.habit_id)
-            habits.habits[f"{habit_model.habit_id}"] = habit_model
+        habits.habits = {f"{row[0]}": HabitModel.from_row(row) for row in rows}
+        if columnar:
+            for habit_model in habits.habits.values():
+                habit_model.habit_history = ColumnarHistories(
+                    habit_model.habit_id, habit_model.habit_periodicity_granularity
+                )
         return habits
 
+    @classmethod
+    def __assign_histories_from_rows(cls, habits: Habits, rows, columnar: bool = False) -> None:
+        """
+        Assign rows of the histories table to the habit models they belong to.
+
+        The rows are consumed in a single pass, rows of habits not contained in the given habits are skipped.
+
+        Args:
+            habits (Habits):
+                Dictionary of habit models the history models get assigned to.
+            rows:
+                Iterable of rows of the histories database table.
+            columnar (bool):
+                Whether the histories of the habit models are columnar histories instead of dictionaries.
+        """
+        habit_models = habits.habits
+        for row in rows:
+            habit_model = habit_models.get(f"{row[1]}")
+            if habit_model is None:
+                continue
+            if columnar:
+                habit_model.habit_history.append_row(row)
+            else:
+                habit_model.habit_history.histories[f"{row[0]}"] = HistoryModel.from_row(row)
+
+    @serialized
     def create_new_habit(self, name: str, description: str, period: str, habit_from: str, habit_to: str) -> int:
         """
         Create a new habit given its data in the database.
@@ -307,28 +866,16 @@ class DataAccess:
             int:
                 ID of inserted habit.
         """
-        insert_habit_into_habits = f"""
-            INSERT INTO habits (
-                [habit_name],
-                [habit_specification],
-                [habit_creation],
-                [habit_periodicity_granularity],
-                [habit_periodicity_from],
-                [habit_periodicity_to]
-            ) VALUES (
-                '{name}',
-                '{description}',
-                '{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
-                '{period}',
-                '{habit_from}',
-                '{habit_to}'
-            );
-        """
-        self.__cursor.execute(insert_habit_into_habits)
+        self.__cursor.execute(
+            queries.INSERT_HABIT,
+            (name, description, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), period, habit_from, habit_to)
+        )
         last_id_inserted = self.__cursor.lastrowid
+        self.__cursor.execute(queries.INSERT_HABIT_SUMMARY, (last_id_inserted,))
         self.__connection.commit()
         return last_id_inserted
 
+    @serialized
     def delete_habit(self, habit_id: int) -> None:
         """
         Delete a habit from database given its ID.
@@ -339,19 +886,14 @@ class DataAccess:
             habit_id (int):
                 ID of a habit to be deleted from the database.
         """
-        delete_habit_from_habits = f"""
-            DELETE FROM habits
-            WHERE [habit_id] = {habit_id};
-        """
-        self.__cursor.execute(delete_habit_from_habits)
+        self.__cursor.execute(queries.DELETE_HABIT, (habit_id,))
         self.__connection.commit()
-        delete_history_from_histories = f"""
-            DELETE FROM histories
-            WHERE [habit_id] = {habit_id};
-        """
-        self.__cursor.execute(delete_history_from_histories)
+        self.__cursor.execute(queries.DELETE_HISTORIES_OF_HABIT, (habit_id,))
+        self.__connection.commit()
+        self.__cursor.execute(queries.DELETE_HABIT_SUMMARY, (habit_id,))
         self.__connection.commit()
 
+    @serialized
     def modify_habit(self, habit_id: int, name: str, description: str, period: str, habit_from: str, habit_to: str) \
             -> int:
         """
@@ -395,27 +937,33 @@ class DataAccess:
             if habit_to is not None:
                 habit_model.habit_periodicity_to
 
-            modify_habit_in_habits = f"""
-                UPDATE habits 
-                SET
-                    [habit_name] = '{habit_model.habit_name}',
-                    [habit_specification] = '{habit_model.habit_specification}',
-                    [habit_periodicity_granularity] = '{habit_model.habit_periodicity_granularity}',
-                    [habit_periodicity_from] = '{habit_model.habit_periodicity_from}',
-                    [habit_periodicity_to] = '{habit_model.habit_periodicity_to}'
-                WHERE [habit_id] = {habit_id};
-            """
-            self.__cursor.execute(modify_habit_in_habits)
+            self.__cursor.execute(
+                queries.UPDATE_HABIT,
+                (
+                    habit_model.habit_name,
+                    habit_model.habit_specification,
+                    habit_model.habit_periodicity_granularity,
+                    habit_model.habit_periodicity_from,
+                    habit_model.habit_periodicity_to,
+                    habit_id
+                )
+            )
+            # Period indexes of the histories and thus the summary depend on the periodicity of the habit.
+            if period is not None:
+                self.__cursor.execute(queries.UPDATE_HISTORY_CHECKOFF_PERIODS_OF_HABIT, (period, habit_id))
+                self.__cursor.execute(queries.INSERT_HABIT_SUMMARY_OF_HABIT_FROM_HISTORIES, {"habit_id": habit_id})
             self.__connection.commit()
             return habit_model.habit_id
         else:
             raise NameError("Habit ID does not exist.")
 
+    @serialized
     def complete_habit(self, habit_id: int, complete_datetime: str) -> int:
         """
         Set a habit with the ID given to be checked-off in the database.
 
-        New data of a habit being checked-off is added to the habit history in the database.
+        New data of a habit being checked-off is added to the habit history in the database and the summary of the
+        habit is updated within the same transaction.
 
         Args:
             habit_id (int):
@@ -427,67 +975,104 @@ class DataAccess:
             int:
                 ID of histories entry inserted last.
         """
-        select_habit_with_habit_id = f"""
-            SELECT [habit_periodicity_granularity], [habit_periodicity_from] FROM habits WHERE [habit_id] = {habit_id};
+        # The check-off depends on the latest check-off, hence it is read and written within one write transaction.
+        self.__cursor.execute(queries.BEGIN_IMMEDIATE_TRANSACTION)
+        try:
+            last_id_inserted = self.__insert_checkoff(habit_id, complete_datetime)
+            self.__connection.commit()
+        except Exception:
+            self.__connection.rollback()
+            raise
+        return last_id_inserted
+
+    @serialized
+    def complete_habits(self, checkoffs: List[Tuple[int, str]]) -> List[Union[int, Exception]]:
+        """
+        Check off many habits within a single transaction.
+
+        The check-offs are applied in order, each of them is validated against the histories including the check-offs
+        before it within the transaction. A check-off failing is rolled back on its own and does not affect the others.
+
+        Args:
+            checkoffs (List[Tuple[int, str]]):
+                Pairs of habit ID and datetime when the check-off took place.
+
+        Returns:
+            List[Union[int, Exception]]:
+                For each check-off the ID of histories entry inserted last or the error it failed with.
+        """
+        results = list()
+        self.__cursor.execute(queries.BEGIN_IMMEDIATE_TRANSACTION)
+        try:
+            for habit_id, complete_datetime in checkoffs:
+                self.__cursor.execute(queries.SAVEPOINT_CHECKOFF)
+                try:
+                    results.append(self.__insert_checkoff(habit_id, complete_datetime))
+                except (NameError, ValueError, sqlite3.Error) as error:
+                    self.__cursor.execute(queries.ROLLBACK_TO_SAVEPOINT_CHECKOFF)
+                    results.append(error)
+                self.__cursor.execute(queries.RELEASE_SAVEPOINT_CHECKOFF)
+            self.__connection.commit()
+        except Exception:
+            self.__connection.rollback()
+            raise
+        return results
+
+    def __insert_checkoff(self, habit_id: int, complete_datetime: str) -> int:
+        """
+        Insert the check-off of a habit and the broken periods before it and update the summary of the habit.
+
+        The caller is responsible for the transaction.
+
+        Args:
+            habit_id (int):
+                ID of a habit to add a marker in the habit history.
+            complete_datetime (str):
+                Datetime when the check-off took place.
+
+        Returns:
+            int:
+                ID of histories entry inserted last.
         """
-        self.__cursor.execute(select_habit_with_habit_id)
+        self.__cursor.execute(queries.SELECT_PERIODICITY_OF_HABIT, (habit_id,))
         habit = self.__cursor.fetchone()
         # Only complete habit if it exists given the habit ID.
         if habit is not None and len(habit) == 2:
-            select_latest_history_of_habit = f"""
-                SELECT [checkoff_datetime] from histories
-                WHERE [habit_id] = {habit_id} and [checked_off] = 1
-                ORDER BY [checkoff_datetime] DESC LIMIT 1;
-            """
-            self.__cursor.execute(select_latest_history_of_habit)
-            latest_checkoff_datetime = self.__cursor.fetchone()
+            self.__cursor.execute(queries.SELECT_LATEST_CHECKOFF_OF_HABIT, (habit_id,))
+            latest_checkoff_epoch = self.__cursor.fetchone()
+            self.__cursor.execute(queries.SELECT_LATEST_EPOCH_OF_HABIT, (habit_id,))
+            latest_history_epoch = self.__cursor.fetchone()[0]
 
-            checkoff_datetime = datetime.strptime(complete_datetime, "%Y-%m-%d %H:%M:%S")
+            checkoff_epoch = Period.epoch_from_string(complete_datetime)
 
-            # Get last checked-off datetime of the given habit.
+            # Get last checked-off epoch of the given habit, the start date of the habit if never checked-off.
             last_checkoff_exists = False
-            if latest_checkoff_datetime is None or len(latest_checkoff_datetime) == 0:
-                last_checkoff = datetime.strptime(habit[1]+" 00:00:00", "%Y-%m-%d %H:%M:%S")
-            elif latest_checkoff_datetime is not None and len(latest_checkoff_datetime) == 1:
+            if latest_checkoff_epoch is None or len(latest_checkoff_epoch) == 0:
+                if habit[1] is None:
+                    raise ValueError(f"Habit with ID {habit_id} has an invalid start date.")
+                last_checkoff = habit[1]
+            elif latest_checkoff_epoch is not None and len(latest_checkoff_epoch) == 1:
                 last_checkoff_exists = True
-                last_checkoff = datetime.strptime(latest_checkoff_datetime[0], "%Y-%m-%d %H:%M:%S")
+                last_checkoff = latest_checkoff_epoch[0]
 
-            diff_between_checkoffs = checkoff_datetime - last_checkoff
+            # Whole days between check-offs, rounded down like the days of a timedelta.
+            days_between_checkoffs = (checkoff_epoch - last_checkoff) // Period.SECONDS_PER_DAY
 
+            period = None
+            periods_since_last_checkoff = 0
             if habit[0] == 'daily': # For daily habits calculate the numbers of days between check-offs.
-                days_diff_since_last_checkoff = diff_between_checkoffs.days
-                # Only complete if habit has not already be completed in this period.
-                if last_checkoff_exists and days_diff_since_last_checkoff < 1:
-                    raise ValueError(f"Habit with ID {habit_id} has already been checked-off in given period.")
-                number_broken = days_diff_since_last_checkoff - 1
-                # Start with today and hence add one period to broken habits if no completed period already exists.
-                increment = 0
-                loop_range = number_broken + 1
-                # Start with next period for broken habits if a completed period already exists.
-                if last_checkoff_exists:
-                    increment = 1
-                    loop_range = number_broken
-                # Add broken habits for periods in-between two check-offs.
-                for index in range(loop_range):
-                    insert_history_into_histories = f"""
-                        INSERT INTO histories (
-                            [habit_id],
-                            [checkoff_datetime],
-                            [checked_off]
-                        ) VALUES (
-                            {habit_id},
-                            '{(last_checkoff + timedelta(days=index+increment)).strftime("%Y-%m-%d %H:%M:%S")}',
-                            0
-                        );
-                    """
-                    self.__cursor.execute(insert_history_into_histories)
-                    self.__connection.commit()
+                period = Period.SECONDS_PER_PERIOD['daily']
+                periods_since_last_checkoff = days_between_checkoffs
             elif habit[0] == 'weekly': # For weekly habits calculate the numbers of weeks between check-offs.
-                weeks_diff_since_last_checkoff = int(diff_between_checkoffs.days / 7.0)
+                period = Period.SECONDS_PER_PERIOD['weekly']
+                periods_since_last_checkoff = int(days_between_checkoffs / 7.0)
+
+            broken_histories = list()
+            if period is not None:
                 # Only complete if habit has not already be completed in this period.
-                if last_checkoff_exists and weeks_diff_since_last_checkoff < 1:
+                if last_checkoff_exists and periods_since_last_checkoff < 1:
                     raise ValueError(f"Habit with ID {habit_id} has already been checked-off in given period.")
-                number_broken = weeks_diff_since_last_checkoff - 1
+                number_broken = periods_since_last_checkoff - 1
                 # Start with today and hence add one period to broken habits if no completed period already exists.
                 increment = 0
                 loop_range = number_broken + 1
@@ -495,37 +1080,162 @@ class DataAccess:
                 if last_checkoff_exists:
                     increment = 1
                     loop_range = number_broken
-                # Add broken habits for periods in-between two check-offs.
-                for index in range(loop_range):
-                    insert_history_into_histories = f"""
-                        INSERT INTO histories (
-                            [habit_id],
-                            [checkoff_datetime],
-                            [checked_off]
-                        ) VALUES (
-                            {habit_id},
-                            '{(last_checkoff + timedelta(weeks=index+increment)).strftime("%Y-%m-%d %H:%M:%S")}',
-                            0
-                        );
-                    """
-                    self.__cursor.execute(insert_history_into_histories)
-                    self.__connection.commit()
-            # Complete habit
-            insert_history_into_histories = f"""
-                INSERT INTO histories (
-                    [habit_id],
-                    [checkoff_datetime],
-                    [checked_off]
-                ) VALUES (
-                    {habit_id},
-                    '{checkoff_datetime.strftime("%Y-%m-%d %H:%M:%S")}',
-                    1
-                );
-            """
-            self.__cursor.execute(insert_history_into_histories)
+                # Collect broken habits for periods in-between two check-offs.
+                broken_epochs = (last_checkoff + period * (index + increment) for index in range(loop_range))
+                broken_histories = [
+                    (habit_id, Period.string_from_epoch(epoch), 0, epoch, Period.index(epoch, habit[0]))
+                    for epoch in broken_epochs
+                ]
+
+            # Add broken habits and complete habit.
+            self.__cursor.executemany(queries.INSERT_HISTORY_WITH_PERIOD, broken_histories)
+            self.__cursor.execute(
+                queries.INSERT_HISTORY_WITH_PERIOD,
+                (
+                    habit_id,
+                    Period.string_from_epoch(checkoff_epoch),
+                    1,
+                    checkoff_epoch,
+                    Period.index(checkoff_epoch, habit[0])
+                )
+            )
             last_id_inserted = self.__cursor.lastrowid
-            self.__connection.commit()
+            first_inserted_epoch = broken_histories[0][3] if broken_histories else checkoff_epoch
+            # The summary can only be updated incrementally if the new entries are appended to the history.
+            if latest_history_epoch is None or latest_history_epoch <= first_inserted_epoch:
+                self.__cursor.execute(queries.INSERT_HABIT_SUMMARY, (habit_id,))
+                self.__cursor.execute(
+                    queries.UPDATE_HABIT_SUMMARY_ON_CHECKOFF,
+                    {
+                        "habit_id": habit_id,
+                        "number_broken": len(broken_histories),
+                        "checkoff_period": Period.index(checkoff_epoch, habit[0])
+                    }
+                )
+            else:
+                self.__cursor.execute(queries.INSERT_HABIT_SUMMARY_OF_HABIT_FROM_HISTORIES, {"habit_id": habit_id})
             return last_id_inserted
         else:
             raise NameError(f"Habit with ID {habit_id} does not exist.")
 
+    def get_habit_summary(self, habit_id: int) -> HabitSummaryModel:
+        """
+        Get the summary of a habit given its ID from the database.
+
+        Fetches the streak summary of a habit with the given ID without reading its history.
+
+        Args:
+            habit_id (int):
+                ID of a habit whose summary needs to be fetched from database.
+
+        Returns:
+            HabitSummaryModel:
+                A habit summary model containing the summary of a habit fetched from the database.
+        """
+        row = self.__cursor.execute(queries.SELECT_HABIT_SUMMARY_BY_ID, (habit_id,)).fetchone()
+        if row is None:
+            raise NameError("Habit ID does not exist.")
+        habit_summary_model = HabitSummaryModel()
+        habit_summary_model.habit_id = row[0]
+        if row[1] is not None:
+            habit_summary_model.current_streak = row[1]
+            habit_summary_model.longest_streak = row[2]
+            habit_summary_model.last_checkoff_period = row[3]
+            habit_summary_model.total_completions = row[4]
+            habit_summary_model.total_breaks = row[5]
+        return habit_summary_model
+
+    def get_longest_run_streak(self) -> int:
+        """
+        Get the longest run streak over all habits from the habit summaries.
+
+        Returns:
+            int:
+                Longest run streak over all habits.
+        """
+        return self.__cursor.execute(queries.SELECT_LONGEST_STREAK).fetchone()[0]
+
+    def get_longest_run_streak_by_periodicity(self, periodicity: str) -> int:
+        """
+        Get the longest run streak over all habits with a specific periodicity from the habit summaries.
+
+        Args:
+            periodicity (str):
+                Periodicity of the habits.
+
+        Returns:
+            int:
+                Longest run streak over all habits with the given periodicity.
+        """
+        return self.__cursor.execute(queries.SELECT_LONGEST_STREAK_BY_PERIODICITY, (periodicity,)).fetchone()[0]
+
+    def get_run_streaks(self, periodicity: str = None, habit_id: int = None, since: datetime = None,
+                        until: datetime = None) -> Dict[int, Tuple[int, int]]:
+        """
+        Compute the longest and the current run streak per habit from the histories within the database.
+
+        Unlike the habit summaries, the streaks are computed from the histories on every call, yet only one row per
+        habit is transferred from the database. Given a window of check-off time, only the histories within the window
+        are read and a run streak crossing its start counts from the start.
+
+        Args:
+            periodicity (str):
+                Periodicity of the habits, None for all habits.
+            habit_id (int):
+                ID of a single habit, None for all habits.
+            since (datetime):
+                Start of the range of check-off time of the histories, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time of the histories, exclusive, or None for no end.
+
+        Returns:
+            Dict[int, Tuple[int, int]]:
+                Longest and current run streak by habit ID.
+        """
+        windowed = since is not None or until is not None
+        parameters = self.__window(since, until)
+        if habit_id is not None:
+            parameters["habit_id"] = habit_id
+            query = queries.SELECT_RUN_STREAKS_OF_HABIT_BETWEEN if windowed else queries.SELECT_RUN_STREAKS_OF_HABIT
+            rows = self.__cursor.execute(query, parameters).fetchall()
+            if len(rows) == 0:
+                raise NameError(f"Habit with ID {habit_id} does not exist.")
+        elif periodicity is not None:
+            parameters["periodicity"] = periodicity
+            query = queries.SELECT_RUN_STREAKS_BY_PERIODICITY_BETWEEN if windowed \
+                else queries.SELECT_RUN_STREAKS_BY_PERIODICITY
+            rows = self.__cursor.execute(query, parameters)
+        else:
+            rows = self.__cursor.execute(queries.SELECT_RUN_STREAKS_BETWEEN if windowed else queries.SELECT_RUN_STREAKS,
+                                         parameters)
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def check_habit_summaries(self) -> List[int]:
+        """
+        Check the habit summaries against the histories they summarize.
+
+        Summaries are recomputed from the histories and compared to the stored summaries.
+
+        Returns:
+            List[int]:
+                IDs of habits whose summary is missing, outdated or whose habit does not exist anymore.
+        """
+        expected = {row[0]: row for row in self.__cursor.execute(queries.SELECT_HABIT_SUMMARIES_FROM_HISTORIES)}
+        actual = {row[0]: row for row in self.__cursor.execute(queries.SELECT_HABIT_SUMMARIES)}
+        habit_ids = set(expected) | set(actual)
+        return sorted(habit_id for habit_id in habit_ids if expected.get(habit_id) != actual.get(habit_id))
+
+    @serialized
+    def rebuild_habit_summaries(self) -> None:
+        """
+        Rebuild the habit summaries from the histories.
+
+        All summaries are deleted and recomputed from the histories within a single transaction.
+        """
+        try:
+            self.__cursor.execute(queries.DELETE_HABIT_SUMMARIES)
+            self.__cursor.execute(queries.INSERT_HABIT_SUMMARIES_FROM_HISTORIES)
+            self.__connection.commit()
+        except sqlite3.Error:
+            self.__connection.rollback()
+            raise
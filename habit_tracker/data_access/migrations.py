@@ -0,0 +1,96 @@
+from typing import List
+
+from habit_tracker.data_access import queries
+
+
+class Migration:
+    """
+    Migration is a single versioned step of the database schema.
+
+    A migration consists of a version number, a description and the SQL statements bringing a database of the previous
+    version to this version.
+    """
+
+    def __init__(self, version: int, description: str, statements: List[str]):
+        """
+        Sets all attributes of a migration.
+
+        Args:
+            version (int):
+                Schema version of a database after applying the migration.
+            description (str):
+                Short description of the schema change.
+            statements (List[str]):
+                SQL statements applying the schema change.
+        """
+        self.__version = version
+        self.__description = description
+        self.__statements = statements
+
+    @property
+    def version(self) -> int:
+        """
+        Gets the schema version of a database after applying the migration.
+
+        Returns:
+            int:
+                Schema version after the migration.
+        """
+        return self.__version
+
+    @property
+    def description(self) -> str:
+        """
+        Gets the description of the schema change.
+
+        Returns:
+            str:
+                Description of the schema change.
+        """
+        return self.__description
+
+    @property
+    def statements(self) -> List[str]:
+        """
+        Gets the SQL statements applying the schema change.
+
+        Returns:
+            List[str]:
+                SQL statements of the migration.
+        """
+        return self.__statements
+
+
+# Ordered migration steps, the version of each migration is one higher than the version of the one before. Databases
+# created before migrations existed have version 0, hence the first steps must not fail on already existing tables.
+MIGRATIONS = [
+    Migration(
+        1,
+        "Create habits and histories tables.",
+        [queries.CREATE_HABIT_TABLE, queries.CREATE_HISTORY_TABLE]
+    ),
+    Migration(
+        2,
+        "Index histories by habit, check-off state and datetime and habits by periodicity.",
+        [queries.CREATE_HISTORY_CHECKOFF_INDEX, queries.CREATE_HABIT_PERIODICITY_INDEX]
+    ),
+    Migration(
+        3,
+        "Store check-off datetimes additionally as Unix seconds and period index and index histories by them.",
+        [
+            queries.ADD_HISTORY_CHECKOFF_EPOCH_COLUMN,
+            queries.ADD_HISTORY_CHECKOFF_PERIOD_COLUMN,
+            queries.UPDATE_HISTORY_CHECKOFF_EPOCHS,
+            queries.UPDATE_HISTORY_CHECKOFF_PERIODS,
+            queries.DROP_HISTORY_CHECKOFF_INDEX,
+            queries.CREATE_HISTORY_CHECKOFF_EPOCH_INDEX
+        ]
+    ),
+    Migration(
+        4,
+        "Summarize streaks, completions and breaks per habit.",
+        [queries.CREATE_HABIT_SUMMARY_TABLE, queries.INSERT_HABIT_SUMMARIES_FROM_HISTORIES]
+    ),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
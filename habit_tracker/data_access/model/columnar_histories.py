@@ -0,0 +1,280 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List
+
+from habit_tracker.data_access.model.histories import Histories
+from habit_tracker.data_access.model.history_model import HistoryModel
+from habit_tracker.data_access.period import Period
+
+
+class ColumnarHistories(Histories):
+    """
+    Data structure to store the histories of a habit in parallel typed arrays.
+
+    ColumnarHistories stores history IDs, check-off epochs, period indexes and checked-off values in one array each,
+    sorted by check-off time. Entries are appended in constant time, ranges of time are sliced by binary search and the
+    checked-off values are exposed as a buffer without copying. The arrays cannot grow while a buffer is exported, hence
+    buffers must be released before appending.
+    """
+
+    __slots__ = (
+        "__habit_id",
+        "__periodicity",
+        "__history_ids",
+        "__checkoff_epochs",
+        "__checkoff_periods",
+        "__checked_offs"
+    )
+
+    def __init__(self, habit_id: int = None, periodicity: str = "daily"):
+        """
+        Initializes the empty arrays of history data.
+
+        Args:
+            habit_id (int):
+                ID of the habit all histories belong to.
+            periodicity (str):
+                Periodicity of the habit, eg daily, weekly.
+        """
+        self.__habit_id = habit_id
+        self.__periodicity = periodicity
+        self.__history_ids = array("q")
+        self.__checkoff_epochs = array("q")
+        self.__checkoff_periods = array("q")
+        self.__checked_offs = array("b")
+
+    def __len__(self) -> int:
+        """
+        Gets the number of history entries.
+
+        Returns:
+            int:
+                Number of history entries.
+        """
+        return len(self.__history_ids)
+
+    def lines(self, last: int = None) -> Iterator[str]:
+        """
+        Generates the string representation of the histories line by line in the same format as history models.
+
+        Args:
+            last (int):
+                Number of latest history entries to output, None for all.
+
+        Returns:
+            Iterator[str]:
+                String representation of each history entry in order of check-off time.
+        """
+        start = 0 if last is None else max(len(self.__history_ids) - last, 0)
+        for index in range(start, len(self.__history_ids)):
+            yield str(HistoryModel.from_row((
+                self.__history_ids[index],
+                self.__habit_id,
+                Period.string_from_epoch(self.__checkoff_epochs[index]),
+                self.__checked_offs[index]
+            )))
+
+    @classmethod
+    def from_rows(cls, habit_id: int, periodicity: str, rows: Iterable[tuple]) -> "ColumnarHistories":
+        """
+        Creates columnar histories from rows of the histories table.
+
+        Args:
+            habit_id (int):
+                ID of the habit all histories belong to.
+            periodicity (str):
+                Periodicity of the habit, eg daily, weekly.
+            rows (Iterable[tuple]):
+                Rows of the histories table with history ID, habit ID, datetime, checked-off value, check-off epoch and
+                period index.
+
+        Returns:
+            ColumnarHistories:
+                Columnar histories containing the data of the rows.
+        """
+        histories = cls(habit_id, periodicity)
+        for row in rows:
+            histories.append_row(row)
+        return histories
+
+    def append_row(self, row: tuple) -> None:
+        """
+        Appends a row of the histories table.
+
+        Args:
+            row (tuple):
+                Row of the histories table with history ID, habit ID, datetime, checked-off value, check-off epoch and
+                period index.
+        """
+        self.append(row[0], row[4], row[5], row[3])
+
+    def append(self, history_id: int, checkoff_epoch: int, checkoff_period: int, checked_off: int) -> None:
+        """
+        Appends a history entry.
+
+        Entries at or after the latest check-off are appended in constant time, earlier entries are inserted at their
+        position in time.
+
+        Args:
+            history_id (int):
+                ID of the history.
+            checkoff_epoch (int):
+                Check-off datetime as Unix seconds.
+            checkoff_period (int):
+                Index of the period of the check-off.
+            checked_off (int):
+                Checked-off value of the history entry.
+        """
+        if len(self.__checkoff_epochs) == 0 or checkoff_epoch >= self.__checkoff_epochs[-1]:
+            self.__history_ids.append(history_id)
+            self.__checkoff_epochs.append(checkoff_epoch)
+            self.__checkoff_periods.append(checkoff_period)
+            self.__checked_offs.append(checked_off)
+        else:
+            index = bisect_right(self.__checkoff_epochs, checkoff_epoch)
+            self.__history_ids.insert(index, history_id)
+            self.__checkoff_epochs.insert(index, checkoff_epoch)
+            self.__checkoff_periods.insert(index, checkoff_period)
+            self.__checked_offs.insert(index, checked_off)
+
+    def between(self, since: datetime = None, until: datetime = None) -> "ColumnarHistories":
+        """
+        Gets the history entries checked off within a range of time.
+
+        The range is found by binary search over the check-off epochs.
+
+        Args:
+            since (datetime):
+                Start of the range, inclusive, or None for no start.
+            until (datetime):
+                End of the range, exclusive, or None for no end.
+
+        Returns:
+            ColumnarHistories:
+                Columnar histories containing the entries within the range.
+        """
+        start = 0 if since is None else bisect_left(self.__checkoff_epochs, Period.epoch_from_datetime(since))
+        end = len(self) if until is None else bisect_left(self.__checkoff_epochs, Period.epoch_from_datetime(until))
+        histories = ColumnarHistories(self.__habit_id, self.__periodicity)
+        histories.__history_ids = self.__history_ids[start:end]
+        histories.__checkoff_epochs = self.__checkoff_epochs[start:end]
+        histories.__checkoff_periods = self.__checkoff_periods[start:end]
+        histories.__checked_offs = self.__checked_offs[start:end]
+        return histories
+
+    def transform_to_list(self) -> List[int]:
+        """
+        Transforms the checked-off values into a list.
+
+        Returns:
+            List[int]:
+                List of checked-off values in order of check-off time.
+        """
+        return self.__checked_offs.tolist()
+
+    @property
+    def habit_id(self) -> int:
+        """
+        Gets the ID of the habit all histories belong to.
+
+        Returns:
+            int:
+                ID of the habit.
+        """
+        return self.__habit_id
+
+    @property
+    def periodicity(self) -> str:
+        """
+        Gets the periodicity of the habit all histories belong to.
+
+        Returns:
+            str:
+                Periodicity of the habit.
+        """
+        return self.__periodicity
+
+    @property
+    def history_ids(self) -> memoryview:
+        """
+        Gets the history IDs in order of check-off time without copying.
+
+        Returns:
+            memoryview:
+                Buffer of 64 bit history IDs.
+        """
+        return memoryview(self.__history_ids)
+
+    @property
+    def checkoff_epochs(self) -> memoryview:
+        """
+        Gets the check-off datetimes as Unix seconds in order of check-off time without copying.
+
+        Returns:
+            memoryview:
+                Buffer of 64 bit check-off epochs.
+        """
+        return memoryview(self.__checkoff_epochs)
+
+    @property
+    def checkoff_periods(self) -> memoryview:
+        """
+        Gets the period indexes in order of check-off time without copying.
+
+        Returns:
+            memoryview:
+                Buffer of 64 bit period indexes.
+        """
+        return memoryview(self.__checkoff_periods)
+
+    @property
+    def checked_off(self) -> memoryview:
+        """
+        Gets the checked-off values in order of check-off time without copying.
+
+        Returns:
+            memoryview:
+                Buffer of 8 bit checked-off values.
+        """
+        return memoryview(self.__checked_offs)
+
+    @property
+    def histories(self) -> Dict[str, HistoryModel]:
+        """
+        Get a dictionary of history models of the histories.
+
+        The dictionary is created on each call, changes to it do not change the histories.
+
+        Returns:
+            Dict[str, HistoryModel]:
+                Dictionary of history models in order of check-off time.
+        """
+        return {
+            f"{history_id}": HistoryModel.from_row(
+                (history_id, self.__habit_id, Period.string_from_epoch(checkoff_epoch), checked_off)
+            )
+            for history_id, checkoff_epoch, checked_off
+            in zip(self.__history_ids, self.__checkoff_epochs, self.__checked_offs)
+        }
+
+    @histories.setter
+    def histories(self, histories: Dict[str, HistoryModel]) -> None:
+        """
+        Set the histories from a dictionary of history models.
+
+        Period indexes are derived from the check-off epochs and the periodicity of the habit.
+
+        Args:
+            histories (Dict[str, HistoryModel]):
+                Dictionary of history models.
+        """
+        self.__init__(self.__habit_id, self.__periodicity)
+        for history_model in histories.values():
+            checkoff_epoch = Period.epoch_from_string(history_model.checkoff_datetime)
+            self.append(
+                history_model.history_id,
+                checkoff_epoch,
+                Period.index(checkoff_epoch, self.__periodicity),
+                history_model.checked_off
+            )
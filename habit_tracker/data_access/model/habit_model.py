@@ -1,3 +1,4 @@
+from typing import Iterator
 
 from habit_tracker.data_access.model.histories import Histories
 
@@ -9,6 +10,17 @@ class HabitModel:
     The model of a habit contains all data that is also stored in the database.
     """
 
+    __slots__ = (
+        "__habit_id",
+        "__habit_name",
+        "__habit_specification",
+        "__habit_creation",
+        "__habit_periodicity_granularity",
+        "__habit_periodicity_from",
+        "__habit_periodicity_to",
+        "__habit_history"
+    )
+
     def __init__(self):
         """
         Sets all attributes of a habit model representing its data.
@@ -24,6 +36,49 @@ class HabitModel:
         self.__habit_periodicity_to = None
         self.__habit_history = Histories()
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "HabitModel":
+        """
+        Creates a habit model with an empty history from a database row.
+
+        Args:
+            row (tuple):
+                Row of the habits table starting with habit ID, name, specification, creation, periodicity, from and
+                to.
+
+        Returns:
+            HabitModel:
+                Habit model containing the data of the row.
+        """
+        habit_model = cls.__new__(cls)
+        habit_model.__habit_id = row[0]
+        habit_model.__habit_name = row[1]
+        habit_model.__habit_specification = row[2]
+        habit_model.__habit_creation = row[3]
+        habit_model.__habit_periodicity_granularity = row[4]
+        habit_model.__habit_periodicity_from = row[5]
+        habit_model.__habit_periodicity_to = row[6]
+        habit_model.__habit_history = Histories()
+        return habit_model
+
+    def to_row(self) -> tuple:
+        """
+        Gets the data of the model as a row of the habits table.
+
+        Returns:
+            tuple:
+                Row with habit ID, name, specification, creation, periodicity, from and to.
+        """
+        return (
+            self.__habit_id,
+            self.__habit_name,
+            self.__habit_specification,
+            self.__habit_creation,
+            self.__habit_periodicity_granularity,
+            self.__habit_periodicity_from,
+            self.__habit_periodicity_to
+        )
+
     def __str__(self) -> str:
         """
         Outputs data structure as a string.
@@ -34,15 +89,42 @@ class HabitModel:
             str:
                 String representation of a habit model.
         """
-        output = f"Habit-ID: {self.__habit_id}, " \
+        return "".join(line + "\n" for line in self.lines())
+
+    def lines(self, last_histories: int = None, history_summary: bool = False) -> Iterator[str]:
+        """
+        Generates the string representation of the habit model line by line.
+
+        The first line contains the habit data, each further line a history entry. Histories can be truncated to the
+        latest entries or summarized by their number of entries.
+
+        Args:
+            last_histories (int):
+                Number of latest history entries to output, None for all.
+            history_summary (bool):
+                Whether to output the numbers of history entries and check-offs instead of the history entries.
+
+        Returns:
+            Iterator[str]:
+                String representation of the habit model line by line.
+        """
+        header = f"Habit-ID: {self.__habit_id}, " \
                  f"Habit-Name: {self.__habit_name}, " \
                  f"Habit-Specification: {self.__habit_specification}, " \
                  f"Habit-Creation: {self.__habit_creation}, " \
                  f"Habit-Periodicity: {self.__habit_periodicity_granularity}, " \
                  f"Habit-From: {self.__habit_periodicity_from}, " \
                  f"Habit-To: {self.__habit_periodicity_to}, " \
-                 f"Habit-History:\n{str(self.__habit_history)}"
-        return output
+                 f"Habit-History:"
+        if history_summary:
+            checked_offs = self.__habit_history.transform_to_list()
+            yield f"{header} {len(checked_offs)} entries, {sum(checked_offs)} checked-off"
+            return
+        yield header
+        number_omitted = 0 if last_histories is None else len(self.__habit_history) - last_histories
+        if number_omitted > 0:
+            yield f"... {number_omitted} earlier entries not shown"
+        yield from self.__habit_history.lines(last_histories)
 
     @property
     def habit_id(self) -> int:
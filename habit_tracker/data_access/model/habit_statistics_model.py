@@ -0,0 +1,301 @@
+class HabitStatisticsModel:
+    """
+    HabitStatisticsModel is a representation of the statistics of the history of a habit.
+
+    Besides the streaks and the numbers of completed and broken periods, the statistics contain the calendar months,
+    formatted as YYYY-MM, the habit was completed best and worst in, measured by their completion rates.
+    """
+
+    # Names of the statistics in order of the rows of habit statistics models.
+    FIELDS = (
+        "habit_id",
+        "total_completions",
+        "total_breaks",
+        "completion_rate",
+        "current_streak",
+        "longest_streak",
+        "best_period",
+        "best_period_rate",
+        "worst_period",
+        "worst_period_rate"
+    )
+
+    __slots__ = (
+        "__habit_id",
+        "__total_completions",
+        "__total_breaks",
+        "__current_streak",
+        "__longest_streak",
+        "__best_period",
+        "__best_period_rate",
+        "__worst_period",
+        "__worst_period_rate"
+    )
+
+    def __init__(self):
+        """
+        Sets all attributes of a habit statistics model representing its data.
+
+        Constructor initializes all properties to be filled with the statistics of the history of a habit.
+        """
+        self.__habit_id = None
+        self.__total_completions = 0
+        self.__total_breaks = 0
+        self.__current_streak = 0
+        self.__longest_streak = 0
+        self.__best_period = None
+        self.__best_period_rate = None
+        self.__worst_period = None
+        self.__worst_period_rate = None
+
+    def __str__(self) -> str:
+        """
+        Outputs data structure as a string.
+
+        Used to translate a habit statistics model into a string, rates as percentages.
+
+        Returns:
+            str:
+                String representation of a habit statistics model.
+        """
+        output = f"Habit-ID: {self.__habit_id}, " \
+                 f"Completions: {self.__total_completions}, " \
+                 f"Breaks: {self.__total_breaks}, " \
+                 f"Completion-Rate: {self.completion_rate:.1%}, " \
+                 f"Current-Streak: {self.__current_streak}, " \
+                 f"Longest-Streak: {self.__longest_streak}"
+        if self.__best_period is not None:
+            output += f", Best-Period: {self.__best_period} ({self.__best_period_rate:.1%}), " \
+                      f"Worst-Period: {self.__worst_period} ({self.__worst_period_rate:.1%})"
+        return output
+
+    def to_row(self) -> tuple:
+        """
+        Gets the statistics as a row in order of FIELDS.
+
+        Returns:
+            tuple:
+                Row with the statistics of the habit.
+        """
+        return (
+            self.__habit_id,
+            self.__total_completions,
+            self.__total_breaks,
+            self.completion_rate,
+            self.__current_streak,
+            self.__longest_streak,
+            self.__best_period,
+            self.__best_period_rate,
+            self.__worst_period,
+            self.__worst_period_rate
+        )
+
+    @property
+    def habit_id(self) -> int:
+        """
+        Gets the ID of the habit.
+
+        Returns:
+            int:
+                ID of the habit.
+        """
+        return self.__habit_id
+
+    @habit_id.setter
+    def habit_id(self, habit_id: int) -> None:
+        """
+        Sets the ID of the habit.
+
+        Args:
+            habit_id (int):
+                ID of the habit.
+        """
+        self.__habit_id = habit_id
+
+    @property
+    def total_completions(self) -> int:
+        """
+        Gets the number of periods the habit was completed in.
+
+        Returns:
+            int:
+                Number of completed periods.
+        """
+        return self.__total_completions
+
+    @total_completions.setter
+    def total_completions(self, total_completions: int) -> None:
+        """
+        Sets the number of periods the habit was completed in.
+
+        Args:
+            total_completions (int):
+                Number of completed periods.
+        """
+        self.__total_completions = total_completions
+
+    @property
+    def total_breaks(self) -> int:
+        """
+        Gets the number of periods the habit was broken in.
+
+        Returns:
+            int:
+                Number of broken periods.
+        """
+        return self.__total_breaks
+
+    @total_breaks.setter
+    def total_breaks(self, total_breaks: int) -> None:
+        """
+        Sets the number of periods the habit was broken in.
+
+        Args:
+            total_breaks (int):
+                Number of broken periods.
+        """
+        self.__total_breaks = total_breaks
+
+    @property
+    def completion_rate(self) -> float:
+        """
+        Gets the share of periods the habit was completed in.
+
+        Returns:
+            float:
+                Completed periods divided by all periods, zero without history.
+        """
+        total = self.__total_completions + self.__total_breaks
+        return self.__total_completions / total if total > 0 else 0.0
+
+    @property
+    def current_streak(self) -> int:
+        """
+        Gets the length of the run streak the history of the habit ends with.
+
+        Returns:
+            int:
+                Length of the current run streak.
+        """
+        return self.__current_streak
+
+    @current_streak.setter
+    def current_streak(self, current_streak: int) -> None:
+        """
+        Sets the length of the run streak the history of the habit ends with.
+
+        Args:
+            current_streak (int):
+                Length of the current run streak.
+        """
+        self.__current_streak = current_streak
+
+    @property
+    def longest_streak(self) -> int:
+        """
+        Gets the length of the longest run streak of the habit.
+
+        Returns:
+            int:
+                Length of the longest run streak.
+        """
+        return self.__longest_streak
+
+    @longest_streak.setter
+    def longest_streak(self, longest_streak: int) -> None:
+        """
+        Sets the length of the longest run streak of the habit.
+
+        Args:
+            longest_streak (int):
+                Length of the longest run streak.
+        """
+        self.__longest_streak = longest_streak
+
+    @property
+    def best_period(self) -> str:
+        """
+        Gets the month with the highest completion rate, the earliest of equal months.
+
+        Returns:
+            str:
+                Month formatted as YYYY-MM or None without history.
+        """
+        return self.__best_period
+
+    @best_period.setter
+    def best_period(self, best_period: str) -> None:
+        """
+        Sets the month with the highest completion rate.
+
+        Args:
+            best_period (str):
+                Month formatted as YYYY-MM.
+        """
+        self.__best_period = best_period
+
+    @property
+    def best_period_rate(self) -> float:
+        """
+        Gets the completion rate of the month with the highest completion rate.
+
+        Returns:
+            float:
+                Completion rate of the best month or None without history.
+        """
+        return self.__best_period_rate
+
+    @best_period_rate.setter
+    def best_period_rate(self, best_period_rate: float) -> None:
+        """
+        Sets the completion rate of the month with the highest completion rate.
+
+        Args:
+            best_period_rate (float):
+                Completion rate of the best month.
+        """
+        self.__best_period_rate = best_period_rate
+
+    @property
+    def worst_period(self) -> str:
+        """
+        Gets the month with the lowest completion rate, the earliest of equal months.
+
+        Returns:
+            str:
+                Month formatted as YYYY-MM or None without history.
+        """
+        return self.__worst_period
+
+    @worst_period.setter
+    def worst_period(self, worst_period: str) -> None:
+        """
+        Sets the month with the lowest completion rate.
+
+        Args:
+            worst_period (str):
+                Month formatted as YYYY-MM.
+        """
+        self.__worst_period = worst_period
+
+    @property
+    def worst_period_rate(self) -> float:
+        """
+        Gets the completion rate of the month with the lowest completion rate.
+
+        Returns:
+            float:
+                Completion rate of the worst month or None without history.
+        """
+        return self.__worst_period_rate
+
+    @worst_period_rate.setter
+    def worst_period_rate(self, worst_period_rate: float) -> None:
+        """
+        Sets the completion rate of the month with the lowest completion rate.
+
+        Args:
+            worst_period_rate (float):
+                Completion rate of the worst month.
+        """
+        self.__worst_period_rate = worst_period_rate
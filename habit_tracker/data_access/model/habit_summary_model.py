@@ -0,0 +1,179 @@
+class HabitSummaryModel:
+    """
+    HabitSummaryModel is a representation of the streak summary of a habit.
+
+    The summary of a habit is maintained on every check-off, hence streaks can be looked up without reading the history
+    of the habit.
+    """
+
+    __slots__ = (
+        "__habit_id",
+        "__current_streak",
+        "__longest_streak",
+        "__last_checkoff_period",
+        "__total_completions",
+        "__total_breaks"
+    )
+
+    def __init__(self):
+        """
+        Sets all attributes of a habit summary model representing its data.
+
+        Constructor initializes all properties to be filled with actual data of the summary of a habit.
+        """
+        self.__habit_id = None
+        self.__current_streak = 0
+        self.__longest_streak = 0
+        self.__last_checkoff_period = None
+        self.__total_completions = 0
+        self.__total_breaks = 0
+
+    def __str__(self) -> str:
+        """
+        Outputs data structure as a string.
+
+        Used to translate a habit summary model into a string.
+
+        Returns:
+            str:
+                String representation of a habit summary model.
+        """
+        output = f"Habit-ID: {self.__habit_id}, " \
+                 f"Current-Streak: {self.__current_streak}, " \
+                 f"Longest-Streak: {self.__longest_streak}, " \
+                 f"Last-Checkoff-Period: {self.__last_checkoff_period}, " \
+                 f"Total-Completions: {self.__total_completions}, " \
+                 f"Total-Breaks: {self.__total_breaks}"
+        return output
+
+    @property
+    def habit_id(self) -> int:
+        """
+        Gets the ID of the habit.
+
+        Returns:
+            int:
+                ID of the habit.
+        """
+        return self.__habit_id
+
+    @habit_id.setter
+    def habit_id(self, habit_id: int) -> None:
+        """
+        Sets the ID of the habit.
+
+        Args:
+            habit_id (int):
+                ID of the habit.
+        """
+        self.__habit_id = habit_id
+
+    @property
+    def current_streak(self) -> int:
+        """
+        Gets the length of the run streak the history of the habit ends with.
+
+        Returns:
+            int:
+                Length of the current run streak.
+        """
+        return self.__current_streak
+
+    @current_streak.setter
+    def current_streak(self, current_streak: int) -> None:
+        """
+        Sets the length of the run streak the history of the habit ends with.
+
+        Args:
+            current_streak (int):
+                Length of the current run streak.
+        """
+        self.__current_streak = current_streak
+
+    @property
+    def longest_streak(self) -> int:
+        """
+        Gets the length of the longest run streak of the habit.
+
+        Returns:
+            int:
+                Length of the longest run streak.
+        """
+        return self.__longest_streak
+
+    @longest_streak.setter
+    def longest_streak(self, longest_streak: int) -> None:
+        """
+        Sets the length of the longest run streak of the habit.
+
+        Args:
+            longest_streak (int):
+                Length of the longest run streak.
+        """
+        self.__longest_streak = longest_streak
+
+    @property
+    def last_checkoff_period(self) -> int:
+        """
+        Gets the period index of the latest check-off of the habit.
+
+        Returns:
+            int:
+                Period index of the latest check-off or None if never checked-off.
+        """
+        return self.__last_checkoff_period
+
+    @last_checkoff_period.setter
+    def last_checkoff_period(self, last_checkoff_period: int) -> None:
+        """
+        Sets the period index of the latest check-off of the habit.
+
+        Args:
+            last_checkoff_period (int):
+                Period index of the latest check-off.
+        """
+        self.__last_checkoff_period = last_checkoff_period
+
+    @property
+    def total_completions(self) -> int:
+        """
+        Gets the number of periods the habit was completed in.
+
+        Returns:
+            int:
+                Number of completed periods.
+        """
+        return self.__total_completions
+
+    @total_completions.setter
+    def total_completions(self, total_completions: int) -> None:
+        """
+        Sets the number of periods the habit was completed in.
+
+        Args:
+            total_completions (int):
+                Number of completed periods.
+        """
+        self.__total_completions = total_completions
+
+    @property
+    def total_breaks(self) -> int:
+        """
+        Gets the number of periods the habit was broken in.
+
+        Returns:
+            int:
+                Number of broken periods.
+        """
+        return self.__total_breaks
+
+    @total_breaks.setter
+    def total_breaks(self, total_breaks: int) -> None:
+        """
+        Sets the number of periods the habit was broken in.
+
+        Args:
+            total_breaks (int):
+                Number of broken periods.
+        """
+        self.__total_breaks = total_breaks
@@ -1,5 +1,5 @@
 
-from typing import Dict
+from typing import Dict, Iterator
 
 from habit_tracker.data_access.model.habit_model import HabitModel
 
@@ -11,6 +11,8 @@ class Habits:
     Habits is a data structure made of a dictionary of habit models.
     """
 
+    __slots__ = ("__habits",)
+
     def __init__(self):
         """
         Initializes the dictionary of habit models.
@@ -29,10 +31,27 @@ class Habits:
             str:
                 String representation of a dictionary of habit models.
         """
-        output = ""
+        return "".join(line + "\n" for line in self.lines())
+
+    def lines(self, last_histories: int = None, history_summary: bool = False) -> Iterator[str]:
+        """
+        Generates the string representation of the habit models line by line.
+
+        Each habit model is followed by an empty line.
+
+        Args:
+            last_histories (int):
+                Number of latest history entries to output per habit, None for all.
+            history_summary (bool):
+                Whether to output the numbers of history entries and check-offs instead of the history entries.
+
+        Returns:
+            Iterator[str]:
+                String representation of the habit models line by line.
+        """
         for habit in self.__habits.values():
-            output += str(habit) + "\n"
-        return output
+            yield from habit.lines(last_histories, history_summary)
+            yield ""
 
     @property
     def habits(self) -> Dict[str, HabitModel]:
@@ -1,5 +1,6 @@
 
-from typing import Dict, List
+from itertools import islice
+from typing import Dict, Iterator, List
 
 from habit_tracker.data_access.model.history_model import HistoryModel
 
@@ -11,6 +12,8 @@ class Histories:
     Histories is a data structure made of a dictionary of habit models.
     """
 
+    __slots__ = ("__histories",)
+
     def __init__(self):
         """
         Initializes the dictionary of history models.
@@ -29,10 +32,33 @@ class Histories:
             str:
                 String representation of a dictionary of history models.
         """
-        output = ""
-        for history in self.__histories.values():
-            output += str(history) + "\n"
-        return output
+        return "".join(line + "\n" for line in self.lines())
+
+    def __len__(self) -> int:
+        """
+        Gets the number of history entries.
+
+        Returns:
+            int:
+                Number of history entries.
+        """
+        return len(self.__histories)
+
+    def lines(self, last: int = None) -> Iterator[str]:
+        """
+        Generates the string representation of the history models line by line.
+
+        Args:
+            last (int):
+                Number of latest history entries to output, None for all.
+
+        Returns:
+            Iterator[str]:
+                String representation of each history model in order.
+        """
+        start = 0 if last is None else max(len(self.__histories) - last, 0)
+        for history in islice(self.__histories.values(), start, None):
+            yield str(history)
 
     def transform_to_list(self) -> List[int]:
         """
@@ -4,9 +4,12 @@ class HistoryModel:
     """
     HistoryModel is a representation of all data of the history of a habit.
 
-    The model of the history of a habit contains all data that is also stored in the database.
+    The model of the history of a habit contains all data that is also stored in the database. Its attributes are
+    stored in slots instead of an instance dictionary, hence millions of history models can be kept in memory.
     """
 
+    __slots__ = ("__history_id", "__habit_id", "__checkoff_datetime", "__checked_off")
+
     def __init__(self):
         """
         Sets all attributes of a history model representing its data.
@@ -18,6 +21,41 @@ class HistoryModel:
         self.__checkoff_datetime = None
         self.__checked_off = None
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "HistoryModel":
+        """
+        Creates a history model from a database row.
+
+        Args:
+            row (tuple):
+                Row of the histories table starting with history ID, habit ID, datetime and checked-off value.
+
+        Returns:
+            HistoryModel:
+                History model containing the data of the row.
+        """
+        history_model = cls.__new__(cls)
+        history_model.__history_id = row[0]
+        history_model.__habit_id = row[1]
+        history_model.__checkoff_datetime = row[2]
+        history_model.__checked_off = row[3]
+        return history_model
+
+    def to_row(self) -> tuple:
+        """
+        Gets the data of the model as a row of the histories table.
+
+        Returns:
+            tuple:
+                Row with history ID, habit ID, datetime and checked-off value.
+        """
+        return (
+            self.__history_id,
+            self.__habit_id,
+            self.__checkoff_datetime,
+            self.__checked_off
+        )
+
     def __str__(self) -> str:
         """
         Outputs data structure as a string.
@@ -0,0 +1,121 @@
+import calendar
+from datetime import datetime, timedelta
+from typing import Tuple
+
+
+class Period:
+    """
+    Period converts check-off datetimes into integer Unix seconds and period indexes.
+
+    Datetimes are stored without time zone, hence they are converted as if they were UTC. This keeps the conversion
+    reversible and the difference of two epochs identical to the difference of the two datetimes.
+    """
+
+    DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    SECONDS_PER_DAY = 86400
+
+    SECONDS_PER_PERIOD = {
+        "daily": SECONDS_PER_DAY,
+        "weekly": 7 * SECONDS_PER_DAY
+    }
+
+    __EPOCH = datetime(1970, 1, 1)
+
+    @classmethod
+    def epoch_from_datetime(cls, checkoff_datetime: datetime) -> int:
+        """
+        Convert a datetime into Unix seconds.
+
+        Args:
+            checkoff_datetime (datetime):
+                Datetime to be converted.
+
+        Returns:
+            int:
+                Seconds since 1970-01-01 00:00:00.
+        """
+        return calendar.timegm(checkoff_datetime.timetuple())
+
+    @classmethod
+    def epoch_from_string(cls, checkoff_datetime: str) -> int:
+        """
+        Convert a datetime string formatted as YYYY-MM-DD HH:MM:SS into Unix seconds.
+
+        Args:
+            checkoff_datetime (str):
+                Datetime string to be converted.
+
+        Returns:
+            int:
+                Seconds since 1970-01-01 00:00:00.
+        """
+        return cls.epoch_from_datetime(datetime.strptime(checkoff_datetime, cls.DATETIME_FORMAT))
+
+    @classmethod
+    def string_from_epoch(cls, epoch: int) -> str:
+        """
+        Convert Unix seconds into a datetime string formatted as YYYY-MM-DD HH:MM:SS.
+
+        Args:
+            epoch (int):
+                Seconds since 1970-01-01 00:00:00.
+
+        Returns:
+            str:
+                Datetime string of the given seconds.
+        """
+        return (cls.__EPOCH + timedelta(seconds=epoch)).strftime(cls.DATETIME_FORMAT)
+
+    @classmethod
+    def seconds_per_period(cls, periodicity: str) -> int:
+        """
+        Get the length of a period in seconds.
+
+        Habits with other periodicities than weekly are treated as daily habits.
+
+        Args:
+            periodicity (str):
+                Periodicity of a habit, eg daily, weekly.
+
+        Returns:
+            int:
+                Length of a period in seconds.
+        """
+        return cls.SECONDS_PER_PERIOD.get(periodicity, cls.SECONDS_PER_DAY)
+
+    @classmethod
+    def index(cls, epoch: int, periodicity: str) -> int:
+        """
+        Get the index of the period containing the given Unix seconds.
+
+        Args:
+            epoch (int):
+                Seconds since 1970-01-01 00:00:00.
+            periodicity (str):
+                Periodicity of a habit, eg daily, weekly.
+
+        Returns:
+            int:
+                Number of whole periods since 1970-01-01 00:00:00.
+        """
+        return epoch // cls.seconds_per_period(periodicity)
+
+    @classmethod
+    def month_range(cls, epoch: int) -> Tuple[str, int, int]:
+        """
+        Get the calendar month containing the given Unix seconds.
+
+        Args:
+            epoch (int):
+                Seconds since 1970-01-01 00:00:00.
+
+        Returns:
+            Tuple[str, int, int]:
+                Month formatted as YYYY-MM, its first second and the first second of the following month.
+        """
+        month_datetime = cls.__EPOCH + timedelta(seconds=epoch)
+        year, month = month_datetime.year, month_datetime.month
+        start = calendar.timegm((year, month, 1, 0, 0, 0))
+        end = calendar.timegm((year + month // 12, month % 12 + 1, 1, 0, 0, 0))
+        return f"{year:04d}-{month:02d}", start, end
@@ -0,0 +1,448 @@
+"""
+SQL statements used by the data access layer.
+
+All statements use bound parameters, so the SQL text of a statement is the same for every call and SQlite's prepared
+statement cache of a connection is reused instead of parsing the statement again.
+"""
+
+CREATE_HABIT_TABLE = """
+    CREATE TABLE IF NOT EXISTS habits (
+        [habit_id] INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+        [habit_name] VARCHAR(255) NOT NULL,
+        [habit_specification] VARCHAR(255),
+        [habit_creation] DATETIME NOT NULL,
+        [habit_periodicity_granularity] VARCHAR(255) NOT NULL,
+        [habit_periodicity_from] DATE NOT NULL,
+        [habit_periodicity_to] DATE NOT NULL
+    );
+"""
+
+CREATE_HISTORY_TABLE = """
+    CREATE TABLE IF NOT EXISTS histories (
+        [history_id] INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+        [habit_id] INTEGER NOT NULL,
+        [checkoff_datetime] DATETIME NOT NULL,
+        [checked_off] INTEGER NOT NULL,
+        FOREIGN KEY ([habit_id]) REFERENCES "habits" ([habit_id])
+    );
+"""
+
+CREATE_HISTORY_CHECKOFF_INDEX = """
+    CREATE INDEX IF NOT EXISTS [histories_habit_id_checked_off_checkoff_datetime_index]
+    ON histories ([habit_id], [checked_off], [checkoff_datetime]);
+"""
+
+CREATE_HABIT_PERIODICITY_INDEX = """
+    CREATE INDEX IF NOT EXISTS [habits_habit_periodicity_granularity_index]
+    ON habits ([habit_periodicity_granularity]);
+"""
+
+ADD_HISTORY_CHECKOFF_EPOCH_COLUMN = "ALTER TABLE histories ADD COLUMN [checkoff_epoch] INTEGER;"
+
+ADD_HISTORY_CHECKOFF_PERIOD_COLUMN = "ALTER TABLE histories ADD COLUMN [checkoff_period] INTEGER;"
+
+# Check-off datetimes are converted as if they were UTC, see Period.
+UPDATE_HISTORY_CHECKOFF_EPOCHS = """
+    UPDATE histories SET [checkoff_epoch] = CAST(strftime('%s', [checkoff_datetime]) AS INTEGER);
+"""
+
+UPDATE_HISTORY_CHECKOFF_PERIODS = """
+    UPDATE histories SET [checkoff_period] = [checkoff_epoch] / (
+        CASE (SELECT [habit_periodicity_granularity] FROM habits WHERE habits.[habit_id] = histories.[habit_id])
+            WHEN 'weekly' THEN 604800
+            ELSE 86400
+        END
+    );
+"""
+
+UPDATE_HISTORY_CHECKOFF_PERIODS_OF_HABIT = """
+    UPDATE histories SET [checkoff_period] = [checkoff_epoch] / (CASE ? WHEN 'weekly' THEN 604800 ELSE 86400 END)
+    WHERE [habit_id] = ?;
+"""
+
+DROP_HISTORY_CHECKOFF_INDEX = "DROP INDEX IF EXISTS [histories_habit_id_checked_off_checkoff_datetime_index];"
+
+CREATE_HISTORY_CHECKOFF_EPOCH_INDEX = """
+    CREATE INDEX IF NOT EXISTS [histories_habit_id_checkoff_epoch_checked_off_index]
+    ON histories ([habit_id], [checkoff_epoch], [checked_off]);
+"""
+
+CREATE_HABIT_SUMMARY_TABLE = """
+    CREATE TABLE IF NOT EXISTS habit_summaries (
+        [habit_id] INTEGER PRIMARY KEY NOT NULL,
+        [current_streak] INTEGER NOT NULL DEFAULT 0,
+        [longest_streak] INTEGER NOT NULL DEFAULT 0,
+        [last_checkoff_period] INTEGER,
+        [total_completions] INTEGER NOT NULL DEFAULT 0,
+        [total_breaks] INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY ([habit_id]) REFERENCES "habits" ([habit_id])
+    );
+"""
+
+# Summaries are computed from the histories as gaps and islands: within a run of equal checked-off values the position
+# of a history entry and its position among the entries with the same checked-off value grow in lockstep.
+_SELECT_HABIT_SUMMARIES_FROM_HISTORIES = """
+    WITH ordered AS (
+        SELECT
+            [habit_id],
+            [checked_off],
+            [checkoff_period],
+            ROW_NUMBER() OVER (PARTITION BY [habit_id] ORDER BY [checkoff_epoch], [history_id]) AS position,
+            ROW_NUMBER() OVER (
+                PARTITION BY [habit_id], [checked_off] ORDER BY [checkoff_epoch], [history_id]
+            ) AS position_in_state
+        FROM histories
+        {histories_filter}
+    ), runs AS (
+        SELECT [habit_id], [checked_off], COUNT(*) AS length, MAX(position) AS last_position
+        FROM ordered
+        GROUP BY [habit_id], [checked_off], position - position_in_state
+    ), totals AS (
+        SELECT
+            [habit_id],
+            COUNT(*) AS number_histories,
+            SUM([checked_off] = 1) AS completions,
+            SUM([checked_off] != 1) AS breaks,
+            MAX(CASE WHEN [checked_off] = 1 THEN [checkoff_period] END) AS last_checkoff_period
+        FROM ordered
+        GROUP BY [habit_id]
+    )
+    SELECT
+        habits.[habit_id],
+        COALESCE(
+            MAX(CASE WHEN runs.[checked_off] = 1 AND runs.last_position = totals.number_histories THEN runs.length END),
+            0
+        ),
+        COALESCE(MAX(CASE WHEN runs.[checked_off] = 1 THEN runs.length END), 0),
+        totals.last_checkoff_period,
+        COALESCE(totals.completions, 0),
+        COALESCE(totals.breaks, 0)
+    FROM habits
+    LEFT JOIN totals ON totals.[habit_id] = habits.[habit_id]
+    LEFT JOIN runs ON runs.[habit_id] = habits.[habit_id]
+    {habits_filter}
+    GROUP BY habits.[habit_id]
+    ORDER BY habits.[habit_id]
+"""
+
+SELECT_HABIT_SUMMARIES_FROM_HISTORIES = _SELECT_HABIT_SUMMARIES_FROM_HISTORIES.format(
+    histories_filter="",
+    habits_filter=""
+) + ";"
+
+_INSERT_HABIT_SUMMARIES = """
+    INSERT OR REPLACE INTO habit_summaries (
+        [habit_id],
+        [current_streak],
+        [longest_streak],
+        [last_checkoff_period],
+        [total_completions],
+        [total_breaks]
+    )
+"""
+
+INSERT_HABIT_SUMMARIES_FROM_HISTORIES = _INSERT_HABIT_SUMMARIES + SELECT_HABIT_SUMMARIES_FROM_HISTORIES
+
+INSERT_HABIT_SUMMARY_OF_HABIT_FROM_HISTORIES = _INSERT_HABIT_SUMMARIES + _SELECT_HABIT_SUMMARIES_FROM_HISTORIES.format(
+    histories_filter="WHERE [habit_id] = :habit_id",
+    habits_filter="WHERE habits.[habit_id] = :habit_id"
+) + ";"
+
+INSERT_HABIT_SUMMARY = "INSERT OR IGNORE INTO habit_summaries ([habit_id]) VALUES (?);"
+
+# A check-off appended after the latest history entry either extends the current streak or, after broken periods,
+# starts a new one.
+UPDATE_HABIT_SUMMARY_ON_CHECKOFF = """
+    UPDATE habit_summaries
+    SET
+        [current_streak] = CASE WHEN :number_broken > 0 THEN 1 ELSE [current_streak] + 1 END,
+        [longest_streak] = MAX([longest_streak], CASE WHEN :number_broken > 0 THEN 1 ELSE [current_streak] + 1 END),
+        [last_checkoff_period] = :checkoff_period,
+        [total_completions] = [total_completions] + 1,
+        [total_breaks] = [total_breaks] + :number_broken
+    WHERE [habit_id] = :habit_id;
+"""
+
+DELETE_HABIT_SUMMARIES = "DELETE FROM habit_summaries;"
+
+DELETE_HABIT_SUMMARY = "DELETE FROM habit_summaries WHERE [habit_id] = ?;"
+
+SELECT_HABIT_SUMMARIES = "SELECT * FROM habit_summaries ORDER BY [habit_id];"
+
+SELECT_HABIT_SUMMARY_BY_ID = """
+    SELECT habits.[habit_id], [current_streak], [longest_streak], [last_checkoff_period], [total_completions],
+        [total_breaks]
+    FROM habits LEFT JOIN habit_summaries ON habit_summaries.[habit_id] = habits.[habit_id]
+    WHERE habits.[habit_id] = ?;
+"""
+
+SELECT_LONGEST_STREAK = "SELECT COALESCE(MAX([longest_streak]), 0) FROM habit_summaries;"
+
+SELECT_LONGEST_STREAK_BY_PERIODICITY = """
+    SELECT COALESCE(MAX(habit_summaries.[longest_streak]), 0) FROM habit_summaries
+    INNER JOIN habits ON habit_summaries.[habit_id] = habits.[habit_id]
+    WHERE habits.[habit_periodicity_granularity] = ?;
+"""
+
+# Runs of check-offs are gaps-and-islands: the number of breaks up to an entry numbers the run the entry belongs to,
+# each run being a break followed by check-offs. The current run is the run numbered highest, its length is taken along
+# with the number in a single MAX by packing both into one integer. Entries with the same check-off time are ordered by
+# check-off state, hence SQLite reads the histories in order of their index instead of sorting them.
+_SELECT_RUN_STREAKS = """
+    WITH ordered AS (
+        SELECT
+            [habit_id],
+            [checked_off],
+            SUM([checked_off] != 1) OVER (
+                PARTITION BY [habit_id] ORDER BY [checkoff_epoch], [checked_off], [history_id] ROWS UNBOUNDED PRECEDING
+            ) AS run
+        FROM histories
+        {histories_filter}
+    ), runs AS (
+        SELECT [habit_id], run, SUM([checked_off] = 1) AS length
+        FROM ordered
+        GROUP BY [habit_id], run
+    ), streaks AS (
+        SELECT [habit_id], MAX(length) AS longest, MAX((run << 32) | length) & 4294967295 AS current
+        FROM runs
+        GROUP BY [habit_id]
+    )
+    SELECT habits.[habit_id], COALESCE(streaks.longest, 0), COALESCE(streaks.current, 0)
+    FROM habits
+    LEFT JOIN streaks ON streaks.[habit_id] = habits.[habit_id]
+    {habits_filter}
+    ORDER BY habits.[habit_id];
+"""
+
+SELECT_RUN_STREAKS = _SELECT_RUN_STREAKS.format(histories_filter="", habits_filter="")
+
+SELECT_RUN_STREAKS_BY_PERIODICITY = _SELECT_RUN_STREAKS.format(
+    histories_filter="""WHERE [habit_id] IN (
+            SELECT [habit_id] FROM habits WHERE [habit_periodicity_granularity] = :periodicity
+        )""",
+    habits_filter="WHERE habits.[habit_periodicity_granularity] = :periodicity"
+)
+
+SELECT_RUN_STREAKS_OF_HABIT = _SELECT_RUN_STREAKS.format(
+    histories_filter="WHERE [habit_id] = :habit_id",
+    habits_filter="WHERE habits.[habit_id] = :habit_id"
+)
+
+# Windows of check-off time are searched in the index per habit, hence the histories of all habits are filtered by the
+# IDs of the habits, which lets SQLite seek the start of the window of each habit instead of scanning all histories.
+_CHECKOFF_EPOCH_BETWEEN = "[checkoff_epoch] >= :since AND [checkoff_epoch] < :until"
+
+SELECT_RUN_STREAKS_BETWEEN = _SELECT_RUN_STREAKS.format(
+    histories_filter=f"WHERE [habit_id] IN (SELECT [habit_id] FROM habits) AND {_CHECKOFF_EPOCH_BETWEEN}",
+    habits_filter=""
+)
+
+SELECT_RUN_STREAKS_BY_PERIODICITY_BETWEEN = _SELECT_RUN_STREAKS.format(
+    histories_filter=f"""WHERE [habit_id] IN (
+            SELECT [habit_id] FROM habits WHERE [habit_periodicity_granularity] = :periodicity
+        ) AND {_CHECKOFF_EPOCH_BETWEEN}""",
+    habits_filter="WHERE habits.[habit_periodicity_granularity] = :periodicity"
+)
+
+SELECT_RUN_STREAKS_OF_HABIT_BETWEEN = _SELECT_RUN_STREAKS.format(
+    histories_filter=f"WHERE [habit_id] = :habit_id AND {_CHECKOFF_EPOCH_BETWEEN}",
+    habits_filter="WHERE habits.[habit_id] = :habit_id"
+)
+
+SELECT_LATEST_EPOCH_OF_HABIT = "SELECT MAX([checkoff_epoch]) FROM histories WHERE [habit_id] = ?;"
+
+DROP_HABIT_SUMMARY_TABLE = "DROP TABLE IF EXISTS habit_summaries;"
+
+SELECT_SCHEMA_VERSION = "PRAGMA user_version;"
+
+# PRAGMA statements do not accept bound parameters, the version is formatted in as integer.
+UPDATE_SCHEMA_VERSION = "PRAGMA user_version = {version:d};"
+
+BEGIN_TRANSACTION = "BEGIN;"
+
+BEGIN_IMMEDIATE_TRANSACTION = "BEGIN IMMEDIATE;"
+
+SAVEPOINT_CHECKOFF = "SAVEPOINT checkoff;"
+
+ROLLBACK_TO_SAVEPOINT_CHECKOFF = "ROLLBACK TO checkoff;"
+
+RELEASE_SAVEPOINT_CHECKOFF = "RELEASE checkoff;"
+
+DROP_HISTORY_TABLE = "DROP TABLE histories;"
+
+DROP_HABIT_TABLE = "DROP TABLE habits;"
+
+INSERT_HABIT = """
+    INSERT INTO habits (
+        [habit_name],
+        [habit_specification],
+        [habit_creation],
+        [habit_periodicity_granularity],
+        [habit_periodicity_from],
+        [habit_periodicity_to]
+    ) VALUES (?, ?, ?, ?, ?, ?);
+"""
+
+# Epoch and period index are derived from the check-off datetime and the periodicity of the habit.
+INSERT_HISTORY = """
+    INSERT INTO histories (
+        [habit_id],
+        [checkoff_datetime],
+        [checked_off],
+        [checkoff_epoch],
+        [checkoff_period]
+    ) VALUES (
+        ?1,
+        ?2,
+        ?3,
+        CAST(strftime('%s', ?2) AS INTEGER),
+        CAST(strftime('%s', ?2) AS INTEGER) / (
+            CASE (SELECT [habit_periodicity_granularity] FROM habits WHERE [habit_id] = ?1)
+                WHEN 'weekly' THEN 604800
+                ELSE 86400
+            END
+        )
+    );
+"""
+
+INSERT_HISTORY_WITH_PERIOD = """
+    INSERT INTO histories (
+        [habit_id],
+        [checkoff_datetime],
+        [checked_off],
+        [checkoff_epoch],
+        [checkoff_period]
+    ) VALUES (?, ?, ?, ?, ?);
+"""
+
+# Habits and histories are imported with their IDs, IDs left empty are assigned on inserting.
+INSERT_HABIT_RECORD = """
+    INSERT INTO habits (
+        [habit_id],
+        [habit_name],
+        [habit_specification],
+        [habit_creation],
+        [habit_periodicity_granularity],
+        [habit_periodicity_from],
+        [habit_periodicity_to]
+    ) VALUES (?, ?, ?, ?, ?, ?, ?);
+"""
+
+# The period index is derived from the check-off datetime and the length of a period of the habit in seconds.
+INSERT_HISTORY_RECORD = """
+    INSERT INTO histories (
+        [history_id],
+        [habit_id],
+        [checkoff_datetime],
+        [checked_off],
+        [checkoff_epoch],
+        [checkoff_period]
+    ) VALUES (?1, ?2, ?3, ?4, CAST(strftime('%s', ?3) AS INTEGER), CAST(strftime('%s', ?3) AS INTEGER) / ?5);
+"""
+
+SELECT_HISTORY_WITHOUT_EPOCH = "SELECT [checkoff_datetime] FROM histories WHERE [checkoff_epoch] IS NULL LIMIT 1;"
+
+DROP_HISTORY_CHECKOFF_EPOCH_INDEX = "DROP INDEX IF EXISTS [histories_habit_id_checkoff_epoch_checked_off_index];"
+
+DROP_HABIT_PERIODICITY_INDEX = "DROP INDEX IF EXISTS [habits_habit_periodicity_granularity_index];"
+
+UPDATE_HABIT = """
+    UPDATE habits
+    SET
+        [habit_name] = ?,
+        [habit_specification] = ?,
+        [habit_periodicity_granularity] = ?,
+        [habit_periodicity_from] = ?,
+        [habit_periodicity_to] = ?
+    WHERE [habit_id] = ?;
+"""
+
+DELETE_HABIT = "DELETE FROM habits WHERE [habit_id] = ?;"
+
+DELETE_HISTORIES_OF_HABIT = "DELETE FROM histories WHERE [habit_id] = ?;"
+
+SELECT_ANY_HABIT = "SELECT 1 FROM habits LIMIT 1;"
+
+SELECT_ANY_HISTORY = "SELECT 1 FROM histories LIMIT 1;"
+
+SELECT_HABIT_BY_ID = "SELECT * FROM habits WHERE [habit_id] = ?;"
+
+SELECT_HISTORY_BY_ID = "SELECT * FROM histories WHERE [history_id] = ?;"
+
+SELECT_HISTORIES_BY_HABIT_ID = """
+    SELECT * FROM histories WHERE [habit_id] = ? ORDER BY [checkoff_epoch], [history_id];
+"""
+
+SELECT_HISTORIES_BY_HABIT_ID_BETWEEN = """
+    SELECT * FROM histories
+    WHERE [habit_id] = :habit_id AND [checkoff_epoch] >= :since AND [checkoff_epoch] < :until
+    ORDER BY [checkoff_epoch], [history_id];
+"""
+
+SELECT_ALL_HABITS = "SELECT * FROM habits ORDER BY [habit_id];"
+
+SELECT_ALL_HISTORIES = "SELECT * FROM histories ORDER BY [habit_id], [checkoff_epoch], [history_id];"
+
+SELECT_ALL_HISTORIES_BETWEEN = """
+    SELECT histories.* FROM habits
+    INNER JOIN histories ON histories.[habit_id] = habits.[habit_id]
+    WHERE histories.[checkoff_epoch] >= :since AND histories.[checkoff_epoch] < :until
+    ORDER BY habits.[habit_id], histories.[checkoff_epoch], histories.[history_id];
+"""
+
+# Pages of habits are selected by keyset pagination on the habit ID, a limit of -1 selects all remaining habits.
+SELECT_HABITS_PAGE = """
+    SELECT * FROM habits
+    WHERE [habit_id] > :after_habit_id
+        AND (:periodicity IS NULL OR [habit_periodicity_granularity] = :periodicity)
+    ORDER BY [habit_id] LIMIT :limit;
+"""
+
+SELECT_HISTORIES_OF_HABITS_PAGE = """
+    SELECT histories.* FROM histories
+    INNER JOIN habits ON histories.[habit_id] = habits.[habit_id]
+    WHERE histories.[habit_id] > :after_habit_id AND histories.[habit_id] <= :last_habit_id
+        AND (:periodicity IS NULL OR habits.[habit_periodicity_granularity] = :periodicity)
+    ORDER BY histories.[habit_id], histories.[checkoff_epoch], histories.[history_id];
+"""
+
+SELECT_HABIT_RECORDS = """
+    SELECT * FROM habits WHERE :periodicity IS NULL OR [habit_periodicity_granularity] = :periodicity
+    ORDER BY [habit_id];
+"""
+
+SELECT_HISTORY_RECORDS = """
+    SELECT histories.[history_id], histories.[habit_id], [checkoff_datetime], [checked_off], [checkoff_epoch]
+    FROM histories INNER JOIN habits ON histories.[habit_id] = habits.[habit_id]
+    WHERE [checkoff_epoch] >= :since AND [checkoff_epoch] < :until
+        AND (:periodicity IS NULL OR habits.[habit_periodicity_granularity] = :periodicity)
+    ORDER BY histories.[habit_id], [checkoff_epoch], histories.[history_id];
+"""
+
+SELECT_HABITS_BY_PERIODICITY = "SELECT * FROM habits WHERE [habit_periodicity_granularity] = ? ORDER BY [habit_id];"
+
+SELECT_HISTORIES_BY_PERIODICITY = """
+    SELECT histories.* FROM histories
+    INNER JOIN habits ON histories.[habit_id] = habits.[habit_id]
+    WHERE habits.[habit_periodicity_granularity] = ?
+    ORDER BY histories.[habit_id], histories.[checkoff_epoch], histories.[history_id];
+"""
+
+SELECT_HISTORIES_BY_PERIODICITY_BETWEEN = """
+    SELECT histories.* FROM habits
+    INNER JOIN histories ON histories.[habit_id] = habits.[habit_id]
+    WHERE habits.[habit_periodicity_granularity] = :periodicity
+        AND histories.[checkoff_epoch] >= :since AND histories.[checkoff_epoch] < :until
+    ORDER BY habits.[habit_id], histories.[checkoff_epoch], histories.[history_id];
+"""
+
+SELECT_PERIODICITY_OF_HABIT = """
+    SELECT [habit_periodicity_granularity], CAST(strftime('%s', [habit_periodicity_from]) AS INTEGER) FROM habits
+    WHERE [habit_id] = ?;
+"""
+
+SELECT_LATEST_CHECKOFF_OF_HABIT = """
+    SELECT [checkoff_epoch] FROM histories
+    WHERE [habit_id] = ? AND [checked_off] = 1
+    ORDER BY [checkoff_epoch] DESC LIMIT 1;
+"""
@@ -0,0 +1,286 @@
+import csv
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import BinaryIO, Iterator, List, TextIO, Union
+
+from habit_tracker.data_access.period import Period
+
+
+class Records:
+    """
+    Records is the flat layout of habits and histories in bulk imported and exported files.
+
+    Every record is either a habit or a history entry, told apart by its record type, and has the fields of its
+    database table. CSV files have a header row with all fields and leave the fields of the other record type empty,
+    JSON Lines files have a JSON object per line with the fields of its record type. Habits precede their histories.
+
+    Columnar files are binary. They start with a magic number followed by blocks of records of the same type, each
+    block stores its records field by field as zlib compressed column. Integers are stored as little-endian 64-bit
+    integers, check-off states as bytes, check-off datetimes as Unix seconds and strings UTF-8 encoded with their
+    lengths in front, -1 for empty fields.
+    """
+
+    HABIT = "habit"
+    HISTORY = "history"
+
+    # Formats of record files, columnar files are read from and written to binary streams.
+    FORMATS = ("csv", "jsonl", "columnar")
+    BINARY_FORMATS = ("columnar",)
+
+    HABIT_FIELDS = (
+        "habit_id",
+        "habit_name",
+        "habit_specification",
+        "habit_creation",
+        "habit_periodicity_granularity",
+        "habit_periodicity_from",
+        "habit_periodicity_to"
+    )
+    HISTORY_FIELDS = ("history_id", "habit_id", "checkoff_datetime", "checked_off")
+    FIELDS = ("record_type",) + HABIT_FIELDS + HISTORY_FIELDS[:1] + HISTORY_FIELDS[2:]
+
+    __INTEGER_FIELDS = ("habit_id", "history_id", "checked_off")
+
+    __FORMATS_BY_EXTENSION = {"csv": "csv", "jsonl": "jsonl", "ndjson": "jsonl", "htc": "columnar"}
+
+    __MAGIC = b"HTRECORDS\x01"
+    __BLOCK_HEADER = struct.Struct("<BI")
+    __COLUMN_HEADER = struct.Struct("<I")
+    __RECORD_TYPE_CODES = {HABIT: 1, HISTORY: 2}
+    # Columns of a block as field name, array type code or None for strings, and position in the rows written.
+    __COLUMNS = {
+        HABIT: tuple((field, "q" if field == "habit_id" else None, index) for index, field in enumerate(HABIT_FIELDS)),
+        HISTORY: (("history_id", "q", 0), ("habit_id", "q", 1), ("checkoff_epoch", "q", 4), ("checked_off", "b", 3))
+    }
+
+    @classmethod
+    def format_of(cls, file_name: str, default: str = "csv") -> str:
+        """
+        Get the format of a record file from its file extension.
+
+        Args:
+            file_name (str):
+                Name of the record file.
+            default (str):
+                Format of files without a known file extension, eg standard input.
+
+        Returns:
+            str:
+                Format of the record file, one of FORMATS.
+        """
+        extension = os.path.splitext(file_name)[1].lstrip(".").lower()
+        return cls.__FORMATS_BY_EXTENSION.get(extension, default)
+
+    @classmethod
+    def read(cls, stream: Union[TextIO, BinaryIO], file_format: str = "csv") -> Iterator[dict]:
+        """
+        Parse records from a stream one at a time.
+
+        Empty fields are read as None and IDs and check-off states as integers.
+
+        Args:
+            stream (Union[TextIO, BinaryIO]):
+                Text stream of a record file, binary stream for binary formats.
+            file_format (str):
+                Format of the record file, one of FORMATS.
+
+        Returns:
+            Iterator[dict]:
+                Records with their fields by name.
+        """
+        if file_format == "csv":
+            records = csv.DictReader(stream)
+        elif file_format == "jsonl":
+            records = (json.loads(line) for line in stream if line.strip())
+        elif file_format == "columnar":
+            yield from cls.__read_columnar(stream)
+            return
+        else:
+            raise ValueError(f"Unknown record format {file_format}, expected one of {', '.join(cls.FORMATS)}.")
+        for record in records:
+            for field, value in record.items():
+                if value == "":
+                    record[field] = None
+                elif field in cls.__INTEGER_FIELDS and value is not None:
+                    record[field] = int(value)
+            yield record
+
+    @classmethod
+    def write_header(cls, stream: Union[TextIO, BinaryIO], file_format: str = "csv") -> None:
+        """
+        Write the beginning of a record file.
+
+        Args:
+            stream (Union[TextIO, BinaryIO]):
+                Text stream of a record file, binary stream for binary formats.
+            file_format (str):
+                Format of the record file, one of FORMATS.
+        """
+        if file_format == "csv":
+            csv.writer(stream).writerow(cls.FIELDS)
+        elif file_format == "columnar":
+            stream.write(cls.__MAGIC)
+        elif file_format != "jsonl":
+            raise ValueError(f"Unknown record format {file_format}, expected one of {', '.join(cls.FORMATS)}.")
+
+    @classmethod
+    def write(cls, stream: Union[TextIO, BinaryIO], file_format: str, record_type: str, rows: List[tuple]) -> None:
+        """
+        Write a batch of records of the same type.
+
+        Habit rows have the fields in order of HABIT_FIELDS, history rows the fields in order of HISTORY_FIELDS followed
+        by the check-off datetime as Unix seconds.
+
+        Args:
+            stream (Union[TextIO, BinaryIO]):
+                Text stream of a record file, binary stream for binary formats.
+            file_format (str):
+                Format of the record file, one of FORMATS.
+            record_type (str):
+                Type of the records, HABIT or HISTORY.
+            rows (List[tuple]):
+                Rows of the records.
+        """
+        if file_format == "csv":
+            if record_type == cls.HABIT:
+                csv.writer(stream).writerows((cls.HABIT,) + tuple(row) + (None, None, None) for row in rows)
+            else:
+                padding = (None,) * (len(cls.HABIT_FIELDS) - 1)
+                csv.writer(stream).writerows(
+                    (cls.HISTORY, row[1]) + padding + (row[0], row[2], row[3]) for row in rows
+                )
+        elif file_format == "jsonl":
+            fields = ("record_type",) + (cls.HABIT_FIELDS if record_type == cls.HABIT else cls.HISTORY_FIELDS)
+            stream.writelines(
+                json.dumps(dict(zip(fields, (record_type,) + tuple(row[:len(fields) - 1])))) + "\n" for row in rows
+            )
+        elif file_format == "columnar":
+            stream.write(cls.__BLOCK_HEADER.pack(cls.__RECORD_TYPE_CODES[record_type], len(rows)))
+            for _, typecode, index in cls.__COLUMNS[record_type]:
+                data = cls.__encode_column([row[index] for row in rows], typecode)
+                stream.write(cls.__COLUMN_HEADER.pack(len(data)))
+                stream.write(data)
+        else:
+            raise ValueError(f"Unknown record format {file_format}, expected one of {', '.join(cls.FORMATS)}.")
+
+    @classmethod
+    def __encode_column(cls, values: list, typecode: str) -> bytes:
+        """
+        Encode and compress a column of a columnar block.
+
+        Args:
+            values (list):
+                Values of the column.
+            typecode (str):
+                Array type code of integer columns or None for string columns.
+
+        Returns:
+            bytes:
+                Compressed column.
+        """
+        if typecode is None:
+            encoded = [None if value is None else str(value).encode("utf-8") for value in values]
+            column = array("i", (-1 if value is None else len(value) for value in encoded))
+            strings = b"".join(value for value in encoded if value is not None)
+        else:
+            column = array(typecode, values)
+            strings = b""
+        if sys.byteorder == "big":
+            column.byteswap()
+        return zlib.compress(column.tobytes() + strings, 1)
+
+    @classmethod
+    def __decode_column(cls, data: bytes, typecode: str, length: int) -> list:
+        """
+        Decompress and decode a column of a columnar block.
+
+        Args:
+            data (bytes):
+                Compressed column.
+            typecode (str):
+                Array type code of integer columns or None for string columns.
+            length (int):
+                Number of values in the column.
+
+        Returns:
+            list:
+                Values of the column.
+        """
+        data = zlib.decompress(data)
+        column = array("i" if typecode is None else typecode)
+        column.frombytes(data[:length * column.itemsize])
+        if sys.byteorder == "big":
+            column.byteswap()
+        if typecode is not None:
+            return column.tolist()
+        values = list()
+        position = length * column.itemsize
+        for size in column:
+            if size < 0:
+                values.append(None)
+            else:
+                values.append(data[position:position + size].decode("utf-8"))
+                position += size
+        return values
+
+    @classmethod
+    def __read_exactly(cls, stream: BinaryIO, size: int) -> bytes:
+        """
+        Read a number of bytes from a columnar record file.
+
+        Args:
+            stream (BinaryIO):
+                Binary stream of a columnar record file.
+            size (int):
+                Number of bytes to read.
+
+        Returns:
+            bytes:
+                Bytes read.
+        """
+        data = stream.read(size)
+        if len(data) != size:
+            raise ValueError("Columnar record file is truncated.")
+        return data
+
+    @classmethod
+    def __read_columnar(cls, stream: BinaryIO) -> Iterator[dict]:
+        """
+        Parse records from a columnar record file block by block.
+
+        Args:
+            stream (BinaryIO):
+                Binary stream of a columnar record file.
+
+        Returns:
+            Iterator[dict]:
+                Records with their fields by name.
+        """
+        if stream.read(len(cls.__MAGIC)) != cls.__MAGIC:
+            raise ValueError("Stream is not a columnar record file.")
+        record_types = {code: record_type for record_type, code in cls.__RECORD_TYPE_CODES.items()}
+        while True:
+            header = stream.read(cls.__BLOCK_HEADER.size)
+            if not header:
+                return
+            if len(header) != cls.__BLOCK_HEADER.size:
+                raise ValueError("Columnar record file is truncated.")
+            code, length = cls.__BLOCK_HEADER.unpack(header)
+            if code not in record_types:
+                raise ValueError(f"Unknown record type code {code}.")
+            record_type = record_types[code]
+            fields = [field for field, _, _ in cls.__COLUMNS[record_type]]
+            columns = list()
+            for _, typecode, _ in cls.__COLUMNS[record_type]:
+                size = cls.__COLUMN_HEADER.unpack(cls.__read_exactly(stream, cls.__COLUMN_HEADER.size))[0]
+                columns.append(cls.__decode_column(cls.__read_exactly(stream, size), typecode, length))
+            for values in zip(*columns):
+                record = dict(zip(fields, values))
+                record["record_type"] = record_type
+                if record_type == cls.HISTORY:
+                    record["checkoff_datetime"] = Period.string_from_epoch(record.pop("checkoff_epoch"))
+                yield record
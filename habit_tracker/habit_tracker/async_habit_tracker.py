@@ -0,0 +1,356 @@
+import functools
+import os
+from datetime import datetime
+from typing import List, Tuple, Union
+
+from habit_tracker.data_access.async_data_access import AsyncDataAccess
+from habit_tracker.data_access.data_access import DataAccess
+from habit_tracker.data_access.model.habit_statistics_model import HabitStatisticsModel
+from habit_tracker.data_access.model.habits import Habits
+from habit_tracker.habit_tracker.habit_tracker import HabitTracker
+
+
+class AsyncHabitTracker:
+    """
+    AsyncHabitTracker is the central entry-point containing all business logic for asyncio applications.
+
+    AsyncHabitTracker mirrors the methods of HabitTracker as coroutines, the database is accessed by an asynchronous data
+    access object without blocking the event loop. Run streaks, statistics and batches of check-offs are determined by
+    a HabitTracker with the same streak backend running on the data access object in its executor thread.
+    """
+
+    def __init__(self):
+        """
+        Set the initial values needed.
+
+        Constructor creates the property for the asynchronous data access object and takes the streak backend from the
+        environment variable HABIT_TRACKER_STREAK_BACKEND, summary if not set.
+        """
+        self.__data_access = None
+        self.__streak_backend = None
+        self.streak_backend = os.environ.get(HabitTracker.STREAK_BACKEND_ENVIRONMENT_VARIABLE, "summary")
+
+    @property
+    def data_access(self) -> AsyncDataAccess:
+        """
+        Get the asynchronous data access object for accessing the database.
+
+        Returns:
+            AsyncDataAccess:
+                Asynchronous data access object assigned.
+        """
+        return self.__data_access
+
+    @data_access.setter
+    def data_access(self, data_access: AsyncDataAccess) -> None:
+        """
+        Set the asynchronous data access object for storing habit data into a database.
+
+        Args:
+            data_access (AsyncDataAccess):
+                Specific asynchronous data access object to be assigned.
+        """
+        self.__data_access = data_access
+
+    @property
+    def streak_backend(self) -> str:
+        """
+        Get the streak backend used to determine longest run streaks.
+
+        Returns:
+            str:
+                Name of the streak backend, eg summary, python, sql.
+        """
+        return self.__streak_backend
+
+    @streak_backend.setter
+    def streak_backend(self, streak_backend: str) -> None:
+        """
+        Set the streak backend used to determine longest run streaks.
+
+        Args:
+            streak_backend (str):
+                Name of the streak backend, eg summary, python, sql.
+        """
+        if streak_backend not in HabitTracker.STREAK_BACKENDS:
+            raise ValueError(f"Streak backend '{streak_backend}' does not exist, choose one of: "
+                             f"{', '.join(HabitTracker.STREAK_BACKENDS)}.")
+        self.__streak_backend = streak_backend
+
+    async def __run(self, method, *args, **kwargs):
+        """
+        Run a method of HabitTracker on the data access object in its executor thread.
+
+        Args:
+            method:
+                Method of HabitTracker, called with a habit tracker as first argument.
+            *args:
+                Arguments passed to the method.
+            **kwargs:
+                Keyword arguments passed to the method.
+
+        Returns:
+            Return value of the method.
+        """
+        return await self.__data_access.run(functools.partial(self.__call, method), *args, **kwargs)
+
+    def __call(self, method, data_access: DataAccess, *args, **kwargs):
+        """
+        Call a method of a habit tracker using the data access object, only to be run in the executor thread.
+        """
+        habit_tracker = HabitTracker()
+        habit_tracker.data_access = data_access
+        habit_tracker.streak_backend = self.__streak_backend
+        return method(habit_tracker, *args, **kwargs)
+
+    async def initialize_db(self) -> None:
+        """
+        Execute the initialization of the database with the predefined habits.
+        """
+        await self.__data_access.initialize_db(HabitTracker.initial_data(datetime.now()))
+
+    async def migrate_db(self) -> int:
+        """
+        Execute the migration of the database schema.
+
+        Returns:
+            int:
+                Version of the database schema after migrating.
+        """
+        return await self.__data_access.migrate()
+
+    async def create_new_habit(self, name: str, description: str, period: str, habit_from: str, habit_to: str) -> int:
+        """
+        Executes the creation of a new habit in the database.
+
+        Args:
+            name (str):
+                Name of the new habit.
+            description (str):
+                Description of the new habit.
+            period (str):
+                Periodicity of the new habit.
+            habit_from (str):
+                Start date of the habit.
+            habit_to (str):
+                End date of the habit.
+
+        Returns:
+            int: ID of the newly created habit entry.
+        """
+        return await self.__data_access.create_new_habit(name, description, period, habit_from, habit_to)
+
+    async def delete_habit(self, habit_id: int) -> None:
+        """
+        Executes the deletion of a habit in the database.
+
+        Args:
+            habit_id (int):
+                ID of a habit to be deleted.
+        """
+        await self.__data_access.delete_habit(habit_id)
+
+    async def modify_habit(self, habit_id: int, name, description, period, habit_from, habit_to) -> int:
+        """
+        Executes the modification of a habit in the database.
+
+        Args:
+            habit_id (int):
+                ID of a habit to be modified.
+            name (str):
+                Name of the habit to be modified.
+            description (str):
+                Description of the habit to be modified.
+            period (str):
+                Periodicity of the habit to be modified.
+            habit_from (str):
+                Start date of the habit.
+            habit_to (str):
+                End date of the habit.
+
+        Returns:
+            int:
+                ID of modified habit.
+        """
+        return await self.__data_access.modify_habit(habit_id, name, description, period, habit_from, habit_to)
+
+    async def complete_habit(self, habit_id: int) -> int:
+        """
+        Set last habit to be completed or broken.
+
+        Args:
+            habit_id (int):
+                ID of a habit to be modified.
+        Returns:
+            int:
+                ID of the newly created histories entry.
+        """
+        return await self.__data_access.complete_habit(habit_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    async def complete_habits(self, checkoffs: List[Tuple[int, str]]) -> List[Union[int, Exception]]:
+        """
+        Check off many habits within a single transaction, see HabitTracker.complete_habits.
+
+        Args:
+            checkoffs (List[Tuple[int, str]]):
+                Habit IDs and datetimes of the check-offs, None for now.
+
+        Returns:
+            List[Union[int, Exception]]:
+                ID of the history entry inserted last or the error of each check-off.
+        """
+        return await self.__run(HabitTracker.complete_habits, checkoffs)
+
+    async def show_all_habits(self) -> Habits:
+        """
+        List all habits in the database.
+
+        Returns:
+            Habits:
+                Dictionary containing all habits in the database.
+        """
+        return await self.__data_access.get_all_habits()
+
+    async def show_all_habits_by_periodicity(self, periodicity: str) -> Habits:
+        """
+        Get a dictionary of habit models with habits that have a specific periodicity.
+
+        Args:
+            periodicity (str):
+                Periodicity of the habits to be listed.
+
+        Returns:
+            Habits:
+                A dictionary of habit models with a specific periodicity.
+        """
+        return await self.__data_access.get_all_habits_by_periodicity(periodicity)
+
+    async def calc_longest_run_streak(self, since: datetime = None, until: datetime = None) -> int:
+        """
+        Determine the longest streak over all habits in the database with the streak backend in use.
+
+        Args:
+            since (datetime):
+                Start of the window of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time, exclusive, or None for no end.
+
+        Returns:
+            int:
+                Longest run streak over all habits.
+        """
+        return await self.__run(HabitTracker.calc_longest_run_streak, since, until)
+
+    async def calc_longest_run_streak_by_periodicity(self, periodicity: str, since: datetime = None,
+                                                     until: datetime = None) -> int:
+        """
+        Determine the longest streak over all habits with a specific periodicity with the streak backend in use.
+
+        Args:
+            periodicity (str):
+                Periodicity of the habits for which the longest streak is to be calculated.
+            since (datetime):
+                Start of the window of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time, exclusive, or None for no end.
+
+        Returns:
+            int:
+                Longest run streak over all habits given the periodicity.
+        """
+        return await self.__run(HabitTracker.calc_longest_run_streak_by_periodicity, periodicity, since, until)
+
+    async def calc_longest_run_streak_of_habit(self, habit_id: int, since: datetime = None,
+                                               until: datetime = None) -> int:
+        """
+        Determine the longest streak of a habit with the streak backend in use.
+
+        Args:
+            habit_id (int):
+                ID of the habit for which the longest streak is to be calculated.
+            since (datetime):
+                Start of the window of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time, exclusive, or None for no end.
+
+        Returns:
+            int:
+                Longest run streak over a habit given.
+        """
+        return await self.__run(HabitTracker.calc_longest_run_streak_of_habit, habit_id, since, until)
+
+    async def calc_rolling_longest_run_streaks(self, habit_id: int, window: int, since: datetime = None,
+                                               until: datetime = None) -> List[Tuple[str, int]]:
+        """
+        Determine the longest streak of a habit within a rolling window ending at each entry of its history.
+
+        Args:
+            habit_id (int):
+                ID of the habit for which the longest streaks are to be calculated.
+            window (int):
+                Number of periods of each rolling window.
+            since (datetime):
+                Start of the window of check-off time of the history, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time of the history, exclusive, or None for no end.
+
+        Returns:
+            List[Tuple[str, int]]:
+                Check-off datetime of each history entry and the longest streak of the rolling window ending there.
+        """
+        return await self.__run(HabitTracker.calc_rolling_longest_run_streaks, habit_id, window, since, until)
+
+    async def calc_statistics(self) -> List[HabitStatisticsModel]:
+        """
+        Determine the statistics of all habits in the database.
+
+        Returns:
+            List[HabitStatisticsModel]:
+                Statistics of all habits in order of their IDs.
+        """
+        return await self.__run(HabitTracker.calc_statistics)
+
+    async def calc_statistics_by_periodicity(self, periodicity: str) -> List[HabitStatisticsModel]:
+        """
+        Determine the statistics of all habits with a specific periodicity in the database.
+
+        Args:
+            periodicity (str):
+                Periodicity of the habits for which the statistics are to be determined.
+
+        Returns:
+            List[HabitStatisticsModel]:
+                Statistics of all habits given the periodicity in order of their IDs.
+        """
+        return await self.__run(HabitTracker.calc_statistics_by_periodicity, periodicity)
+
+    async def calc_statistics_of_habit(self, habit_id: int) -> HabitStatisticsModel:
+        """
+        Determine the statistics of a habit in the database.
+
+        Args:
+            habit_id (int):
+                ID of the habit for which the statistics are to be determined.
+
+        Returns:
+            HabitStatisticsModel:
+                Statistics of the habit given.
+        """
+        return await self.__run(HabitTracker.calc_statistics_of_habit, habit_id)
+
+    async def check_habit_summaries(self, repair: bool = False) -> List[int]:
+        """
+        Check the habit summaries against the histories in the database and optionally rebuild them.
+
+        Args:
+            repair (bool):
+                Whether to rebuild the habit summaries if inconsistencies are found.
+
+        Returns:
+            List[int]:
+                IDs of habits whose summary did not match their history.
+        """
+        inconsistent_habit_ids = await self.__data_access.check_habit_summaries()
+        if repair and len(inconsistent_habit_ids) > 0:
+            await self.__data_access.rebuild_habit_summaries()
+        return inconsistent_habit_ids
@@ -1,9 +1,11 @@
+import os
 from datetime import datetime, timedelta
+from typing import BinaryIO, List, TextIO, Tuple, Union
 
-from habit_tracker.analytics.analytics import Analytics
 from habit_tracker.data_access.data_access import DataAccess
 from habit_tracker.data_access.model.habits import Habits
 from habit_tracker.data_access.model.habit_model import HabitModel
+from habit_tracker.data_access.model.habit_statistics_model import HabitStatisticsModel
 from habit_tracker.data_access.model.histories import Histories
 from habit_tracker.data_access.model.history_model import HistoryModel
 
@@ -13,15 +15,26 @@ class HabitTracker:
     HabitTracker is the central entry-point containing all business logic.
 
     HabitTracker is the central class of the application and connects the storage and the presentation on the CLI.
+
+    Longest run streaks are determined by one of the streak backends: looked up in the habit summaries maintained on
+    every check-off, computed by Analytics from the histories read into Python or computed by window functions within
+    SQLite, transferring one row per habit.
     """
 
+    STREAK_BACKEND_ENVIRONMENT_VARIABLE = "HABIT_TRACKER_STREAK_BACKEND"
+
+    STREAK_BACKENDS = ("summary", "python", "sql")
+
     def __init__(self):
         """
         Set the initial values needed.
 
-        Constructor creates the property for the data access object.
+        Constructor creates the property for the data access object and takes the streak backend from the environment
+        variable HABIT_TRACKER_STREAK_BACKEND, summary if not set.
         """
         self.__data_access = None
+        self.__streak_backend = None
+        self.streak_backend = os.environ.get(self.STREAK_BACKEND_ENVIRONMENT_VARIABLE, "summary")
 
     @property
     def data_access(self) -> DataAccess:
@@ -49,6 +62,31 @@ class HabitTracker:
         """
         self.__data_access = data_access
 
+    @property
+    def streak_backend(self) -> str:
+        """
+        Get the streak backend used to determine longest run streaks.
+
+        Returns:
+            str:
+                Name of the streak backend, eg summary, python, sql.
+        """
+        return self.__streak_backend
+
+    @streak_backend.setter
+    def streak_backend(self, streak_backend: str) -> None:
+        """
+        Set the streak backend used to determine longest run streaks.
+
+        Args:
+            streak_backend (str):
+                Name of the streak backend, eg summary, python, sql.
+        """
+        if streak_backend not in self.STREAK_BACKENDS:
+            raise ValueError(f"Streak backend '{streak_backend}' does not exist, choose one of: "
+                             f"{', '.join(self.STREAK_BACKENDS)}.")
+        self.__streak_backend = streak_backend
+
     @classmethod
     def initial_data(cls, now) -> Habits:
         """
@@ -405,6 +443,67 @@ class HabitTracker:
         """
         self.__data_access.initialize_db(HabitTracker.initial_data(datetime.now()))
 
+    def migrate_db(self) -> int:
+        """
+        Execute the migration of the database schema.
+
+        Calls the database migration of the data access object to bring the database schema to the latest version.
+
+        Returns:
+            int:
+                Version of the database schema after migrating.
+        """
+        return self.__data_access.migrate()
+
+    def import_habits(self, stream: Union[TextIO, BinaryIO], file_format: str = "csv", batch_size: int = 10000) \
+            -> Tuple[int, int]:
+        """
+        Execute the bulk import of habits and histories from a record file.
+
+        Calls the database method to import all records of the file within a single transaction.
+
+        Args:
+            stream (Union[TextIO, BinaryIO]):
+                Text stream of a record file, binary stream for binary formats.
+            file_format (str):
+                Format of the record file, eg csv, jsonl, columnar.
+            batch_size (int):
+                Number of rows inserted at once.
+
+        Returns:
+            Tuple[int, int]:
+                Numbers of habits and histories imported.
+        """
+        return self.__data_access.bulk_import(stream, file_format, batch_size)
+
+    def export_habits(self, stream: Union[TextIO, BinaryIO], file_format: str = "csv", since: datetime = None,
+                      until: datetime = None, periodicity: str = None, batch_size: int = 1000) -> Tuple[int, int]:
+        """
+        Execute the export of habits and histories to a record file.
+
+        Calls the database method to stream the habits and their histories within the given range of check-off time to
+        the record file.
+
+        Args:
+            stream (Union[TextIO, BinaryIO]):
+                Text stream of a record file, binary stream for binary formats.
+            file_format (str):
+                Format of the record file, eg csv, jsonl, columnar.
+            since (datetime):
+                Start of the range of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the range of check-off time, exclusive, or None for no end.
+            periodicity (str):
+                Periodicity of the habits, eg daily, weekly, or None for all habits.
+            batch_size (int):
+                Number of rows fetched and written at once.
+
+        Returns:
+            Tuple[int, int]:
+                Numbers of habits and histories exported.
+        """
+        return self.__data_access.export(stream, file_format, since, until, periodicity, batch_size)
+
     def create_new_habit(self, name: str, description: str, period: str, habit_from: str, habit_to: str) -> int:
         """
         Executes the creation of a new habit in the database.
@@ -481,6 +580,26 @@ class HabitTracker:
         """
         return self.__data_access.complete_habit(habit_id, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
+    def complete_habits(self, checkoffs: List[Tuple[int, str]]) -> List[Union[int, Exception]]:
+        """
+        Complete or break many habits at once.
+
+        Calls the database method to check off all habits within a single transaction. A check-off failing does not
+        affect the others.
+
+        Args:
+            checkoffs (List[Tuple[int, str]]):
+                Pairs of habit ID and datetime of the check-off, None for now.
+        Returns:
+            List[Union[int, Exception]]:
+                For each check-off the ID of the newly created histories entry or the error it failed with.
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return self.__data_access.complete_habits([
+            (habit_id, now if checkoff_datetime is None else checkoff_datetime)
+            for habit_id, checkoff_datetime in checkoffs
+        ])
+
     def show_all_habits(self) -> Habits:
         """
         List all habits in the database.s
@@ -509,52 +628,234 @@ class HabitTracker:
         """
         return self.__data_access.get_all_habits_by_periodicity(periodicity)
 
-    def calc_longest_run_streak(self) -> int:
+    def show_habits_page(self, after_habit_id: int = None, limit: int = None, periodicity: str = None,
+                         with_histories: bool = True) -> Habits:
+        """
+        List a page of habits in order of their IDs.
+
+        Retrieves the habits following the given habit ID from the database, optionally only habits with a specific
+        periodicity and without their histories.
+
+        Args:
+            after_habit_id (int):
+                ID of the last habit of the previous page, None for the first page.
+            limit (int):
+                Maximum number of habits listed, None for all remaining habits.
+            periodicity (str):
+                Periodicity of the habits to be listed, None for all habits.
+            with_histories (bool):
+                Whether the histories of the habits are listed.
+
+        Returns:
+            Habits:
+                Dictionary containing the habits of the page.
+        """
+        return self.__data_access.get_habits_page(after_habit_id, limit, periodicity, with_histories)
+
+    def calc_longest_run_streak(self, since: datetime = None, until: datetime = None) -> int:
         """
         Determine the longest streak over all habits in the database.
 
-        Retrieves habits from the database and puts them into a Habits.
+        Looks up the longest streak in the habit summaries, which are maintained on every check-off, or computes it
+        from the histories with the streak backend in use. Given a window of check-off time, only the histories within
+        the window are read from the database.
+
+        Args:
+            since (datetime):
+                Start of the window of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time, exclusive, or None for no end.
 
         Returns:
             int:
                 Longest run streak over all habits.
         """
-        habits = self.__data_access.get_all_habits()
-        longest_streak = Analytics.calc_longest_run_streak(habits)
-        return longest_streak
-
-    def calc_longest_run_streak_by_periodicity(self, periodicity: str) -> int:
+        streak_backend = self.__streak_backend_of_window(since, until)
+        if streak_backend == "python":
+            from habit_tracker.analytics.analytics import Analytics
+
+            return Analytics.calc_longest_run_streak(
+                self.__data_access.get_all_habits(columnar=True, since=since, until=until)
+            )
+        if streak_backend == "sql":
+            streaks = self.__data_access.get_run_streaks(since=since, until=until)
+            return max((longest for longest, _ in streaks.values()), default=0)
+        return self.__data_access.get_longest_run_streak()
+
+    def calc_longest_run_streak_by_periodicity(self, periodicity: str, since: datetime = None,
+                                               until: datetime = None) -> int:
         """
         Determine the longest streak over all habits with a specific periodicity in the database.
 
-        Retrieves habits with a specific periodicity from the database and puts them into a Habits.
+        Looks up the longest streak of habits with a specific periodicity in the habit summaries or computes it from
+        the histories with the streak backend in use, optionally within a window of check-off time.
 
         Args:
             periodicity (str):
                 Periodicity of the habits for which the longest streak is to be calculated.
+            since (datetime):
+                Start of the window of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time, exclusive, or None for no end.
 
         Returns:
             int:
                 Longest run streak over all habits given the periodicity.
         """
-        habits = self.__data_access.get_all_habits_by_periodicity(periodicity)
-        longest_streak = Analytics.calc_longest_run_streak(habits)
-        return longest_streak
-
-    def calc_longest_run_streak_of_habit(self, habit_id: int) -> int:
+        streak_backend = self.__streak_backend_of_window(since, until)
+        if streak_backend == "python":
+            from habit_tracker.analytics.analytics import Analytics
+
+            return Analytics.calc_longest_run_streak(
+                self.__data_access.get_all_habits_by_periodicity(periodicity, columnar=True, since=since, until=until)
+            )
+        if streak_backend == "sql":
+            streaks = self.__data_access.get_run_streaks(periodicity=periodicity, since=since, until=until)
+            return max((longest for longest, _ in streaks.values()), default=0)
+        return self.__data_access.get_longest_run_streak_by_periodicity(periodicity)
+
+    def calc_longest_run_streak_of_habit(self, habit_id: int, since: datetime = None, until: datetime = None) -> int:
         """
         Determine the longest streak over all habits in the database.
 
-        Retrieves habits with a specific periodicity from the database and puts them into a Habits.
+        Looks up the longest streak of the habit in its habit summary or computes it from its history with the streak
+        backend in use, optionally within a window of check-off time.
 
         Args:
             habit_id (int):
                 ID of the habit for which the longest streak is to be calculated.
+            since (datetime):
+                Start of the window of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time, exclusive, or None for no end.
 
         Returns:
             int:
                 Longest run streak over a habit given.
         """
-        habit_model = self.__data_access.get_habit_by_id(habit_id)
-        longest_streak = Analytics.calc_longest_run_streak_of_habit(habit_model)
-        return longest_streak
+        streak_backend = self.__streak_backend_of_window(since, until)
+        if streak_backend == "python":
+            from habit_tracker.analytics.analytics import Analytics
+
+            habit_model = self.__data_access.get_habit_by_id(habit_id, columnar=True, since=since, until=until)
+            return Analytics.calc_longest_run_streak_of_habit(habit_model)
+        if streak_backend == "sql":
+            return self.__data_access.get_run_streaks(habit_id=habit_id, since=since, until=until)[int(habit_id)][0]
+        return self.__data_access.get_habit_summary(habit_id).longest_streak
+
+    def calc_rolling_longest_run_streaks(self, habit_id: int, window: int, since: datetime = None,
+                                         until: datetime = None) -> List[Tuple[str, int]]:
+        """
+        Determine the longest streak of a habit within a rolling window ending at each entry of its history.
+
+        Reads the history of the habit within a window of check-off time once and determines the longest streak of
+        all rolling windows incrementally in a single pass.
+
+        Args:
+            habit_id (int):
+                ID of the habit for which the longest streaks are to be calculated.
+            window (int):
+                Number of periods of each rolling window, eg 90 for 90 days of a daily habit.
+            since (datetime):
+                Start of the window of check-off time of the history, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time of the history, exclusive, or None for no end.
+
+        Returns:
+            List[Tuple[str, int]]:
+                Check-off datetime of each history entry and the longest streak of the rolling window ending there.
+        """
+        from habit_tracker.analytics.analytics import Analytics
+        from habit_tracker.data_access.period import Period
+
+        histories = self.__data_access.get_habit_by_id(habit_id, columnar=True, since=since, until=until).habit_history
+        longest_streaks = Analytics.rolling_longest_run_streaks(histories.checked_off, window)
+        return [(Period.string_from_epoch(checkoff_epoch), longest_streak)
+                for checkoff_epoch, longest_streak in zip(histories.checkoff_epochs, longest_streaks)]
+
+    def __streak_backend_of_window(self, since: datetime = None, until: datetime = None) -> str:
+        """
+        Get the streak backend determining run streaks within a window of check-off time.
+
+        Habit summaries cover whole histories, hence run streaks within a window are computed within SQLite instead.
+
+        Args:
+            since (datetime):
+                Start of the window of check-off time, inclusive, or None for no start.
+            until (datetime):
+                End of the window of check-off time, exclusive, or None for no end.
+
+        Returns:
+            str:
+                Name of the streak backend to be used.
+        """
+        if self.__streak_backend == "summary" and (since is not None or until is not None):
+            return "sql"
+        return self.__streak_backend
+
+    def calc_statistics(self) -> List[HabitStatisticsModel]:
+        """
+        Determine the statistics of all habits in the database.
+
+        Reads all habits with their histories and scans each history once for streaks, completion rate, breaks and the
+        best and worst month.
+
+        Returns:
+            List[HabitStatisticsModel]:
+                Statistics of all habits in order of their IDs.
+        """
+        from habit_tracker.analytics.analytics import Analytics
+
+        return Analytics.calc_statistics(self.__data_access.get_all_habits(columnar=True))
+
+    def calc_statistics_by_periodicity(self, periodicity: str) -> List[HabitStatisticsModel]:
+        """
+        Determine the statistics of all habits with a specific periodicity in the database.
+
+        Args:
+            periodicity (str):
+                Periodicity of the habits for which the statistics are to be determined.
+
+        Returns:
+            List[HabitStatisticsModel]:
+                Statistics of all habits given the periodicity in order of their IDs.
+        """
+        from habit_tracker.analytics.analytics import Analytics
+
+        return Analytics.calc_statistics(self.__data_access.get_all_habits_by_periodicity(periodicity, columnar=True))
+
+    def calc_statistics_of_habit(self, habit_id: int) -> HabitStatisticsModel:
+        """
+        Determine the statistics of a habit in the database.
+
+        Args:
+            habit_id (int):
+                ID of the habit for which the statistics are to be determined.
+
+        Returns:
+            HabitStatisticsModel:
+                Statistics of the habit given.
+        """
+        from habit_tracker.analytics.analytics import Analytics
+
+        return Analytics.calc_statistics_of_habit(self.__data_access.get_habit_by_id(habit_id, columnar=True))
+
+    def check_habit_summaries(self, repair: bool = False) -> List[int]:
+        """
+        Check the habit summaries against the histories in the database.
+
+        Calls the database method to find habits whose summary does not match their history and optionally rebuilds
+        all summaries from the histories.
+
+        Args:
+            repair (bool):
+                Whether to rebuild the habit summaries if inconsistencies are found.
+
+        Returns:
+            List[int]:
+                IDs of habits whose summary did not match their history.
+        """
+        inconsistent_habit_ids = self.__data_access.check_habit_summaries()
+        if repair and len(inconsistent_habit_ids) > 0:
+            self.__data_access.rebuild_habit_summaries()
+        return inconsistent_habit_ids
@@ -1,12 +1,27 @@
+from array import array
 
 import pytest
 
+from habit_tracker.analytics import analytics
 from habit_tracker.analytics.analytics import Analytics
 from habit_tracker.data_access.data_access import DataAccess
 from habit_tracker.data_access.model.habit_model import HabitModel
 from tests.data_fixtures import all_data, habit_model_work, now
 
 
+@pytest.fixture(params=Analytics.ENGINES)
+def engine(request):
+    """
+    Selects each streak engine in turn and restores the engine in use afterwards.
+    """
+    if request.param == "numpy" and analytics.numpy is None:
+        pytest.skip("NumPy is not installed.")
+    previous_engine = Analytics.get_engine()
+    Analytics.set_engine(request.param)
+    yield request.param
+    Analytics.set_engine(previous_engine)
+
+
 @pytest.mark.parametrize(
     'run_streak, expected_longest_streak', [
         ([], 0),
@@ -15,7 +30,7 @@ from tests.data_fixtures import all_data, habit_model_work, now
         ([1, 1, 0, 0, 0, 1, 1, 1, 1, 0], 4)
     ]
 )
-def test_length_longest_run_streak(run_streak, expected_longest_streak):
+def test_length_longest_run_streak(engine, run_streak, expected_longest_streak):
     """
     Asserts that determining the longest run streak given a list of zeros and ones works.
     """
@@ -24,7 +39,7 @@ def test_length_longest_run_streak(run_streak, expected_longest_streak):
         "Calculated longest run streak is not as expected."
 
 
-def test_calc_longest_run_streak_of_habit(habit_model_work):
+def test_calc_longest_run_streak_of_habit(engine, habit_model_work):
     """
     Asserts that determining the longest run streak given a specific habit model works.
     """
@@ -34,7 +49,7 @@ def test_calc_longest_run_streak_of_habit(habit_model_work):
         "Calculated longest run streak is not as expected."
 
 
-def test_calc_longest_run_streak(all_data):
+def test_calc_longest_run_streak(engine, all_data):
     """
     Asserts that determining the longest run streak given a habit dictionary works.
     """
@@ -42,3 +57,98 @@ def test_calc_longest_run_streak(all_data):
     actual_longest_streak = Analytics.calc_longest_run_streak(all_data)
     assert actual_longest_streak == expected_longest_streak, \
         "Calculated longest run streak is not as expected."
+
+
+@pytest.mark.parametrize(
+    'run_streak, expected_current_streak', [
+        ([], 0),
+        ([0], 0),
+        ([1], 1),
+        ([1, 1, 0, 0, 0, 1, 1, 1, 1, 0], 0),
+        ([1, 1, 0, 1, 1, 1], 3)
+    ]
+)
+def test_length_current_run_streak(engine, run_streak, expected_current_streak):
+    """
+    Asserts that determining the run streak a list of zeros and ones ends with works.
+    """
+    actual_current_streak = Analytics.length_current_run_streak(run_streak)
+    assert actual_current_streak == expected_current_streak, \
+        "Calculated current run streak is not as expected."
+
+
+def test_length_longest_run_streaks(engine):
+    """
+    Asserts that determining the longest run streaks of a batch of lists of zeros and ones works, also for lists
+    ending and starting with a run.
+    """
+    histories = [[1, 1], [], [1, 1, 1, 0, 1], array("b", [0, 1, 1, 1, 1]), [0]]
+    expected_longest_streaks = [2, 0, 3, 4, 0]
+    actual_longest_streaks = Analytics.length_longest_run_streaks(histories)
+    assert actual_longest_streaks == expected_longest_streaks, \
+        "Calculated longest run streaks are not as expected."
+
+
+def test_set_engine_unknown():
+    """
+    Asserts that selecting a streak engine which does not exist raises an error.
+    """
+    with pytest.raises(ValueError):
+        Analytics.set_engine("unknown")
+
+
+def test_stream_run_streaks(habit_model_work):
+    """
+    Asserts that determining the longest and current run streak of a stream of history models works.
+    """
+    histories = habit_model_work.habit_history.histories.values()
+    expected_streaks = (Analytics.length_longest_run_streak(habit_model_work.habit_history.transform_to_list()),
+                        Analytics.length_current_run_streak(habit_model_work.habit_history.transform_to_list()))
+    actual_streaks = (Analytics.stream_longest_run_streak(iter(histories)),
+                      Analytics.stream_current_run_streak(iter(histories)))
+    assert actual_streaks == expected_streaks, \
+        "Calculated run streaks of stream are not as expected."
+
+
+def test_stream_statistics():
+    """
+    Asserts that streaks, completions, breaks and the best and worst month of a stream of check-offs are determined.
+    """
+    checkoffs = [(1, "2022-01"), (1, "2022-01"), (0, "2022-01"), (0, "2022-02"), (0, "2022-02"),
+                 (1, "2022-03"), (1, "2022-03"), (1, "2022-03"), (1, "2022-04")]
+    habit_statistics_model = Analytics.stream_statistics(checkoffs)
+    assert habit_statistics_model.to_row() == (None, 6, 3, 6 / 9, 4, 4, "2022-03", 1.0, "2022-02", 0.0), \
+        "Statistics of stream are not as expected."
+    empty_statistics_model = Analytics.stream_statistics([])
+    assert empty_statistics_model.to_row() == (None, 0, 0, 0.0, 0, 0, None, None, None, None), \
+        "Statistics of empty stream are not empty."
+
+
+
+@pytest.mark.parametrize(
+    'run_streak, window, expected_longest_streaks', [
+        ([], 3, []),
+        ([0, 0], 1, [0, 0]),
+        ([1, 1, 1], 5, [1, 2, 3]),
+        ([1, 1, 0, 1, 1, 1, 0, 0, 1, 1], 3, [1, 2, 2, 1, 2, 3, 2, 1, 1, 2]),
+        ([1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 1], 4, [1, 2, 3, 4, 3, 2, 1, 1, 2, 2, 2])
+    ]
+)
+def test_rolling_longest_run_streaks(run_streak, window, expected_longest_streaks):
+    """
+    Asserts that the longest run streaks within rolling windows are determined correctly and equal to the longest run
+    streaks of each window.
+    """
+    assert Analytics.rolling_longest_run_streaks(run_streak, window) == expected_longest_streaks, \
+        "Longest run streaks of rolling windows are not as expected."
+    windows = [run_streak[max(index - window + 1, 0):index + 1] for index in range(len(run_streak))]
+    assert expected_longest_streaks == [Analytics.length_longest_run_streak(window) for window in windows], \
+        "Longest run streaks of rolling windows are different to the longest run streaks of each window."
+
+
+def test_rolling_longest_run_streaks_check_window():
+    """
+    Asserts that a rolling window without periods raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        Analytics.rolling_longest_run_streaks([1, 0, 1], 0)
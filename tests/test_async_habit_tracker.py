@@ -0,0 +1,153 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from habit_tracker.data_access.async_data_access import AsyncDataAccess
+from habit_tracker.habit_tracker.async_habit_tracker import AsyncHabitTracker
+from habit_tracker.habit_tracker.habit_tracker import HabitTracker
+from tests.data_fixtures import all_data, now
+from tests.db_fixtures import data_access_drop_init
+
+
+def run_with_habit_tracker(coroutine_function, streak_backend: str = "summary"):
+    """
+    Run a coroutine function with an asynchronous habit tracker on the test database in a new event loop.
+    """
+    async def main():
+        async with AsyncDataAccess("habit_tracker_test") as data_access:
+            habit_tracker = AsyncHabitTracker()
+            habit_tracker.data_access = data_access
+            habit_tracker.streak_backend = streak_backend
+            return await coroutine_function(habit_tracker)
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("streak_backend", HabitTracker.STREAK_BACKENDS)
+@pytest.mark.parametrize(
+    'periodicity, expected_longest_streak', [
+        (None, 4),
+        ("daily", 4),
+        ("weekly", 2)
+    ]
+)
+def test_async_calc_longest_run_streak(data_access_drop_init, periodicity, expected_longest_streak, streak_backend):
+    """
+    Asserts that the longest run streak is calculated correctly by the asynchronous habit tracker.
+    """
+    async def calc_longest_run_streak(habit_tracker):
+        if periodicity is None:
+            return await habit_tracker.calc_longest_run_streak()
+        return await habit_tracker.calc_longest_run_streak_by_periodicity(periodicity)
+    actual_longest_streak = run_with_habit_tracker(calc_longest_run_streak, streak_backend)
+    assert actual_longest_streak == expected_longest_streak, \
+        "Longest run streak is not calculated correctly."
+
+
+@pytest.mark.parametrize("streak_backend", HabitTracker.STREAK_BACKENDS)
+def test_async_calc_longest_run_streak_within_window(data_access_drop_init, now, streak_backend):
+    """
+    Asserts that windowed and rolling run streaks of the asynchronous habit tracker are equal to those of the habit
+    tracker with the same streak backend.
+    """
+    habit_tracker = HabitTracker()
+    habit_tracker.data_access = data_access_drop_init
+    habit_tracker.streak_backend = streak_backend
+    since = now + timedelta(days=2)
+    expected_results = (habit_tracker.calc_longest_run_streak(since=since),
+                        habit_tracker.calc_longest_run_streak_by_periodicity("weekly", since=since),
+                        habit_tracker.calc_longest_run_streak_of_habit(1, since=since),
+                        habit_tracker.calc_rolling_longest_run_streaks(1, 2))
+
+    async def calc_longest_run_streaks(async_habit_tracker):
+        return (await async_habit_tracker.calc_longest_run_streak(since=since),
+                await async_habit_tracker.calc_longest_run_streak_by_periodicity("weekly", since=since),
+                await async_habit_tracker.calc_longest_run_streak_of_habit(1, since=since),
+                await async_habit_tracker.calc_rolling_longest_run_streaks(1, 2))
+    assert run_with_habit_tracker(calc_longest_run_streaks, streak_backend) == expected_results, \
+        "Run streaks of asynchronous habit tracker differ from the run streaks of the habit tracker."
+
+
+def test_async_calc_statistics(data_access_drop_init):
+    """
+    Asserts that the statistics of the asynchronous habit tracker are equal to those of the habit tracker.
+    """
+    habit_tracker = HabitTracker()
+    habit_tracker.data_access = data_access_drop_init
+    expected_results = ([model.to_row() for model in habit_tracker.calc_statistics()],
+                        [model.to_row() for model in habit_tracker.calc_statistics_by_periodicity("weekly")],
+                        habit_tracker.calc_statistics_of_habit(1).to_row())
+
+    async def calc_statistics(async_habit_tracker):
+        return ([model.to_row() for model in await async_habit_tracker.calc_statistics()],
+                [model.to_row() for model in await async_habit_tracker.calc_statistics_by_periodicity("weekly")],
+                (await async_habit_tracker.calc_statistics_of_habit(1)).to_row())
+    assert run_with_habit_tracker(calc_statistics) == expected_results, \
+        "Statistics of asynchronous habit tracker differ from the statistics of the habit tracker."
+
+
+def test_async_complete_habits(data_access_drop_init):
+    """
+    Asserts that the asynchronous habit tracker checks off many habits at once and reports failing check-offs.
+    """
+    habit_from = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+
+    async def complete_habits(habit_tracker):
+        habit_id = await habit_tracker.create_new_habit("test_name", "test_description", "daily", habit_from,
+                                                        "2099-12-31")
+        return await habit_tracker.complete_habits([(habit_id, None), (4711, None)])
+
+    results = run_with_habit_tracker(complete_habits)
+    assert [type(result) for result in results] == [int, NameError], \
+        "Results of check-offs are not as expected."
+
+
+def test_async_streak_backend_check_unknown():
+    """
+    Asserts that an unknown streak backend of the asynchronous habit tracker raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        AsyncHabitTracker().streak_backend = "unknown"
+
+
+def test_async_show_all_habits(data_access_drop_init):
+    """
+    Asserts that the asynchronous habit tracker lists the same habits as the data access object.
+    """
+    expected_habit_ids = list(data_access_drop_init.get_all_habits().habits)
+    actual_habits = run_with_habit_tracker(lambda habit_tracker: habit_tracker.show_all_habits())
+    assert list(actual_habits.habits) == expected_habit_ids, \
+        "Habits listed by asynchronous habit tracker are not as expected."
+
+
+def test_async_concurrent_complete_habit(data_access_drop_init):
+    """
+    Asserts that concurrent check-offs of different habits by the asynchronous habit tracker are all stored.
+    """
+    number_habits = 20
+    habit_from = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+
+    async def complete_habits(habit_tracker):
+        habit_ids = await asyncio.gather(*(
+            habit_tracker.create_new_habit("test_name", "test_description", "daily", habit_from, "2099-12-31")
+            for _ in range(number_habits)
+        ))
+        await asyncio.gather(*(habit_tracker.complete_habit(habit_id) for habit_id in habit_ids))
+        streaks = await asyncio.gather(*(
+            habit_tracker.calc_longest_run_streak_of_habit(habit_id) for habit_id in habit_ids
+        ))
+        return streaks, await habit_tracker.check_habit_summaries()
+
+    actual_streaks, inconsistent_habit_ids = run_with_habit_tracker(complete_habits)
+    assert actual_streaks == [1] * number_habits, \
+        "Not all concurrent check-offs are stored."
+    assert inconsistent_habit_ids == [], \
+        "Summaries of concurrently checked-off habits are inconsistent."
+
+
+def test_async_data_access_error(data_access_drop_init):
+    """
+    Asserts that errors of the data access object are raised by the coroutines.
+    """
+    with pytest.raises(NameError):
+        run_with_habit_tracker(lambda habit_tracker: habit_tracker.calc_longest_run_streak_of_habit(4711))
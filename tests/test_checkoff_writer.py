@@ -0,0 +1,96 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from habit_tracker.data_access.checkoff_writer import CheckoffWriter
+from tests.data_fixtures import all_data, now
+from tests.db_fixtures import data_access_drop_init
+
+
+def create_habits(data_access, number_habits: int, start: datetime) -> list:
+    """
+    Create daily habits starting at a given date.
+    """
+    return [
+        data_access.create_new_habit("test_name", "test_description", "daily", start.strftime("%Y-%m-%d"), "2099-12-31")
+        for _ in range(number_habits)
+    ]
+
+
+def test_complete_habits_single_commit(data_access_drop_init):
+    """
+    Asserts that check-offs of many habits are written in a single commit and a failing check-off does not affect the
+    others.
+    """
+    start = datetime(2022, 1, 1)
+    habit_ids = create_habits(data_access_drop_init, 3, start)
+    checkoff_datetime = (start + timedelta(days=1, hours=12)).strftime("%Y-%m-%d %H:%M:%S")
+    checkoffs = [(habit_id, checkoff_datetime) for habit_id in habit_ids]
+    checkoffs.insert(1, (habit_ids[0], checkoff_datetime))
+    checkoffs.append((4711, checkoff_datetime))
+    statements = list()
+    connection = data_access_drop_init.cursor.connection
+    connection.set_trace_callback(statements.append)
+    results = data_access_drop_init.complete_habits(checkoffs)
+    connection.set_trace_callback(None)
+    actual_number_commits = len([statement for statement in statements if statement.startswith("COMMIT")])
+    assert actual_number_commits == 1, \
+        "Check-offs are not stored within a single commit."
+    assert [type(result) for result in results] == [int, ValueError, int, int, NameError], \
+        "Results of check-offs are not as expected."
+    for habit_id in habit_ids:
+        assert data_access_drop_init.get_histories_by_habit_id(habit_id).transform_to_list() == [0, 1], \
+            "Histories of checked-off habit are not as expected."
+    assert data_access_drop_init.check_habit_summaries() == [], \
+        "Summaries of checked-off habits are inconsistent."
+
+
+def test_checkoff_writer_group_commit(data_access_drop_init):
+    """
+    Asserts that check-offs submitted concurrently to a check-off writer are committed in group transactions, each
+    caller gets its own result and duplicated check-offs are rejected.
+    """
+    number_habits = 40
+    max_batch_size = 16
+    start = datetime(2022, 1, 1)
+    habit_ids = create_habits(data_access_drop_init, number_habits, start)
+    checkoff_datetime = (start + timedelta(days=1, hours=12)).strftime("%Y-%m-%d %H:%M:%S")
+
+    with CheckoffWriter("habit_tracker_test", max_batch_size=max_batch_size, max_delay_ms=50) as checkoff_writer:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            submissions = [
+                executor.submit(checkoff_writer.submit, habit_id, checkoff_datetime)
+                for habit_id in habit_ids + habit_ids
+            ]
+            futures = [submission.result() for submission in submissions]
+        results = list()
+        for future in futures:
+            try:
+                results.append(future.result())
+            except ValueError as error:
+                results.append(error)
+        number_batches = checkoff_writer.number_batches
+
+    history_ids = [result for result in results if isinstance(result, int)]
+    assert len(history_ids) == number_habits and len(set(history_ids)) == number_habits, \
+        "Not every habit is checked off exactly once."
+    assert all(isinstance(result, ValueError) for result in results[number_habits:]), \
+        "Duplicated check-offs are not rejected."
+    # Slack allows for batches cut short by the maximum delay while the thread pool is still submitting.
+    assert number_batches <= math.ceil(2 * number_habits / max_batch_size) + 3, \
+        "Check-offs are not committed in group transactions."
+    assert data_access_drop_init.check_habit_summaries() == [], \
+        "Summaries of checked-off habits are inconsistent."
+
+
+def test_checkoff_writer_closed():
+    """
+    Asserts that a closed check-off writer rejects further check-offs.
+    """
+    checkoff_writer = CheckoffWriter("habit_tracker_test")
+    checkoff_writer.close()
+    checkoff_writer.close()
+    with pytest.raises(RuntimeError):
+        checkoff_writer.submit(1, "2022-01-01 12:00:00")
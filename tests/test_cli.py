@@ -0,0 +1,103 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from habit_tracker.cli.cli import RECORD_FORMATS, STREAK_BACKENDS
+from habit_tracker.cli.daemon import Daemon
+from habit_tracker.data_access.connection_pool import ConnectionPool
+from habit_tracker.data_access.records import Records
+from habit_tracker.habit_tracker.habit_tracker import HabitTracker
+
+
+def test_record_formats():
+    """
+    Asserts that the record formats offered by the CLI are the formats of record files.
+    """
+    assert RECORD_FORMATS == Records.FORMATS, \
+        "Record formats of the CLI differ from the formats of record files."
+
+
+def test_streak_backends():
+    """
+    Asserts that the streak backends offered by the CLI are the streak backends of the habit tracker.
+    """
+    assert STREAK_BACKENDS == HabitTracker.STREAK_BACKENDS, \
+        "Streak backends of the CLI differ from the streak backends of the habit tracker."
+
+
+def test_cli_imports_lazily():
+    """
+    Asserts that importing the entry point and the CLI does not import the habit tracker and the data access.
+    """
+    code = "import sys, habit_tracker.cli.main, habit_tracker.cli.cli; " \
+           "print(sorted(name for name in sys.modules if name.startswith('habit_tracker.')))"
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == str(["habit_tracker.cli", "habit_tracker.cli.cli", "habit_tracker.cli.daemon",
+                                            "habit_tracker.cli.main", "habit_tracker.data_access",
+                                            "habit_tracker.data_access.connection_profile"]), \
+        "Modules imported on startup are not as expected."
+
+
+@pytest.mark.parametrize("arguments, expected_forwards", [
+    (["show"], True),
+    (["--db-profile", "wal", "longest-run-streak"], True),
+    (["--db-profile=wal", "complete", "--id", "1"], True),
+    (["--streak-backend", "sql", "--db-profile", "wal", "longest-run-streak"], True),
+    (["--help"], False),
+    (["export", "habits.csv"], False),
+    (["--db-profile", "wal", "daemon", "--stop"], False),
+    (["import", "-"], False),
+    (["complete", "--file=-"], False),
+    (["complete", "--file", "-"], False),
+    (["complete", "--file=checkoffs.txt"], True)
+])
+def test_daemon_forwards(arguments, expected_forwards):
+    """
+    Asserts that only commands neither run locally nor using standard streams are sent to the daemon.
+    """
+    assert Daemon.forwards(arguments) == expected_forwards, \
+        "Command is not sent to the daemon as expected."
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available.")
+def test_daemon_round_trip(tmp_path, monkeypatch):
+    """
+    Asserts that commands sent to the daemon are run in the working directory of the client and return exit code,
+    standard output and standard error, and that a stopped daemon removes its socket.
+    """
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("db")
+    daemon = Daemon(os.path.join("db", "test.sock"))
+    thread = threading.Thread(target=daemon.serve)
+    thread.start()
+    try:
+        while not os.path.exists(daemon.socket_path):
+            time.sleep(0.01)
+        exit_code, output, _ = daemon.request(["create", "--name", "test_name", "--description", "test_description",
+                                               "--period", "daily", "--habit-from", "2022-01-01",
+                                               "--habit-to", "2022-12-31"])
+        assert (exit_code, output) == (0, "Habit 'test_name' created.\n"), \
+            "Habit is not created by the daemon."
+        exit_code, output, _ = daemon.request(["show", "--format", "json"])
+        assert exit_code == 0 and [habit["habit_name"] for habit in json.loads(output)] == ["test_name"], \
+            "Habits shown by the daemon are not as expected."
+        exit_code, _, error = daemon.request(["unknown-command"])
+        assert exit_code == 2 and "No such command" in error, \
+            "Usage error of the daemon is not reported on standard error."
+        assert os.path.exists(os.path.join("db", "habit_tracker.db")), \
+            "Database is not created in the working directory of the client."
+    finally:
+        assert daemon.stop(), \
+            "Running daemon is not stopped."
+        thread.join()
+        ConnectionPool.close_all()
+    assert not os.path.exists(daemon.socket_path), \
+        "Socket of the stopped daemon is not removed."
+    assert daemon.request(["show"]) is None, \
+        "Request without a running daemon is answered."
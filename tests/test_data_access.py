@@ -1,8 +1,21 @@
-
+import csv
+import io
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import pytest
 
+from habit_tracker.analytics.analytics import Analytics
+from habit_tracker.data_access import queries
+from habit_tracker.data_access.connection_pool import ConnectionPool
+from habit_tracker.data_access.connection_profile import ConnectionProfile, PROFILE_ENVIRONMENT_VARIABLE
+from habit_tracker.data_access.data_access import DataAccess
+from habit_tracker.data_access.migrations import LATEST_VERSION
+from habit_tracker.data_access.period import Period
+from habit_tracker.data_access.records import Records
 from habit_tracker.data_access.model.habit_model import HabitModel
 from habit_tracker.data_access.model.history_model import HistoryModel
 from tests.data_fixtures import all_data, now
@@ -451,3 +464,741 @@ def test_complete_habit_check_weekly_with_two_completed(
                 break
     assert actual_number_broken == expected_number_broken, \
         "Number of broken history entries is not correct."
+
+
+@pytest.mark.parametrize(
+    'periodicity, expected_number_queries', [
+        (None, 2),
+        ("daily", 2),
+        ("weekly", 2)
+    ]
+)
+def test_get_all_habits_check_number_queries(data_access_drop_init, periodicity, expected_number_queries):
+    """
+    Asserts that fetching habits with their histories does not issue a query per habit.
+    """
+    statements = list()
+    connection = data_access_drop_init.cursor.connection
+    connection.set_trace_callback(statements.append)
+    if periodicity is None:
+        habits = data_access_drop_init.get_all_habits()
+    else:
+        habits = data_access_drop_init.get_all_habits_by_periodicity(periodicity)
+    connection.set_trace_callback(None)
+    actual_number_queries = len(statements)
+    assert actual_number_queries == expected_number_queries, \
+        "Number of queries is different to expected number of queries."
+    for habit_model in habits.habits.values():
+        expected_histories = data_access_drop_init.get_histories_by_habit_id(habit_model.habit_id)
+        assert list(habit_model.habit_history.histories) == list(expected_histories.histories), \
+            "Histories of bulk loaded habit are different to histories loaded per habit."
+
+
+@pytest.mark.parametrize(
+    'period, number_periods, expected_number_broken', [
+        ("daily", 1, 1),
+        ("daily", 365, 365),
+        ("weekly", 100, 100)
+    ]
+)
+def test_complete_habit_check_single_commit(data_access_drop_init, period, number_periods, expected_number_broken):
+    """
+    Asserts that checking off a habit after a long gap adds all broken history entries within a single commit.
+    """
+    checkoff_datetime = datetime(2022, 10, 1, 12, 0, 0)
+    if period == "daily":
+        habit_from = checkoff_datetime - timedelta(days=number_periods)
+    else:
+        habit_from = checkoff_datetime - timedelta(weeks=number_periods)
+    habit_id = data_access_drop_init.create_new_habit("test_name",
+                                                      "test_description",
+                                                      period,
+                                                      habit_from.strftime("%Y-%m-%d"),
+                                                      checkoff_datetime.strftime("%Y-%m-%d"))
+    statements = list()
+    connection = data_access_drop_init.cursor.connection
+    connection.set_trace_callback(statements.append)
+    data_access_drop_init.complete_habit(habit_id, checkoff_datetime.strftime("%Y-%m-%d %H:%M:%S"))
+    connection.set_trace_callback(None)
+    histories = data_access_drop_init.get_histories_by_habit_id(habit_id).transform_to_list()
+    data_access_drop_init.delete_habit(habit_id)
+    actual_number_commits = len([statement for statement in statements if statement.startswith("COMMIT")])
+    assert actual_number_commits == 1, \
+        "Check-off is not stored within a single commit."
+    assert histories.count(0) == expected_number_broken and histories[-1] == 1, \
+        "Number of broken history entries is not correct."
+
+
+def test_create_new_habit_check_quotes(data_access_drop_init):
+    """
+    Asserts that habit names and descriptions containing quotes are stored unaltered.
+    """
+    expected_name = "don't forget \"quotes\""
+    expected_description = "'; DROP TABLE habits; --"
+    habit_id = data_access_drop_init.create_new_habit(expected_name,
+                                                      expected_description,
+                                                      "daily",
+                                                      datetime.now().strftime("%Y-%m-%d"),
+                                                      (datetime.now() + timedelta(days=6)).strftime("%Y-%m-%d"))
+    habit_model = data_access_drop_init.get_habit_by_id(habit_id=habit_id)
+    data_access_drop_init.delete_habit(habit_id)
+    assert habit_model.habit_name == expected_name and habit_model.habit_specification == expected_description, \
+        "Habit name or description is different to expected name or description."
+
+
+@pytest.mark.parametrize(
+    'query, parameters, expected_index', [
+        (queries.SELECT_HISTORIES_BY_HABIT_ID, (1,),
+         "USING INDEX histories_habit_id_checkoff_epoch_checked_off_index"),
+        (queries.SELECT_LATEST_CHECKOFF_OF_HABIT, (1,),
+         "USING COVERING INDEX histories_habit_id_checkoff_epoch_checked_off_index"),
+        (queries.SELECT_HABITS_BY_PERIODICITY, ("daily",),
+         "USING INDEX habits_habit_periodicity_granularity_index"),
+        (queries.SELECT_HISTORIES_BY_PERIODICITY, ("daily",),
+         "USING INDEX histories_habit_id_checkoff_epoch_checked_off_index")
+    ]
+)
+def test_query_plan_check_index(data_access_drop_init, query, parameters, expected_index):
+    """
+    Asserts that looking up histories and habits uses the indexes instead of scanning the tables.
+    """
+    data_access_drop_init.create_tables()
+    query_plan = data_access_drop_init.cursor.execute(f"EXPLAIN QUERY PLAN {query}", parameters).fetchall()
+    details = " ".join(row[-1] for row in query_plan)
+    assert expected_index in details, \
+        f"Query plan does not use expected index: {details}"
+
+
+def test_migrate_check_existing_database(data_access_drop_init):
+    """
+    Asserts that a database created before migrations existed gets migrated to the latest schema version.
+    """
+    data_access_drop_init.drop_tables()
+    data_access_drop_init.cursor.execute(queries.CREATE_HABIT_TABLE)
+    data_access_drop_init.cursor.execute(queries.CREATE_HISTORY_TABLE)
+    data_access_drop_init.cursor.connection.commit()
+    assert data_access_drop_init.schema_version == 0, \
+        "Schema version of database without migrations is not 0."
+    actual_version = data_access_drop_init.migrate()
+    indexes = data_access_drop_init.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index';").fetchall()
+    assert actual_version == LATEST_VERSION and data_access_drop_init.schema_version == LATEST_VERSION, \
+        "Schema version is different to latest schema version."
+    assert ("histories_habit_id_checkoff_epoch_checked_off_index",) in indexes, \
+        "Indexes are not created by migration."
+
+
+def test_migrate_check_downgrade(data_access_drop_init):
+    """
+    Asserts that migrating to an older schema version is rejected.
+    """
+    with pytest.raises(ValueError):
+        data_access_drop_init.migrate(LATEST_VERSION - 1)
+    assert data_access_drop_init.migrate() == LATEST_VERSION, \
+        "Migrating an up to date database changes the schema version."
+
+
+@pytest.mark.parametrize(
+    'profile, environment_profile, expected_journal_mode, expected_synchronous', [
+        ("default", None, "delete", 2),
+        ("wal", None, "wal", 1),
+        (None, "fast", "wal", 0),
+        (ConnectionProfile("custom", journal_mode="TRUNCATE", synchronous="NORMAL"), None, "truncate", 1)
+    ]
+)
+def test_connection_profile(monkeypatch, profile, environment_profile, expected_journal_mode, expected_synchronous):
+    """
+    Asserts that the PRAGMA settings of the selected connection profile are applied to the connection.
+    """
+    if environment_profile is not None:
+        monkeypatch.setenv(PROFILE_ENVIRONMENT_VARIABLE, environment_profile)
+    data_access = DataAccess("habit_tracker_test_profile", profile=profile)
+    actual_journal_mode = data_access.cursor.execute("PRAGMA journal_mode;").fetchone()[0]
+    actual_synchronous = data_access.cursor.execute("PRAGMA synchronous;").fetchone()[0]
+    data_access.cursor.execute("PRAGMA journal_mode = DELETE;")
+    data_access.drop_tables()
+    del data_access
+    assert actual_journal_mode == expected_journal_mode and actual_synchronous == expected_synchronous, \
+        "PRAGMA settings are different to settings of connection profile."
+
+
+def test_connection_profile_check_unknown():
+    """
+    Asserts that selecting a connection profile that does not exist is rejected.
+    """
+    with pytest.raises(ValueError):
+        ConnectionProfile.by_name("unknown")
+
+
+def test_migrate_check_checkoff_epoch(data_access_drop_init):
+    """
+    Asserts that migrating histories stored with text datetimes only fills in Unix seconds and period indexes.
+    """
+    data_access_drop_init.drop_tables()
+    data_access_drop_init.migrate(2)
+    data_access_drop_init.cursor.execute(queries.INSERT_HABIT,
+                                         ("test_name", "test_description", "2022-10-01 10:00:00", "weekly",
+                                          "2022-10-01", "2022-12-31"))
+    data_access_drop_init.cursor.execute(
+        "INSERT INTO histories ([habit_id], [checkoff_datetime], [checked_off]) VALUES (1, '2022-10-12 10:30:00', 1);"
+    )
+    data_access_drop_init.cursor.connection.commit()
+    data_access_drop_init.migrate()
+    actual_epoch, actual_period = data_access_drop_init.cursor.execute(
+        "SELECT [checkoff_epoch], [checkoff_period] FROM histories;"
+    ).fetchone()
+    expected_epoch = Period.epoch_from_string("2022-10-12 10:30:00")
+    assert actual_epoch == expected_epoch and actual_period == Period.index(expected_epoch, "weekly"), \
+        "Unix seconds or period index of migrated history entry are not as expected."
+    assert Period.string_from_epoch(actual_epoch) == "2022-10-12 10:30:00", \
+        "Unix seconds do not convert back to the check-off datetime."
+
+
+def test_modify_habit_check_checkoff_period(data_access_drop_init):
+    """
+    Asserts that changing the periodicity of a habit updates the period indexes of its histories.
+    """
+    habit_id = data_access_drop_init.create_new_habit("test_name", "test_description", "daily", "2022-10-01",
+                                                      "2022-12-31")
+    data_access_drop_init.complete_habit(habit_id, "2022-10-12 10:30:00")
+    data_access_drop_init.modify_habit(habit_id, None, None, "weekly", None, None)
+    actual_periods = data_access_drop_init.cursor.execute(
+        "SELECT [checkoff_epoch], [checkoff_period] FROM histories WHERE [habit_id] = ?;", (habit_id,)
+    ).fetchall()
+    data_access_drop_init.delete_habit(habit_id)
+    assert all(period == Period.index(epoch, "weekly") for epoch, period in actual_periods), \
+        "Period indexes are not updated to the new periodicity."
+
+
+def test_modify_habit_check_habit_summary(data_access_drop_init):
+    """
+    Asserts that changing the periodicity of a habit recomputes its summary in units of the new periodicity.
+    """
+    habit_id = data_access_drop_init.create_new_habit("test_name", "test_description", "daily", "2022-10-01",
+                                                      "2022-12-31")
+    for checkoff_datetime in ("2022-10-03 08:00:00", "2022-10-04 08:00:00", "2022-10-11 08:00:00"):
+        data_access_drop_init.complete_habit(habit_id, checkoff_datetime)
+    data_access_drop_init.modify_habit(habit_id, None, None, "weekly", None, None)
+    inconsistent_habit_ids = data_access_drop_init.check_habit_summaries()
+    habit_summary_model = data_access_drop_init.get_habit_summary(habit_id)
+    data_access_drop_init.delete_habit(habit_id)
+    assert inconsistent_habit_ids == [], \
+        "Habit summaries are not consistent with the histories after changing the periodicity."
+    assert habit_summary_model.longest_streak == 2, \
+        "Longest streak of habit summary is not counted in weeks."
+
+
+def test_habit_summaries_check_consistent_after_checkoffs(data_access_drop_init):
+    """
+    Asserts that habit summaries maintained on check-offs match the summaries recomputed from the histories.
+    """
+    habit_id = data_access_drop_init.create_new_habit("test_name", "test_description", "daily", "2022-10-01",
+                                                      "2022-12-31")
+    for checkoff_datetime in ("2022-10-01 08:00:00", "2022-10-02 08:00:00", "2022-10-05 08:00:00",
+                              "2022-10-06 08:00:00", "2022-10-07 08:00:00"):
+        data_access_drop_init.complete_habit(habit_id, checkoff_datetime)
+    habit_summary_model = data_access_drop_init.get_habit_summary(habit_id)
+    inconsistent_habit_ids = data_access_drop_init.check_habit_summaries()
+    data_access_drop_init.delete_habit(habit_id)
+    assert inconsistent_habit_ids == [], \
+        "Habit summaries are not consistent with the histories."
+    assert (habit_summary_model.current_streak, habit_summary_model.longest_streak) == (3, 3), \
+        "Current or longest streak of habit summary is not as expected."
+    assert (habit_summary_model.total_completions, habit_summary_model.total_breaks) == (5, 2), \
+        "Completions or breaks of habit summary are not as expected."
+
+
+def test_habit_summaries_check_matches_analytics(data_access_drop_init):
+    """
+    Asserts that the longest streaks of the habit summaries match the longest streaks calculated from the histories.
+    """
+    habits = data_access_drop_init.get_all_habits()
+    for habit_model in habits.habits.values():
+        expected_longest_streak = Analytics.calc_longest_run_streak_of_habit(habit_model)
+        actual_longest_streak = data_access_drop_init.get_habit_summary(habit_model.habit_id).longest_streak
+        assert actual_longest_streak == expected_longest_streak, \
+            "Longest streak of habit summary is different to calculated longest streak."
+
+
+def test_rebuild_habit_summaries(data_access_drop_init):
+    """
+    Asserts that rebuilding the habit summaries repairs inconsistent summaries.
+    """
+    data_access_drop_init.cursor.execute("UPDATE habit_summaries SET [longest_streak] = 42 WHERE [habit_id] = 2;")
+    data_access_drop_init.cursor.connection.commit()
+    assert data_access_drop_init.check_habit_summaries() == [2], \
+        "Inconsistent habit summary is not detected."
+    data_access_drop_init.rebuild_habit_summaries()
+    assert data_access_drop_init.check_habit_summaries() == [], \
+        "Habit summaries are not consistent after rebuilding."
+
+
+@pytest.mark.parametrize('periodicity', [None, "daily", "weekly"])
+def test_get_all_habits_columnar(data_access_drop_init, periodicity):
+    """
+    Asserts that habits fetched with columnar histories contain the same histories and longest run streaks as habits
+    fetched with dictionaries of history models.
+    """
+    if periodicity is None:
+        habits = data_access_drop_init.get_all_habits()
+        columnar_habits = data_access_drop_init.get_all_habits(columnar=True)
+    else:
+        habits = data_access_drop_init.get_all_habits_by_periodicity(periodicity)
+        columnar_habits = data_access_drop_init.get_all_habits_by_periodicity(periodicity, columnar=True)
+    assert list(columnar_habits.habits) == list(habits.habits), \
+        "Habits fetched with columnar histories are different to habits fetched with dictionaries."
+    for habit_id, habit_model in habits.habits.items():
+        columnar_histories = columnar_habits.habits[habit_id].habit_history
+        assert [str(history) for history in columnar_histories.histories.values()] == \
+               [str(history) for history in habit_model.habit_history.histories.values()], \
+            "Columnar histories are different to histories fetched as dictionary."
+        assert columnar_histories.transform_to_list() == habit_model.habit_history.transform_to_list(), \
+            "Checked-off values of columnar histories are different to histories fetched as dictionary."
+    assert Analytics.calc_longest_run_streak(columnar_habits) == Analytics.calc_longest_run_streak(habits), \
+        "Longest run streak of columnar histories is different to histories fetched as dictionary."
+
+
+def test_get_habit_by_id_columnar(data_access_drop_init):
+    """
+    Asserts that a habit and its histories fetched as columnar histories match the histories fetched by habit ID.
+    """
+    habit_model = data_access_drop_init.get_habit_by_id(1, columnar=True)
+    columnar_histories = data_access_drop_init.get_histories_by_habit_id(1, columnar=True)
+    assert list(habit_model.habit_history.histories) == list(columnar_histories.histories), \
+        "Columnar histories of habit are different to columnar histories fetched by habit ID."
+    assert columnar_histories.periodicity == habit_model.habit_periodicity_granularity, \
+        "Periodicity of columnar histories is different to periodicity of habit."
+
+
+@pytest.mark.parametrize('batch_size', [1, 3, 1000])
+def test_iter_histories(data_access_drop_init, batch_size):
+    """
+    Asserts that iterating over the histories of a habit in batches yields the same histories as fetching them at once,
+    while other queries can be issued in between.
+    """
+    for habit_id in range(1, 8):
+        expected_histories = data_access_drop_init.get_histories_by_habit_id(habit_id)
+        actual_histories = list()
+        for history_model in data_access_drop_init.iter_histories(habit_id, batch_size=batch_size):
+            data_access_drop_init.get_habit_by_id(habit_id)
+            actual_histories.append(str(history_model))
+        assert actual_histories == [str(history) for history in expected_histories.histories.values()], \
+            "Iterated histories are different to fetched histories."
+        assert Analytics.stream_longest_run_streak(data_access_drop_init.iter_histories(habit_id)) == \
+               Analytics.length_longest_run_streak(expected_histories.transform_to_list()), \
+            "Longest run streak of iterated histories is not as expected."
+
+
+def test_iter_histories_between(data_access_drop_init):
+    """
+    Asserts that iterating over the histories of a habit within a range of check-off time yields only those histories.
+    """
+    habit_id = 1
+    columnar_histories = data_access_drop_init.get_histories_by_habit_id(habit_id, columnar=True)
+    epochs = columnar_histories.checkoff_epochs.tolist()
+    since = datetime.strptime(Period.string_from_epoch(epochs[1]), Period.DATETIME_FORMAT)
+    until = datetime.strptime(Period.string_from_epoch(epochs[-1]), Period.DATETIME_FORMAT)
+    expected_history_ids = columnar_histories.between(since, until).history_ids.tolist()
+    actual_history_ids = [
+        history_model.history_id for history_model in data_access_drop_init.iter_histories(habit_id, since, until)
+    ]
+    assert actual_history_ids == expected_history_ids, \
+        "Iterated histories within range of time are not as expected."
+    assert len(actual_history_ids) == len(epochs) - 2, \
+        "Number of iterated histories within range of time is not as expected."
+
+
+def test_data_access_context_manager(data_access_drop_init):
+    """
+    Asserts that a data access object used as context manager is closed on exit and can be closed again.
+    """
+    with DataAccess("habit_tracker_test") as data_access:
+        connection = data_access.cursor.connection
+        habits = data_access.get_all_habits()
+    assert len(habits.habits) > 0, \
+        "No habits fetched within context."
+    assert data_access.cursor is None, \
+        "Cursor is not released on exiting the context."
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute(queries.SELECT_ANY_HABIT)
+    data_access.close()
+
+
+def test_data_access_unknown_profile_closes():
+    """
+    Asserts that a data access object failing on construction can still be closed.
+    """
+    with pytest.raises(ValueError):
+        DataAccess("habit_tracker_test", profile="unknown")
+
+
+def test_data_access_pooled(data_access_drop_init):
+    """
+    Asserts that pooled data access objects share the connection of their thread, do not close it and skip the schema
+    check once the schema is migrated.
+    """
+    first_data_access = DataAccess("habit_tracker_test", pooled=True)
+    connection = first_data_access.cursor.connection
+    statements = list()
+    connection.set_trace_callback(statements.append)
+    with DataAccess("habit_tracker_test", pooled=True) as second_data_access:
+        assert second_data_access.cursor.connection is connection, \
+            "Pooled data access objects of the same thread do not share the connection."
+    connection.set_trace_callback(None)
+    assert statements == [], \
+        "Schema is checked again although it is migrated already."
+    first_data_access.close()
+    assert connection.execute(queries.SELECT_ANY_HABIT).fetchone() is not None, \
+        "Pooled connection is closed by closing a data access object."
+
+    thread_connections = list()
+    thread = threading.Thread(
+        target=lambda: thread_connections.append(DataAccess("habit_tracker_test", pooled=True).cursor.connection)
+    )
+    thread.start()
+    thread.join()
+    assert thread_connections[0] is not connection, \
+        "Pooled data access objects of different threads share a connection."
+    ConnectionPool.close_all()
+
+
+def test_data_access_schema_migrated_after_drop(data_access_drop_init):
+    """
+    Asserts that dropping the tables invalidates the cached schema check, hence the next data access object migrates
+    the schema again.
+    """
+    data_access_drop_init.drop_tables()
+    with DataAccess("habit_tracker_test") as data_access:
+        actual_schema_version = data_access.schema_version
+    assert actual_schema_version == LATEST_VERSION, \
+        "Schema is not migrated after dropping the tables."
+
+
+def test_thread_safe_concurrent_complete_habit(data_access_drop_init):
+    """
+    Asserts that concurrent check-offs and reads from a thread pool sharing a thread-safe data access object neither
+    lose nor duplicate check-offs. Two workers race to check off each habit day by day.
+    """
+    number_habits = 4
+    number_days = 15
+    start = datetime(2022, 1, 1)
+    data_access = DataAccess("habit_tracker_test", thread_safe=True)
+    habit_ids = [
+        data_access.create_new_habit("test_name", "test_description", "daily", start.strftime("%Y-%m-%d"), "2022-12-31")
+        for _ in range(number_habits)
+    ]
+
+    def check_off(habit_id: int) -> int:
+        number_checkoffs = 0
+        for day in range(1, number_days + 1):
+            try:
+                checkoff_datetime = start + timedelta(days=day, hours=12)
+                data_access.complete_habit(habit_id, checkoff_datetime.strftime("%Y-%m-%d %H:%M:%S"))
+                number_checkoffs += 1
+            except ValueError:
+                pass
+            data_access.get_all_habits()
+        return number_checkoffs
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {habit_id: [executor.submit(check_off, habit_id) for _ in range(2)] for habit_id in habit_ids}
+        number_checkoffs = {habit_id: sum(future.result() for future in futures[habit_id]) for habit_id in habit_ids}
+    data_access.close()
+    ConnectionPool.close_all()
+
+    for habit_id in habit_ids:
+        histories = data_access_drop_init.get_histories_by_habit_id(habit_id, columnar=True)
+        periods = histories.checkoff_periods.tolist()
+        assert periods == list(range(periods[0], periods[0] + number_days + 1)), \
+            "Histories of concurrently checked-off habit contain duplicated or missing periods."
+        assert sum(histories.checked_off) == number_checkoffs[habit_id], \
+            "Number of stored check-offs is different to number of successful check-offs."
+        assert histories.checked_off[-1] == 1, \
+            "Last day of concurrently checked-off habit is not checked-off."
+    assert data_access_drop_init.check_habit_summaries() == [], \
+        "Summaries of concurrently checked-off habits are inconsistent."
+
+
+def records_of(data_access: DataAccess, file_format: str) -> str:
+    """
+    Write all habits and histories of a database as record file.
+    """
+    records = [
+        dict(zip(("record_type",) + Records.HABIT_FIELDS, (Records.HABIT,) + row))
+        for row in data_access.cursor.execute("SELECT * FROM habits ORDER BY habit_id;").fetchall()
+    ]
+    records += [
+        dict(zip(("record_type",) + Records.HISTORY_FIELDS, (Records.HISTORY,) + row[:4]))
+        for row in data_access.cursor.execute("SELECT * FROM histories ORDER BY history_id;").fetchall()
+    ]
+    stream = io.StringIO()
+    if file_format == "csv":
+        writer = csv.DictWriter(stream, Records.FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+    else:
+        stream.writelines(json.dumps(record) + "\n" for record in records)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("file_format", ["csv", "jsonl"])
+def test_bulk_import(data_access_drop_init, file_format):
+    """
+    Asserts that habits and histories are imported with their IDs, the indexes are built again and the habit summaries
+    are consistent with the imported histories.
+    """
+    expected_habits = data_access_drop_init.cursor.execute("SELECT * FROM habits ORDER BY habit_id;").fetchall()
+    expected_histories = data_access_drop_init.cursor.execute("SELECT * FROM histories ORDER BY history_id;").fetchall()
+    expected_longest_streak = data_access_drop_init.get_longest_run_streak()
+    stream = io.StringIO(records_of(data_access_drop_init, file_format))
+    data_access_drop_init.drop_tables()
+    data_access_drop_init.create_tables()
+
+    actual_numbers = data_access_drop_init.bulk_import(stream, file_format, batch_size=10)
+
+    assert actual_numbers == (len(expected_habits), len(expected_histories)), \
+        "Numbers of imported habits and histories are not as expected."
+    assert data_access_drop_init.cursor.execute("SELECT * FROM habits ORDER BY habit_id;").fetchall() \
+           == expected_habits, \
+        "Imported habits are not as expected."
+    assert data_access_drop_init.cursor.execute("SELECT * FROM histories ORDER BY history_id;").fetchall() \
+           == expected_histories, \
+        "Imported histories are not as expected."
+    actual_indexes = {
+        row[0] for row in data_access_drop_init.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index';")
+    }
+    assert {"histories_habit_id_checkoff_epoch_checked_off_index", "habits_habit_periodicity_granularity_index"} \
+           <= actual_indexes, \
+        "Indexes are not built again after importing."
+    assert data_access_drop_init.check_habit_summaries() == [], \
+        "Habit summaries are inconsistent with the imported histories."
+    assert data_access_drop_init.get_longest_run_streak() == expected_longest_streak, \
+        "Longest run streak of the imported histories is not as expected."
+
+
+@pytest.mark.parametrize(
+    'records, expected_exception', [
+        ("record_type,habit_id,checkoff_datetime,checked_off\nhistory,4711,2022-01-01 12:00:00,1\n", NameError),
+        ("record_type,habit_id,checkoff_datetime,checked_off\nhistory,1,yesterday,1\n", ValueError),
+        ("record_type,habit_id\nhabbit,1\n", ValueError)
+    ]
+)
+def test_bulk_import_rolled_back(data_access_drop_init, records, expected_exception):
+    """
+    Asserts that nothing is imported if a record fails and the indexes dropped for importing are kept.
+    """
+    expected_number_histories = len(data_access_drop_init.cursor.execute("SELECT * FROM histories;").fetchall())
+    with pytest.raises(expected_exception):
+        data_access_drop_init.bulk_import(io.StringIO(records))
+    actual_number_histories = len(data_access_drop_init.cursor.execute("SELECT * FROM histories;").fetchall())
+    assert actual_number_histories == expected_number_histories, \
+        "Histories are imported although a record failed."
+    actual_indexes = {
+        row[0] for row in data_access_drop_init.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index';")
+    }
+    assert "histories_habit_id_checkoff_epoch_checked_off_index" in actual_indexes, \
+        "Index is dropped although the import failed."
+
+
+@pytest.mark.parametrize("file_format", Records.FORMATS)
+def test_export_round_trip(data_access_drop_init, file_format):
+    """
+    Asserts that exported habits and histories are imported again unchanged.
+    """
+    expected_habits = data_access_drop_init.cursor.execute("SELECT * FROM habits ORDER BY habit_id;").fetchall()
+    expected_histories = data_access_drop_init.cursor.execute("SELECT * FROM histories ORDER BY history_id;").fetchall()
+    stream = io.BytesIO() if file_format in Records.BINARY_FORMATS else io.StringIO()
+
+    actual_numbers = data_access_drop_init.export(stream, file_format, batch_size=5)
+
+    assert actual_numbers == (len(expected_habits), len(expected_histories)), \
+        "Numbers of exported habits and histories are not as expected."
+    stream.seek(0)
+    data_access_drop_init.drop_tables()
+    data_access_drop_init.create_tables()
+    data_access_drop_init.bulk_import(stream, file_format)
+    assert data_access_drop_init.cursor.execute("SELECT * FROM habits ORDER BY habit_id;").fetchall() \
+           == expected_habits, \
+        "Exported habits are not imported unchanged."
+    assert data_access_drop_init.cursor.execute("SELECT * FROM histories ORDER BY history_id;").fetchall() \
+           == expected_histories, \
+        "Exported histories are not imported unchanged."
+
+
+@pytest.mark.parametrize(
+    'days_since, days_until, periodicity', [
+        (None, None, "weekly"),
+        (10, None, None),
+        (1, 3, "daily")
+    ]
+)
+def test_export_filtered(data_access_drop_init, now, days_since, days_until, periodicity):
+    """
+    Asserts that only habits of the given periodicity and their histories within the given range of check-off time are
+    exported.
+    """
+    since = None if days_since is None else now + timedelta(days=days_since)
+    until = None if days_until is None else now + timedelta(days=days_until)
+    expected_habit_ids = {
+        habit_id for habit_id, habit_model in data_access_drop_init.get_all_habits().habits.items()
+        if periodicity is None or habit_model.habit_periodicity_granularity == periodicity
+    }
+    expected_history_ids = {
+        history.history_id
+        for habit_id in expected_habit_ids
+        for history in data_access_drop_init.iter_histories(int(habit_id), since, until)
+    }
+    stream = io.StringIO()
+    data_access_drop_init.export(stream, "jsonl", since, until, periodicity)
+    stream.seek(0)
+    records = list(Records.read(stream, "jsonl"))
+    actual_habit_ids = {str(record["habit_id"]) for record in records if record["record_type"] == Records.HABIT}
+    actual_history_ids = {record["history_id"] for record in records if record["record_type"] == Records.HISTORY}
+    assert actual_habit_ids == expected_habit_ids, \
+        "Exported habits are not as expected."
+    assert len(expected_history_ids) > 0 and actual_history_ids == expected_history_ids, \
+        "Exported histories are not as expected."
+
+
+@pytest.mark.parametrize("periodicity", [None, "daily", "weekly"])
+def test_get_habits_page(data_access_drop_init, periodicity):
+    """
+    Asserts that paging through habits by the ID of the last habit of the previous page yields every habit with its
+    histories exactly once.
+    """
+    if periodicity is None:
+        expected_habits = data_access_drop_init.get_all_habits()
+    else:
+        expected_habits = data_access_drop_init.get_all_habits_by_periodicity(periodicity)
+    actual_pages = list()
+    after_habit_id = None
+    while True:
+        page = data_access_drop_init.get_habits_page(after_habit_id, 2, periodicity)
+        if len(page.habits) == 0:
+            break
+        actual_pages.append(list(page.habits))
+        after_habit_id = page.habits[list(page.habits)[-1]].habit_id
+        for habit_id, habit_model in page.habits.items():
+            assert str(habit_model) == str(expected_habits.habits[habit_id]), \
+                "Habit of page is not as expected."
+    assert [habit_id for page in actual_pages for habit_id in page] == list(expected_habits.habits), \
+        "Pages do not contain every habit exactly once in order."
+    assert all(len(page) <= 2 for page in actual_pages), \
+        "Pages contain more habits than the limit."
+
+
+def test_get_habits_page_without_histories(data_access_drop_init):
+    """
+    Asserts that a page of habits can be read without histories and without a limit.
+    """
+    statements = list()
+    connection = data_access_drop_init.cursor.connection
+    connection.set_trace_callback(statements.append)
+    habits = data_access_drop_init.get_habits_page(after_habit_id=3, with_histories=False)
+    connection.set_trace_callback(None)
+    assert list(habits.habits) == ["4", "5", "6", "7"], \
+        "Habits of page are not as expected."
+    assert all(len(habit_model.habit_history.histories) == 0 for habit_model in habits.habits.values()), \
+        "Habits of page have histories."
+    assert not any("histories" in statement for statement in statements), \
+        "Histories are read although not requested."
+
+
+@pytest.mark.parametrize("periodicity", [None, "daily", "weekly"])
+def test_get_run_streaks(data_access_drop_init, periodicity):
+    """
+    Asserts that the run streaks computed within SQLite match the habit summaries, one row per habit.
+    """
+    if periodicity is None:
+        habits = data_access_drop_init.get_all_habits()
+    else:
+        habits = data_access_drop_init.get_all_habits_by_periodicity(periodicity)
+    actual_streaks = data_access_drop_init.get_run_streaks(periodicity=periodicity)
+    expected_streaks = dict()
+    for habit_model in habits.habits.values():
+        habit_summary_model = data_access_drop_init.get_habit_summary(habit_model.habit_id)
+        expected_streaks[habit_model.habit_id] = (habit_summary_model.longest_streak,
+                                                  habit_summary_model.current_streak)
+    assert actual_streaks == expected_streaks, \
+        "Run streaks computed within SQLite are different to the habit summaries."
+
+
+def test_get_run_streaks_of_habit(data_access_drop_init):
+    """
+    Asserts that the run streaks of a habit match the streaks calculated from its history, and a habit not existing
+    raises a NameError.
+    """
+    checked_off = [1, 1, 0, 1, 1, 1, 0, 0, 1, 1]
+    habit_id = data_access_drop_init.create_new_habit("test_name", "test_description", "daily", "2022-01-01",
+                                                      "2099-12-31")
+    data_access_drop_init.bulk_import(io.StringIO("".join(
+        json.dumps({"record_type": Records.HISTORY, "habit_id": habit_id,
+                    "checkoff_datetime": f"2022-01-{day + 1:02d} 12:00:00", "checked_off": value}) + "\n"
+        for day, value in enumerate(checked_off)
+    )), "jsonl")
+    expected_streaks = {habit_id: (Analytics.length_longest_run_streak(checked_off),
+                                   Analytics.length_current_run_streak(checked_off))}
+    assert data_access_drop_init.get_run_streaks(habit_id=habit_id) == expected_streaks, \
+        "Run streaks of habit computed within SQLite are not as expected."
+    with pytest.raises(NameError):
+        data_access_drop_init.get_run_streaks(habit_id=4711)
+
+
+@pytest.mark.parametrize("since, until, start, end", [
+    (datetime(2022, 1, 3), None, 2, 10),
+    (None, datetime(2022, 1, 7), 0, 6),
+    (datetime(2022, 1, 4), datetime(2022, 1, 9), 3, 8),
+    (datetime(2023, 1, 1), None, 10, 10)
+])
+def test_get_run_streaks_between(data_access_drop_init, since, until, start, end):
+    """
+    Asserts that run streaks and histories within a window of check-off time are computed from the histories within
+    the window only.
+    """
+    checked_off = [1, 1, 0, 1, 1, 1, 0, 0, 1, 1]
+    habit_id = data_access_drop_init.create_new_habit("test_name", "test_description", "daily", "2022-01-01",
+                                                      "2099-12-31")
+    data_access_drop_init.bulk_import(io.StringIO("".join(
+        json.dumps({"record_type": Records.HISTORY, "habit_id": habit_id,
+                    "checkoff_datetime": f"2022-01-{day + 1:02d} 12:00:00", "checked_off": value}) + "\n"
+        for day, value in enumerate(checked_off)
+    )), "jsonl")
+    window = checked_off[start:end]
+    expected_streaks = (Analytics.length_longest_run_streak(window), Analytics.length_current_run_streak(window))
+    assert data_access_drop_init.get_run_streaks(habit_id=habit_id, since=since, until=until)[habit_id] == \
+           expected_streaks, \
+        "Run streaks of habit within the window are not as expected."
+    assert data_access_drop_init.get_run_streaks(since=since, until=until)[habit_id] == expected_streaks, \
+        "Run streaks of all habits within the window are not as expected."
+    assert data_access_drop_init.get_run_streaks(periodicity="daily", since=since, until=until)[habit_id] == \
+           expected_streaks, \
+        "Run streaks of daily habits within the window are not as expected."
+    columnar_history = data_access_drop_init.get_habit_by_id(habit_id, columnar=True)
+    expected_history = columnar_history.habit_history.between(since, until).transform_to_list()
+    assert expected_history == window, \
+        "Columnar histories within the window are not as expected."
+    for habits in (data_access_drop_init.get_all_habits(since=since, until=until),
+                   data_access_drop_init.get_all_habits(columnar=True, since=since, until=until),
+                   data_access_drop_init.get_all_habits_by_periodicity("daily", since=since, until=until)):
+        assert habits.habits[f"{habit_id}"].habit_history.transform_to_list() == window, \
+            "Histories of habits read within the window are not as expected."
+    assert data_access_drop_init.get_habit_by_id(habit_id, since=since, until=until).habit_history \
+               .transform_to_list() == window, \
+        "History of habit read within the window is not as expected."
+
+
+@pytest.mark.parametrize("query, parameters", [
+    (queries.SELECT_ALL_HISTORIES_BETWEEN, {"since": 0, "until": 1}),
+    (queries.SELECT_HISTORIES_BY_PERIODICITY_BETWEEN, {"periodicity": "daily", "since": 0, "until": 1}),
+    (queries.SELECT_RUN_STREAKS_BETWEEN, {"since": 0, "until": 1}),
+    (queries.SELECT_RUN_STREAKS_BY_PERIODICITY_BETWEEN, {"periodicity": "daily", "since": 0, "until": 1}),
+    (queries.SELECT_RUN_STREAKS_OF_HABIT_BETWEEN, {"habit_id": 1, "since": 0, "until": 1})
+])
+def test_query_plan_check_window(data_access_drop_init, query, parameters):
+    """
+    Asserts that windows of check-off time are searched in the index per habit instead of scanning all histories.
+    """
+    query_plan = data_access_drop_init.cursor.execute(f"EXPLAIN QUERY PLAN {query}", parameters).fetchall()
+    details = " ".join(row[-1] for row in query_plan)
+    assert "histories_habit_id_checkoff_epoch_checked_off_index (habit_id=? AND checkoff_epoch>? AND " \
+           "checkoff_epoch<?)" in details, \
+        f"Query plan does not search the window in the index: {details}"
@@ -1,6 +1,8 @@
+from datetime import datetime, timedelta
 
 import pytest
 
+from habit_tracker.analytics.analytics import Analytics
 from habit_tracker.habit_tracker.habit_tracker import HabitTracker
 from tests.data_fixtures import all_data, now
 from tests.db_fixtures import data_access_drop_init
@@ -53,3 +55,126 @@ def test_calc_longest_run_streak_of_habit(data_access_drop_init):
     actual_longest_streak = habit_tracker.calc_longest_run_streak_of_habit(habit_id)
     assert actual_longest_streak == expected_longest_streak, \
         "Longest run streak is not calculated correctly."
+
+
+def test_complete_habits(data_access_drop_init):
+    """
+    Asserts that many habits are checked-off at once with a result per check-off, check-offs without datetime taking
+    place now.
+    """
+    habit_tracker = HabitTracker()
+    habit_tracker.data_access = data_access_drop_init
+    habit_id = habit_tracker.create_new_habit("test_name", "test_description", "daily", "2022-01-01", "2099-12-31")
+    results = habit_tracker.complete_habits([
+        (habit_id, "2022-01-02 12:00:00"),
+        (habit_id, "2022-01-02 18:00:00"),
+        (4711, None),
+        (habit_id, None)
+    ])
+    assert [type(result) for result in results] == [int, ValueError, NameError, int], \
+        "Results of check-offs are not as expected."
+    latest_checkoff = max(history.checkoff_datetime
+                          for history in data_access_drop_init.get_histories_by_habit_id(habit_id).histories.values())
+    assert latest_checkoff[:10] == datetime.now().strftime("%Y-%m-%d"), \
+        "Check-off without datetime has not taken place now."
+
+
+@pytest.mark.parametrize("streak_backend", HabitTracker.STREAK_BACKENDS)
+def test_calc_longest_run_streak_backends(data_access_drop_init, streak_backend):
+    """
+    Asserts that all streak backends determine the same longest run streaks.
+    """
+    habit_tracker = HabitTracker()
+    habit_tracker.data_access = data_access_drop_init
+    habit_tracker.streak_backend = streak_backend
+    assert habit_tracker.calc_longest_run_streak() == 4, \
+        "Longest run streak is not calculated correctly."
+    assert habit_tracker.calc_longest_run_streak_by_periodicity("daily") == 4, \
+        "Longest run streak of daily habits is not calculated correctly."
+    assert habit_tracker.calc_longest_run_streak_by_periodicity("weekly") == 2, \
+        "Longest run streak of weekly habits is not calculated correctly."
+    assert habit_tracker.calc_longest_run_streak_by_periodicity("monthly") == 0, \
+        "Longest run streak without habits of the periodicity is not zero."
+    assert habit_tracker.calc_longest_run_streak_of_habit(1) == 2, \
+        "Longest run streak of habit is not calculated correctly."
+
+
+def test_calc_statistics(data_access_drop_init):
+    """
+    Asserts that the statistics of habits agree with the habit summaries and the histories of the habits.
+    """
+    habit_tracker = HabitTracker()
+    habit_tracker.data_access = data_access_drop_init
+    statistics = habit_tracker.calc_statistics()
+    habits = data_access_drop_init.get_all_habits()
+    assert [str(habit_statistics_model.habit_id) for habit_statistics_model in statistics] == list(habits.habits), \
+        "Statistics are not determined for all habits."
+    for habit_statistics_model in statistics:
+        history = habits.habits[str(habit_statistics_model.habit_id)].habit_history.transform_to_list()
+        assert (habit_statistics_model.total_completions, habit_statistics_model.total_breaks) == \
+               (history.count(1), len(history) - history.count(1)), \
+            "Completions and breaks of statistics are not as expected."
+        assert habit_statistics_model.longest_streak == \
+               habit_tracker.calc_longest_run_streak_of_habit(habit_statistics_model.habit_id), \
+            "Longest run streak of statistics is different to the longest run streak of the habit summary."
+    assert [habit_statistics_model.habit_id for habit_statistics_model in
+            habit_tracker.calc_statistics_by_periodicity("weekly")] == [3, 4, 5], \
+        "Statistics of weekly habits are not determined for the weekly habits."
+    assert habit_tracker.calc_statistics_of_habit(1).to_row() == statistics[0].to_row(), \
+        "Statistics of habit are different to the statistics of the habit among all habits."
+    with pytest.raises(NameError):
+        habit_tracker.calc_statistics_of_habit(99)
+
+
+@pytest.mark.parametrize("streak_backend", HabitTracker.STREAK_BACKENDS)
+def test_calc_longest_run_streak_between(data_access_drop_init, now, streak_backend):
+    """
+    Asserts that all streak backends determine the same longest run streaks within a window of check-off time.
+    """
+    habit_tracker = HabitTracker()
+    habit_tracker.data_access = data_access_drop_init
+    habit_tracker.streak_backend = streak_backend
+    since = now + timedelta(days=2)
+    habits = data_access_drop_init.get_all_habits(columnar=True)
+    expected_streaks = {habit_id: Analytics.length_longest_run_streak(habit_model.habit_history.between(since)
+                                                                      .transform_to_list())
+                        for habit_id, habit_model in habits.habits.items()}
+    assert habit_tracker.calc_longest_run_streak(since=since) == max(expected_streaks.values()), \
+        "Longest run streak within the window is not calculated correctly."
+    assert habit_tracker.calc_longest_run_streak_by_periodicity("weekly", since=since) == \
+           max(expected_streaks[habit_id] for habit_id in ("3", "4", "5")), \
+        "Longest run streak of weekly habits within the window is not calculated correctly."
+    assert habit_tracker.calc_longest_run_streak_of_habit(1, since=since) == expected_streaks["1"], \
+        "Longest run streak of habit within the window is not calculated correctly."
+    assert habit_tracker.calc_longest_run_streak(until=datetime(2000, 1, 1)) == 0, \
+        "Longest run streak of a window without check-offs is not zero."
+
+
+def test_calc_rolling_longest_run_streaks(data_access_drop_init):
+    """
+    Asserts that the longest run streaks of rolling windows are determined for each history entry of a habit.
+    """
+    habit_tracker = HabitTracker()
+    habit_tracker.data_access = data_access_drop_init
+    histories = data_access_drop_init.get_habit_by_id(7).habit_history.histories.values()
+    rolling_streaks = habit_tracker.calc_rolling_longest_run_streaks(7, 2)
+    assert [checkoff_datetime for checkoff_datetime, _ in rolling_streaks] == \
+           [history_model.checkoff_datetime for history_model in histories], \
+        "Rolling windows do not end at the history entries of the habit."
+    assert [longest_streak for _, longest_streak in rolling_streaks] == \
+           Analytics.rolling_longest_run_streaks([history_model.checked_off for history_model in histories], 2), \
+        "Longest run streaks of rolling windows are not calculated correctly."
+    with pytest.raises(NameError):
+        habit_tracker.calc_rolling_longest_run_streaks(99, 2)
+
+
+def test_streak_backend_check_unknown(monkeypatch):
+    """
+    Asserts that the streak backend is taken from the environment and an unknown streak backend raises a ValueError.
+    """
+    monkeypatch.setenv(HabitTracker.STREAK_BACKEND_ENVIRONMENT_VARIABLE, "sql")
+    habit_tracker = HabitTracker()
+    assert habit_tracker.streak_backend == "sql", \
+        "Streak backend is not taken from the environment."
+    with pytest.raises(ValueError):
+        habit_tracker.streak_backend = "unknown"
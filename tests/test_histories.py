@@ -1,6 +1,12 @@
+from datetime import datetime
 
+import pytest
+
+from habit_tracker.data_access.model.columnar_histories import ColumnarHistories
+from habit_tracker.data_access.model.history_model import HistoryModel
 from habit_tracker.data_access.model.histories import Histories
-from tests.data_fixtures import histories_work, now
+from habit_tracker.data_access.period import Period
+from tests.data_fixtures import all_data, habit_model_work, histories_work, now
 
 
 def test_transform_to_list(histories_work):
@@ -11,3 +17,100 @@ def test_transform_to_list(histories_work):
     actual_history_list = histories_work.transform_to_list()
     assert actual_history_list == expected_history_list, \
         "Transformed histories is not as expected."
+
+
+def test_history_model_from_row():
+    """
+    Asserts that a history model created from a database row keeps the property API and has no instance dictionary.
+    """
+    history_model = HistoryModel.from_row((7, 3, "2022-01-01 12:00:00", 1))
+    assert (history_model.history_id, history_model.habit_id, history_model.checkoff_datetime,
+            history_model.checked_off) == (7, 3, "2022-01-01 12:00:00", 1), \
+        "History model created from a row is not as expected."
+    history_model.checked_off = 0
+    assert history_model.checked_off == 0, \
+        "Checked-off value of history model is not as expected."
+    assert history_model.to_row() == (7, 3, "2022-01-01 12:00:00", 0), \
+        "Row of history model is not as expected."
+    assert not hasattr(history_model, "__dict__"), \
+        "History model has an instance dictionary."
+
+
+def test_columnar_histories_append_and_between():
+    """
+    Asserts that columnar histories stay sorted by time when appending and can be sliced by a range of time.
+    """
+    histories = ColumnarHistories(1)
+    for history_id, day, checked_off in [(1, 1, 1), (2, 2, 1), (4, 4, 1), (3, 3, 0)]:
+        checkoff_epoch = Period.epoch_from_datetime(datetime(2022, 1, day, 12))
+        histories.append(history_id, checkoff_epoch, Period.index(checkoff_epoch, "daily"), checked_off)
+    assert list(histories.histories) == ["1", "2", "3", "4"], \
+        "Columnar histories are not sorted by time."
+    assert histories.transform_to_list() == [1, 1, 0, 1], \
+        "Checked-off values of columnar histories are not as expected."
+    between = histories.between(datetime(2022, 1, 2), datetime(2022, 1, 4))
+    assert between.history_ids.tolist() == [2, 3], \
+        "Columnar histories within range of time are not as expected."
+    assert histories.histories["3"].checkoff_datetime == "2022-01-03 12:00:00", \
+        "Datetime of history model of columnar histories is not as expected."
+
+
+def test_columnar_histories_from_histories(histories_work):
+    """
+    Asserts that columnar histories can be set from a dictionary of history models and expose the checked-off values
+    without copying.
+    """
+    histories = ColumnarHistories(1)
+    histories.histories = histories_work.histories
+    assert histories.transform_to_list() == histories_work.transform_to_list(), \
+        "Checked-off values of columnar histories are not as expected."
+    checked_off = histories.checked_off
+    assert checked_off.obj is histories.checked_off.obj and checked_off.format == "b", \
+        "Checked-off values of columnar histories are not a view on the same buffer."
+
+
+@pytest.mark.parametrize(
+    'last, expected_history_ids', [
+        (None, [1, 2, 3, 4]),
+        (2, [3, 4]),
+        (0, []),
+        (10, [1, 2, 3, 4])
+    ]
+)
+def test_histories_lines(histories_work, last, expected_history_ids):
+    """
+    Asserts that histories are output line by line, optionally only the latest entries, in the same format by columnar
+    histories.
+    """
+    columnar_histories = ColumnarHistories(1)
+    columnar_histories.histories = histories_work.histories
+    expected_lines = [str(histories_work.histories[f"{history_id}"]) for history_id in expected_history_ids]
+    assert list(histories_work.lines(last)) == expected_lines, \
+        "Lines of histories are not as expected."
+    assert list(columnar_histories.lines(last)) == expected_lines, \
+        "Lines of columnar histories are not as expected."
+
+
+def test_habit_model_lines(habit_model_work):
+    """
+    Asserts that a habit model is output with truncated or summarized histories and its string representation consists
+    of all its lines.
+    """
+    all_lines = list(habit_model_work.lines())
+    assert str(habit_model_work) == "".join(line + "\n" for line in all_lines), \
+        "String representation of habit model is not made of its lines."
+    assert list(habit_model_work.lines(1)) == [all_lines[0], "... 3 earlier entries not shown", all_lines[-1]], \
+        "Lines of habit model with truncated histories are not as expected."
+    assert list(habit_model_work.lines(history_summary=True)) == [all_lines[0] + " 4 entries, 3 checked-off"], \
+        "Lines of habit model with summarized histories are not as expected."
+
+
+def test_habits_lines(all_data):
+    """
+    Asserts that habits are output line by line with an empty line after each habit.
+    """
+    actual_lines = list(all_data.lines(history_summary=True))
+    assert len(actual_lines) == 2 * len(all_data.habits) and actual_lines[1::2] == [""] * len(all_data.habits), \
+        "Lines of habits are not as expected."
+    assert str(all_data) == "".join(line + "\n" for line in all_data.lines()), \
+        "String representation of habits is not made of their lines."